@@ -1,4 +1,9 @@
+import logging
 from abc import ABC, abstractmethod
+from typing import List
+from app.models.base import ScriptSegment
+
+logger = logging.getLogger(__name__)
 
 class BaseAudioProvider(ABC):
     @abstractmethod
@@ -7,3 +12,36 @@ class BaseAudioProvider(ABC):
         Converts text to audio bytes using the specified voice_id.
         """
         pass
+
+    async def synthesize_segments(
+        self, segments: List[ScriptSegment], voice_id: str, output_dir: str, min_batches: int = 1
+    ) -> List[str]:
+        """
+        Writes one MP3 per segment into output_dir and sets each segment.audio_path.
+        Returns the paths in segment order. Providers that can batch requests override this;
+        min_batches asks them to spread the script over at least that many requests, so a
+        cancelled run still leaves the earlier segments on disk.
+        """
+        paths = []
+        for i, segment in enumerate(segments):
+            logger.info(f"Synthesizing segment {i+1}/{len(segments)}...")
+            path = self.segment_path(output_dir, i, segment)
+            await self.write_segment(segment, voice_id, path)
+            paths.append(path)
+        return paths
+
+    @staticmethod
+    def segment_path(output_dir: str, index: int, segment: ScriptSegment) -> str:
+        return f"{output_dir}/seg_{index}_{segment.segment_type}.mp3"
+
+    async def write_segment(self, segment: ScriptSegment, voice_id: str, path: str):
+        audio_bytes = await self.generate_audio(segment.text, voice_id)
+        with open(path, "wb") as f:
+            f.write(audio_bytes)
+        segment.audio_path = path
+
+    async def aclose(self):
+        """
+        Releases any pooled connections held by the provider.
+        """
+        pass
@@ -1,50 +1,221 @@
-import httpx
+import asyncio
+import base64
 import logging
+import os
+import tempfile
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from app.audio.base import BaseAudioProvider
 from app.core.config import settings
+from app.core.ratelimit import RetryableError, get_limiter, parse_retry_after
+from app.models.base import ScriptSegment
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
+MODEL_ID = "eleven_turbo_v2_5"
+# Joins segments inside one batched request; a paragraph break gives a natural pause
+BATCH_SEPARATOR = "\n\n"
+# A batch of several minutes of speech takes longer to render than a single segment
+BATCH_TIMEOUT_SEC = 120.0
+
+class AlignmentError(Exception):
+    """
+    The timestamps returned for a batch can't be mapped back onto its segments.
+    """
+
 class ElevenLabsClient(BaseAudioProvider):
     def __init__(self):
         self.api_key = settings.ELEVENLABS_API_KEY
-        self.base_url = "https://api.elevenlabs.io/v1"
-    
-    async def generate_audio(self, text: str, voice_id: str) -> bytes:
-        url = f"{self.base_url}/text-to-speech/{voice_id}"
-        
-        headers = {
+        self.base_url = settings.ELEVENLABS_BASE_URL.rstrip("/")
+        # 0 disables batching: one request per segment
+        self.batch_chars = settings.ELEVENLABS_BATCH_CHARS
+        self.limiter = get_limiter("elevenlabs")
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        # One pooled client per instance so segments reuse the same connections
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(timeout=30.0)
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _headers(self) -> dict:
+        return {
             "xi-api-key": self.api_key,
             "Content-Type": "application/json"
         }
-        
-        payload = {
+
+    def _payload(self, text: str) -> dict:
+        return {
             "text": text,
-            "model_id": "eleven_turbo_v2_5",
+            "model_id": MODEL_ID,
             "voice_settings": {
                 "stability": 0.5,
                 "similarity_boost": 0.75
             }
         }
 
-        async with httpx.AsyncClient() as client:
+    async def generate_audio(self, text: str, voice_id: str) -> bytes:
+        import httpx
+
+        url = f"{self.base_url}/text-to-speech/{voice_id}"
+
+        try:
+            response = await self.limiter.call(self._post, url, self._payload(text), self._headers())
+            return response.content
+        except httpx.RequestError as e:
+            logger.error(f"Network error communicating with ElevenLabs: {e}")
+            raise e
+        except Exception as e:
+            logger.error(f"Unexpected error in audio generation: {e}")
+            raise e
+
+    async def generate_audio_with_timestamps(self, text: str, voice_id: str) -> Tuple[bytes, dict]:
+        """
+        Audio plus per-character alignment: {"characters", "character_start_times_seconds",
+        "character_end_times_seconds"}, indexed like the input text.
+        """
+        import httpx
+
+        url = f"{self.base_url}/text-to-speech/{voice_id}/with-timestamps"
+
+        try:
+            response = await self.limiter.call(
+                self._post, url, self._payload(text), self._headers(), BATCH_TIMEOUT_SEC
+            )
+            data = response.json()
+            return base64.b64decode(data["audio_base64"]), data.get("alignment") or {}
+        except httpx.RequestError as e:
+            logger.error(f"Network error communicating with ElevenLabs: {e}")
+            raise e
+        except Exception as e:
+            logger.error(f"Unexpected error in audio generation: {e}")
+            raise e
+
+    async def synthesize_segments(
+        self, segments: List[ScriptSegment], voice_id: str, output_dir: str, min_batches: int = 1
+    ) -> List[str]:
+        """
+        Packs consecutive segments into requests of up to batch_chars characters, then cuts
+        each batch's audio back into per-segment files at the timestamped boundaries.
+        With min_batches > 1 the requests are made smaller still, so the script is spread
+        over at least that many of them.
+        """
+        if self.batch_chars <= 0:
+            return await super().synthesize_segments(segments, voice_id, output_dir)
+
+        paths = [self.segment_path(output_dir, i, segment) for i, segment in enumerate(segments)]
+        limit = self.batch_chars
+        if min_batches > 1:
+            total = len(BATCH_SEPARATOR.join(segment.text for segment in segments))
+            limit = min(limit, -(-total // min_batches))
+        batches = self._pack(segments, limit)
+        start = 0
+        for n, size in enumerate(batches):
+            batch, batch_paths = segments[start:start + size], paths[start:start + size]
+            start += size
+            logger.info(f"Synthesizing batch {n+1}/{len(batches)} ({size} segments)...")
+
+            if size == 1:
+                await self.write_segment(batch[0], voice_id, batch_paths[0])
+                continue
             try:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
-                
-                if response.status_code == 200:
-                    return response.content
-                
-                if response.status_code == 429:
-                    logger.error("ElevenLabs API rate limit exceeded.")
-                    raise Exception("Rate limit exceeded")
-                
-                logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
-                response.raise_for_status()
-                
-            except httpx.RequestError as e:
-                logger.error(f"Network error communicating with ElevenLabs: {e}")
-                raise e
-            except Exception as e:
-                logger.error(f"Unexpected error in audio generation: {e}")
-                raise e
-        return b""
+                await self._synthesize_batch(batch, voice_id, batch_paths)
+            except AlignmentError as e:
+                logger.warning(f"Batch alignment unusable ({e}); synthesizing its segments one by one.")
+                for segment, path in zip(batch, batch_paths):
+                    await self.write_segment(segment, voice_id, path)
+
+        logger.info(f"Synthesized {len(segments)} segments in {len(batches)} requests.")
+        return paths
+
+    def _pack(self, segments: List[ScriptSegment], limit: Optional[int] = None) -> List[int]:
+        """
+        Sizes of consecutive runs of segments that fit in one request of `limit` characters
+        (default batch_chars).
+        """
+        limit = limit or self.batch_chars
+        batches: List[int] = []
+        chars = 0
+        for segment in segments:
+            size = len(segment.text)
+            if batches and chars + len(BATCH_SEPARATOR) + size <= limit:
+                batches[-1] += 1
+                chars += len(BATCH_SEPARATOR) + size
+            else:
+                batches.append(1)
+                chars = size
+        return batches
+
+    @staticmethod
+    def _cut_points(texts: List[str], alignment: dict) -> List[float]:
+        """
+        Split times between consecutive segments: midway through the pause between the
+        last character of one segment and the first of the next.
+        """
+        starts = alignment.get("character_start_times_seconds") or []
+        ends = alignment.get("character_end_times_seconds") or []
+        expected = len(BATCH_SEPARATOR.join(texts))
+        if len(starts) != expected or len(ends) != expected:
+            raise AlignmentError(f"{len(starts)} timestamps for {expected} characters")
+
+        cuts = []
+        offset = 0
+        for text in texts[:-1]:
+            last_char = offset + len(text) - 1
+            next_first = offset + len(text) + len(BATCH_SEPARATOR)
+            cuts.append((ends[last_char] + starts[next_first]) / 2)
+            offset = next_first
+        if any(b <= a for a, b in zip([0.0] + cuts, cuts)):
+            raise AlignmentError("segment boundaries are not increasing")
+        return cuts
+
+    async def _synthesize_batch(self, batch: List[ScriptSegment], voice_id: str, paths: List[str]):
+        from app.audio.mixer import AudioMixer, SplitError
+
+        texts = [segment.text for segment in batch]
+        audio_bytes, alignment = await self.generate_audio_with_timestamps(BATCH_SEPARATOR.join(texts), voice_id)
+        cuts = self._cut_points(texts, alignment)
+
+        fd, batch_path = tempfile.mkstemp(prefix="tts_batch_", suffix=".mp3", dir=os.path.dirname(paths[0]) or None)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio_bytes)
+            await asyncio.to_thread(AudioMixer().split_audio, batch_path, cuts, paths)
+        except SplitError as e:
+            # The timings didn't match the audio after all; same per-segment fallback
+            raise AlignmentError(str(e)) from e
+        finally:
+            if os.path.exists(batch_path):
+                os.remove(batch_path)
+
+        for segment, path in zip(batch, paths):
+            segment.audio_path = path
+
+    async def _post(self, url: str, payload: dict, headers: dict, timeout: Optional[float] = None) -> "httpx.Response":
+        # Per-request timeout only when given; otherwise the client default applies
+        extra = {"timeout": timeout} if timeout else {}
+        response = await self._get_client().post(url, json=payload, headers=headers, **extra)
+
+        if response.status_code == 200:
+            return response
+
+        if response.status_code == 429 or response.status_code >= 500:
+            logger.warning(f"ElevenLabs API returned {response.status_code}: {response.text[:200]}")
+            raise RetryableError(
+                f"ElevenLabs API error {response.status_code}",
+                status=response.status_code,
+                retry_after=parse_retry_after(response.headers),
+                throttled=response.status_code == 429
+            )
+
+        logger.error(f"ElevenLabs API error: {response.status_code} - {response.text}")
+        response.raise_for_status()
+        return response
@@ -0,0 +1,141 @@
+import asyncio
+import io
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import wave
+from typing import List, Optional
+from app.audio.base import BaseAudioProvider
+from app.models.base import ScriptSegment
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("piper", "espeak-ng", "espeak", "tone")
+
+# The script writer's pacing assumption (150 words per minute)
+WORDS_PER_SECOND = 2.5
+SAMPLE_RATE = 44100
+
+
+def speech_seconds(text: str) -> float:
+    """
+    How long `text` takes to read aloud at the script writer's pace.
+    """
+    return max(0.5, len(text.split()) / WORDS_PER_SECOND)
+
+
+def tone_wav(text: str, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """
+    Placeholder speech: one enveloped tone burst per word at the script writer's pace,
+    with longer gaps at sentence ends, so durations and loudness behave like a voice track.
+    """
+    import numpy as np
+
+    word_sec = 1 / WORDS_PER_SECOND
+    words = re.findall(r"\S+", text) or ["."]
+    burst = int(word_sec * 0.7 * sample_rate)
+    t = np.arange(burst, dtype=np.float32) / sample_rate
+    envelope = np.sin(np.pi * np.arange(burst, dtype=np.float32) / burst) ** 2
+
+    chunks = []
+    for i, word in enumerate(words):
+        pitch = 170.0 + 12.0 * (i % 7)
+        chunks.append(0.3 * envelope * np.sin(2 * np.pi * pitch * t))
+        gap = word_sec * (0.6 if word[-1] in ".!?" else 0.3)
+        chunks.append(np.zeros(int(gap * sample_rate), dtype=np.float32))
+    samples = (np.concatenate(chunks) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+class LocalTTSClient(BaseAudioProvider):
+    """
+    Offline text-to-speech for previews: piper when a voice model is available, then
+    espeak-ng or espeak, then a tone generator as a last resort. Output is encoded to the
+    same MP3 format as ElevenLabs' default (44.1 kHz mono, 128 kbps) so the mixer sees
+    what a real run produces. Needs ffmpeg; needs no API keys.
+    """
+    def __init__(self, backend: Optional[str] = None, piper_model: Optional[str] = None):
+        # Read from the environment, not settings, so previews run without provider keys
+        self.piper_model = piper_model or os.environ.get("PIPER_MODEL")
+        self.backend = backend or self.detect_backend(self.piper_model)
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown local TTS backend '{self.backend}' (choose from {', '.join(BACKENDS)})")
+        if self.backend == "piper" and not self.piper_model:
+            raise ValueError("The piper backend needs a voice model (PIPER_MODEL).")
+
+    @staticmethod
+    def detect_backend(piper_model: Optional[str] = None) -> str:
+        if piper_model and shutil.which("piper"):
+            return "piper"
+        for binary in ("espeak-ng", "espeak"):
+            if shutil.which(binary):
+                return binary
+        return "tone"
+
+    async def generate_audio(self, text: str, voice_id: str) -> bytes:
+        # ElevenLabs voice IDs mean nothing locally; each backend uses its own voice
+        return await asyncio.to_thread(self._render, text)
+
+    async def synthesize_segments(
+        self, segments: List[ScriptSegment], voice_id: str, output_dir: str, min_batches: int = 1
+    ) -> List[str]:
+        """
+        Renders every segment at once; each one is a separate local process.
+        """
+        paths = [self.segment_path(output_dir, i, segment) for i, segment in enumerate(segments)]
+        await asyncio.gather(*(
+            self.write_segment(segment, voice_id, path) for segment, path in zip(segments, paths)
+        ))
+        logger.info(f"Rendered {len(segments)} segments locally with {self.backend}.")
+        return paths
+
+    def _render(self, text: str) -> bytes:
+        try:
+            return self._encode(self._speak(text))
+        except Exception as e:
+            logger.error(f"Local TTS ({self.backend}) failed: {e}")
+            raise e
+
+    def _speak(self, text: str) -> bytes:
+        """
+        WAV bytes for `text` from the selected backend.
+        """
+        if self.backend == "tone":
+            return tone_wav(text)
+        if self.backend == "piper":
+            fd, wav_path = tempfile.mkstemp(prefix="piper_", suffix=".wav")
+            os.close(fd)
+            try:
+                self._run(["piper", "--model", self.piper_model, "--output_file", wav_path], text.encode("utf-8"))
+                with open(wav_path, "rb") as f:
+                    return f.read()
+            finally:
+                os.remove(wav_path)
+        # espeak-ng / espeak: ~165 wpm is close to the script writer's pacing
+        return self._run([self.backend, "-v", "en-gb", "-s", "165", "--stdin", "--stdout"], text.encode("utf-8"))
+
+    def _encode(self, wav: bytes) -> bytes:
+        return self._run([
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "wav", "-i", "pipe:0",
+            "-ar", str(SAMPLE_RATE), "-ac", "1",
+            "-c:a", "libmp3lame", "-b:a", "128k",
+            "-f", "mp3", "pipe:1"
+        ], wav)
+
+    @staticmethod
+    def _run(cmd: List[str], stdin: bytes) -> bytes:
+        result = subprocess.run(cmd, input=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"{cmd[0]} failed: {result.stderr.decode('utf-8', 'replace')[-500:]}")
+        return result.stdout
@@ -1,27 +1,55 @@
 import os
+import shutil
 import subprocess
+import tempfile
+import json
 import logging
-from typing import List
+from typing import List, NamedTuple, Optional
 
 logger = logging.getLogger(__name__)
 
+class SplitError(RuntimeError):
+    """
+    ffmpeg split a file into a different number of parts than there were cut points for,
+    e.g. a cut past the end of the audio or an empty part dropped by the segment muxer.
+    """
+
+class AudioStats(NamedTuple):
+    duration_sec: float
+    # EBU R128 measurements; mix_episode targets -16 LUFS, -1.5 dBTP, LRA 11
+    integrated_lufs: float
+    true_peak_db: float
+    loudness_range: float
+
 class AudioMixer:
-    def mix_episode(self, segments: List[str], output_path: str) -> str:
+    def mix_episode(
+        self, segments: List[str], output_path: str, normalize: bool = True, timeout: Optional[float] = None
+    ) -> str:
         """
         Concatenates audio segments and normalizes loudness to -16 LUFS.
-        Returns the path to the final output file.
+        Returns the path to the final output file. normalize=False skips the loudness
+        filter, for runs that are out of time. With a timeout, ffmpeg is killed after that
+        many seconds (subprocess.TimeoutExpired). output_path only ever holds a finished mix.
         """
         if not segments:
             raise ValueError("No segments provided for mixing.")
 
         # Create a temporary file list for ffmpeg concat demuxer
-        list_file_path = "input_list.txt"
+        # (unique per call, so several shows can be mixed at once)
+        fd, list_file_path = tempfile.mkstemp(prefix="concat_", suffix=".txt")
+        # Rendered beside the output and renamed over it when done, so a mix that is killed
+        # or abandoned never leaves a partial file or overwrites another mix of the same episode
+        out_fd, partial_path = tempfile.mkstemp(
+            prefix=".mix_", suffix=".mp3", dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        os.close(out_fd)
         try:
-            with open(list_file_path, "w") as f:
+            with os.fdopen(fd, "w") as f:
                 for segment in segments:
-                    # ffmpeg requires absolute paths or relative paths safe for the demuxer
-                    # escape backslashes for Windows
-                    safe_path = segment.replace("\\", "/")
+                    # The demuxer resolves relative paths against the list file's directory,
+                    # which is the temp dir, so always write absolute ones.
+                    # Forward slashes for Windows; single quotes escaped for the demuxer
+                    safe_path = os.path.abspath(segment).replace("\\", "/").replace("'", "'\\''")
                     f.write(f"file '{safe_path}'\n")
 
             # 1. Concatenate
@@ -34,10 +62,13 @@ class AudioMixer:
                 "-f", "concat",
                 "-safe", "0",
                 "-i", list_file_path,
-                "-af", "loudnorm=I=-16:TP=-1.5:LRA=11", # EBU R128 normalization
+            ]
+            if normalize:
+                cmd += ["-af", "loudnorm=I=-16:TP=-1.5:LRA=11"] # EBU R128 normalization
+            cmd += [
                 "-c:a", "libmp3lame",
                 "-q:a", "2", # High quality VBR
-                output_path
+                partial_path
             ]
 
             logger.info(f"Running ffmpeg mix command: {' '.join(cmd)}")
@@ -46,12 +77,14 @@ class AudioMixer:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True
+                text=True,
+                timeout=timeout
             )
 
             if result.returncode != 0:
                 logger.error(f"FFmpeg mixing failed: {result.stderr}")
                 raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+            os.replace(partial_path, output_path)
             
             logger.info(f"Successfully mixed episode to {output_path}")
             return output_path
@@ -63,3 +96,73 @@ class AudioMixer:
             # Cleanup temp list file
             if os.path.exists(list_file_path):
                 os.remove(list_file_path)
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+    def split_audio(self, source_path: str, cut_points: List[float], output_paths: List[str]) -> List[str]:
+        """
+        Cuts one MP3 at the given times (seconds) into len(cut_points) + 1 files, without
+        re-encoding. MP3 frames are ~26 ms, so cuts land within one frame of the request.
+        """
+        if len(output_paths) != len(cut_points) + 1:
+            raise ValueError(f"{len(cut_points)} cut points need {len(cut_points) + 1} output paths.")
+
+        out_dir = tempfile.mkdtemp(prefix="split_")
+        try:
+            cmd = [
+                "ffmpeg",
+                "-y",
+                "-i", source_path,
+                "-f", "segment",
+                "-segment_times", ",".join(f"{t:.3f}" for t in cut_points),
+                "-reset_timestamps", "1",
+                "-c", "copy",
+                os.path.join(out_dir, "part_%03d.mp3")
+            ]
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                logger.error(f"FFmpeg split failed: {result.stderr}")
+                raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+
+            parts = sorted(os.listdir(out_dir))
+            if len(parts) != len(output_paths):
+                raise SplitError(f"FFmpeg produced {len(parts)} parts, expected {len(output_paths)}.")
+            for part, output_path in zip(parts, output_paths):
+                shutil.move(os.path.join(out_dir, part), output_path)
+            return output_paths
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+    def duration(self, path: str) -> float:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"ffprobe failed: {result.stderr}")
+        return float(result.stdout.strip())
+
+    def measure(self, path: str) -> AudioStats:
+        """
+        Duration and loudness of a finished file, from loudnorm's analysis pass (nothing is written).
+        """
+        cmd = [
+            "ffmpeg", "-hide_banner", "-nostats",
+            "-i", path,
+            "-af", "loudnorm=I=-16:TP=-1.5:LRA=11:print_format=json",
+            "-f", "null", "-"
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+
+        # The JSON report is the last {...} block ffmpeg prints to stderr
+        report = json.loads(result.stderr[result.stderr.rindex("{"):result.stderr.rindex("}") + 1])
+        return AudioStats(
+            duration_sec=self.duration(path),
+            integrated_lufs=float(report["input_i"]),
+            true_peak_db=float(report["input_tp"]),
+            loudness_range=float(report["input_lra"])
+        )
@@ -0,0 +1,16 @@
+"""
+Decodable MP3 silence built without an encoder, for stand-in audio (mock providers,
+dry runs and placeholders).
+"""
+
+# A single silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz, mono, no padding).
+# Zeroed side info decodes as silence, so repeated frames form a valid MP3 stream.
+SILENT_FRAME = b"\xff\xfb\x90\xc4" + b"\x00" * 413
+FRAME_SECONDS = 1152 / 44100
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """
+    A silent MP3 of the requested duration, to the nearest frame (at least one).
+    """
+    return SILENT_FRAME * max(1, round(seconds / FRAME_SECONDS))
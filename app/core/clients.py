@@ -0,0 +1,128 @@
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from app.audio.elevenlabs_client import ElevenLabsClient
+    from app.audio.mixer import AudioMixer
+    from app.distribution.publisher import PodcastPublisher
+    from app.engine.script_writer import ScriptWriter
+    from app.ingest.inbox import StoryInbox
+    from app.ingest.transcriber import DeepgramTranscriber
+    from app.ingest.watermarks import WatermarkStore
+    from app.memory.deduplicator import StoryMemory
+
+logger = logging.getLogger(__name__)
+
+class ClientPool:
+    """
+    Provider clients built on first use and reused across pipeline runs.
+    A one-shot run creates a fresh pool; the daemon keeps one alive between editions.
+    """
+    def __init__(self):
+        self._transcriber: Optional["DeepgramTranscriber"] = None
+        self._memory: Optional["StoryMemory"] = None
+        self._writer: Optional["ScriptWriter"] = None
+        self._tts: Optional["ElevenLabsClient"] = None
+        self._mixer: Optional["AudioMixer"] = None
+        self._publisher: Optional["PodcastPublisher"] = None
+        self._inbox: Optional["StoryInbox"] = None
+        self._watermarks: Optional["WatermarkStore"] = None
+        self._show_memories: Dict[str, "StoryMemory"] = {}
+
+    @property
+    def transcriber(self) -> "DeepgramTranscriber":
+        if self._transcriber is None:
+            from app.ingest.transcriber import DeepgramTranscriber
+            self._transcriber = DeepgramTranscriber()
+        return self._transcriber
+
+    @property
+    def memory(self) -> "StoryMemory":
+        if self._memory is None:
+            from app.memory.deduplicator import StoryMemory
+            self._memory = StoryMemory()
+        return self._memory
+
+    def show_memory(self, namespace: str) -> "StoryMemory":
+        """
+        Dedup memory private to one show, so sector shows don't repeat their own stories.
+        """
+        if namespace not in self._show_memories:
+            from app.memory.deduplicator import StoryMemory
+            self._show_memories[namespace] = StoryMemory(namespace=namespace)
+        return self._show_memories[namespace]
+
+    @property
+    def writer(self) -> "ScriptWriter":
+        if self._writer is None:
+            from app.engine.script_writer import ScriptWriter
+            self._writer = ScriptWriter()
+        return self._writer
+
+    @property
+    def tts(self) -> "ElevenLabsClient":
+        if self._tts is None:
+            from app.audio.elevenlabs_client import ElevenLabsClient
+            self._tts = ElevenLabsClient()
+        return self._tts
+
+    @property
+    def mixer(self) -> "AudioMixer":
+        if self._mixer is None:
+            from app.audio.mixer import AudioMixer
+            self._mixer = AudioMixer()
+        return self._mixer
+
+    @property
+    def publisher(self) -> "PodcastPublisher":
+        if self._publisher is None:
+            from app.distribution.publisher import PodcastPublisher
+            self._publisher = PodcastPublisher()
+        return self._publisher
+
+    @property
+    def inbox(self) -> "StoryInbox":
+        if self._inbox is None:
+            from app.core.config import settings
+            from app.ingest.inbox import StoryInbox
+            self._inbox = StoryInbox(settings.INBOX_DB_PATH)
+        return self._inbox
+
+    @property
+    def watermarks(self) -> "WatermarkStore":
+        if self._watermarks is None:
+            from app.ingest.watermarks import WatermarkStore
+            # Opens INBOX_DB_PATH lazily, on the first fetch
+            self._watermarks = WatermarkStore()
+        return self._watermarks
+
+    def warm(self):
+        """
+        Builds every client up front and touches the vector collection so the first
+        edition does not pay for SDK imports, connection setup or index loading.
+        """
+        started = time.perf_counter()
+        self.transcriber
+        self.writer
+        self.tts
+        self.mixer
+        self.publisher
+        story_count = self.memory.collection.count()
+        logger.info(
+            f"Warmed provider clients in {time.perf_counter() - started:.2f}s "
+            f"({story_count} stories in memory)."
+        )
+
+    async def aclose(self):
+        if self._tts is not None:
+            await self._tts.aclose()
+        if self._inbox is not None:
+            self._inbox.close()
+            self._inbox = None
+        if self._watermarks is not None:
+            self._watermarks.close()
+
+        # Feed-parsing worker processes are started on the first RSS fetch
+        from app.ingest.feed_parser import shutdown_parser_pool
+        shutdown_parser_pool()
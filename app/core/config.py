@@ -1,6 +1,9 @@
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+DEFAULT_CONTROL_SOCKET_PATH = "./asx-bot.sock"
+
 class Settings(BaseSettings):
     OPENAI_API_KEY: str
     DEEPGRAM_API_KEY: str
@@ -14,10 +17,66 @@ class Settings(BaseSettings):
     R2_BUCKET_NAME: str
     R2_PUBLIC_DOMAIN: str
 
+    # Provider base URL overrides (e.g. local mock servers for load testing)
+    OPENAI_BASE_URL: Optional[str] = None
+    ELEVENLABS_BASE_URL: str = "https://api.elevenlabs.io/v1"
+    # Characters per batched TTS request (0 = one request per segment)
+    ELEVENLABS_BATCH_CHARS: int = 5000
+    DEEPGRAM_BASE_URL: Optional[str] = None
+
+    # Background ingestion (run_ingest.py / serve.py --with-ingest)
+    INBOX_DB_PATH: str = "./story_inbox.db"
+    INGEST_WINDOW_HOURS: float = 12.0
+    # Entries published longer ago than this are dropped at fetch time (0 disables)
+    INGEST_MAX_AGE_HOURS: float = 24.0
+    RSS_POLL_INTERVAL_SEC: float = 300.0
+    YOUTUBE_POLL_INTERVAL_SEC: float = 1800.0
+
+    # Daemon mode (serve.py)
+    SCHEDULE_TIMEZONE: str = "Australia/Sydney"
+    MORNING_EDITION_AT: str = "07:30"
+    AFTERNOON_EDITION_AT: str = "16:30"
+    # Deadline mode: publish-by time per edition, HH:MM in SCHEDULE_TIMEZONE (empty disables)
+    MORNING_DEADLINE_AT: str = ""
+    AFTERNOON_DEADLINE_AT: str = ""
+    SCHEDULE_TRADING_DAYS_ONLY: bool = True
+    CONTROL_SOCKET_PATH: str = DEFAULT_CONTROL_SOCKET_PATH
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore"
+    )
+
+class ControlSettings(BaseSettings):
+    """
+    The part of Settings a control client needs. Loads from the same env/.env without
+    requiring the provider secrets, so talking to the daemon's socket needs no API keys.
+    """
+    CONTROL_SOCKET_PATH: str = DEFAULT_CONTROL_SOCKET_PATH
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore"
     )
 
-settings = Settings()
+_settings: Optional[Settings] = None
+
+def get_settings() -> Settings:
+    """
+    Builds Settings on first use, so importing a module never requires the API keys.
+    """
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
+
+class _LazySettings:
+    """
+    Stand-in for the Settings instance that defers loading until an attribute is read.
+    """
+    def __getattr__(self, name: str):
+        return getattr(get_settings(), name)
+
+settings = _LazySettings()
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Dict, List, NamedTuple, Optional, TypeVar
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class StageTimeout(asyncio.TimeoutError):
+    """
+    A stage ran past its budget. Distinct from a timeout raised inside the stage (e.g. a
+    provider's HTTP timeout), which propagates unchanged.
+    """
+    def __init__(self, stage: str, budget_sec: float):
+        super().__init__(f"{stage} ran past its {budget_sec:.0f}s budget")
+        self.stage = stage
+        self.budget_sec = budget_sec
+
+
+class StageBudget(NamedTuple):
+    # Time the stage normally gets; later stages are guaranteed theirs before earlier ones
+    nominal_sec: float
+    # Time the stage gets even when the deadline is already gone, so a late run still ships
+    floor_sec: float
+
+
+# In pipeline order. Squeezing happens front to back: a run that starts late loses
+# ingestion time first and keeps what synthesis, mixing and publishing need.
+STAGE_BUDGETS: Dict[str, StageBudget] = {
+    "ingest": StageBudget(300.0, 15.0),
+    "dedup": StageBudget(60.0, 10.0),
+    "script": StageBudget(120.0, 30.0),
+    "tts": StageBudget(300.0, 60.0),
+    "mix": StageBudget(90.0, 30.0),
+    "publish": StageBudget(60.0, 30.0),
+}
+
+
+class Deadline:
+    """
+    Absolute time an edition must be published by, split into per-stage budgets counted
+    back from the end. Stages that finish early hand their slack to the ones after them.
+    Every degradation taken to stay on time is logged and kept in `decisions`.
+    """
+    def __init__(self, at: datetime, budgets: Optional[Dict[str, StageBudget]] = None):
+        self.at = at
+        self.budgets = budgets or STAGE_BUDGETS
+        self.decisions: List[str] = []
+        # Monotonic, so a clock change mid-run doesn't move the deadline
+        self._end = time.monotonic() + (at - datetime.now(at.tzinfo)).total_seconds()
+
+    @classmethod
+    def at_clock(cls, value: str, timezone: str) -> "Deadline":
+        """
+        Today at HH:MM in `timezone` (e.g. "09:55" Australia/Sydney, before the ASX open).
+        """
+        from app.daemon.scheduler import parse_clock
+
+        tz = ZoneInfo(timezone)
+        return cls(datetime.combine(datetime.now(tz).date(), parse_clock(value), tzinfo=tz))
+
+    @classmethod
+    def in_minutes(cls, minutes: float) -> "Deadline":
+        return cls(datetime.now().astimezone() + timedelta(minutes=minutes))
+
+    @classmethod
+    def parse(cls, value: str, timezone: str) -> "Deadline":
+        """
+        "HH:MM" for a wall-clock deadline today, "+MIN" for minutes from now.
+        """
+        if value.startswith("+"):
+            return cls.in_minutes(float(value[1:]))
+        return cls.at_clock(value, timezone)
+
+    def remaining(self) -> float:
+        return self._end - time.monotonic()
+
+    def _reserved_after(self, stage: str) -> float:
+        stages = list(self.budgets)
+        return sum(self.budgets[s].nominal_sec for s in stages[stages.index(stage) + 1:])
+
+    def time_for(self, stage: str) -> float:
+        """
+        Seconds `stage` may run: whatever is left once every later stage has its nominal
+        budget, and never less than the stage's floor.
+        """
+        return max(self.budgets[stage].floor_sec, self.remaining() - self._reserved_after(stage))
+
+    def pressure(self, *stages: str) -> float:
+        """
+        Time available to run `stages` (consecutive, in order) as a fraction of their
+        nominal budgets: 1.0 means on schedule, 0.5 means half the usual time is left.
+        """
+        nominal = sum(self.budgets[s].nominal_sec for s in stages)
+        available = self.remaining() - self._reserved_after(stages[-1])
+        return max(0.0, min(1.0, available / nominal)) if nominal else 1.0
+
+    def degrade(self, stage: str, decision: str):
+        self.decisions.append(f"{stage}: {decision}")
+        logger.warning(f"⏱  [{stage}] {decision} ({self.remaining():.0f}s to deadline)")
+
+    def report(self):
+        if self.remaining() < 0:
+            logger.warning(f"⏱  Deadline {self.at:%H:%M} missed by {-self.remaining():.0f}s.")
+        else:
+            logger.info(f"⏱  Finished {self.remaining():.0f}s ahead of the {self.at:%H:%M} deadline.")
+        if self.decisions:
+            logger.warning(f"⏱  {len(self.decisions)} degradation(s) taken: " + "; ".join(self.decisions))
+
+
+async def run_stage(deadline: Optional[Deadline], stage: str, awaitable: Awaitable[T]) -> T:
+    """
+    Awaits `awaitable` within the stage's budget, cancelling it and raising StageTimeout
+    when it runs over. Without a deadline it simply awaits.
+    """
+    if deadline is None:
+        return await awaitable
+    budget = deadline.time_for(stage)
+    task = asyncio.ensure_future(awaitable)
+    try:
+        # Not wait_for: its own timeout and one raised by the stage would look the same
+        done, _ = await asyncio.wait({task}, timeout=budget)
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    if not done:
+        raise StageTimeout(stage, budget)
+    return task.result()
@@ -0,0 +1,314 @@
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+_THROTTLE_CODES = {"SlowDown", "Throttling", "ThrottlingException", "RequestLimitExceeded",
+                   "TooManyRequestsException", "RequestThrottled"}
+_TRANSIENT_CODES = {"RequestTimeout", "InternalError", "ServiceUnavailable"}
+# Matched against the exception's MRO so subclasses (httpx.ConnectError, ...) are covered too
+_CONNECTION_ERROR_NAMES = {"TransportError", "APIConnectionError", "EndpointConnectionError",
+                           "ConnectionClosedError", "ReadTimeoutError", "ConnectTimeoutError"}
+
+
+class RetryableError(Exception):
+    """
+    Raised by provider clients for responses that are safe to retry (429, 5xx).
+    """
+    def __init__(self, message: str, status: Optional[int] = None,
+                 retry_after: Optional[float] = None, throttled: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.throttled = throttled
+
+
+class ProviderPolicy(BaseModel):
+    rate: float                 # Ceiling for sustained requests/sec
+    burst: int                  # Token bucket capacity
+    max_concurrency: int        # In-flight requests allowed at once
+    min_rate: float = 0.2       # Floor the adaptive rate never drops below
+    max_retries: int = 5
+    base_backoff: float = 0.5
+    max_backoff: float = 30.0
+
+
+DEFAULT_POLICIES: Dict[str, ProviderPolicy] = {
+    "openai": ProviderPolicy(rate=50, burst=50, max_concurrency=16),
+    "elevenlabs": ProviderPolicy(rate=5, burst=5, max_concurrency=4),
+    "deepgram": ProviderPolicy(rate=10, burst=10, max_concurrency=10),
+    "r2": ProviderPolicy(rate=50, burst=50, max_concurrency=8),
+}
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """
+    Parses reset durations such as '1s', '20ms', '6m0s' or '1h2m3.5s' into seconds.
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if not parts:
+        return None
+    scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+    """
+    Reads retry-after-ms / Retry-After (seconds or HTTP date) from response headers.
+    """
+    if not headers:
+        return None
+    retry_ms = headers.get("retry-after-ms")
+    if retry_ms:
+        try:
+            return float(retry_ms) / 1000
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+def _status_and_headers(exc: BaseException) -> Tuple[Optional[int], Optional[Mapping[str, str]], Optional[str]]:
+    """
+    Duck-types status code, headers and error code out of openai, httpx, Deepgram and botocore errors.
+    """
+    status = getattr(exc, "status_code", None)
+    headers = None
+    code = None
+
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        # botocore ClientError
+        metadata = response.get("ResponseMetadata", {})
+        status = metadata.get("HTTPStatusCode")
+        headers = metadata.get("HTTPHeaders")
+        code = response.get("Error", {}).get("Code")
+    elif response is not None:
+        status = status or getattr(response, "status_code", None)
+        headers = getattr(response, "headers", None)
+
+    if status is None:
+        # Deepgram's DeepgramApiError carries the status as a string
+        try:
+            status = int(getattr(exc, "status", None))
+        except (TypeError, ValueError):
+            status = None
+    return status, headers, code
+
+
+def classify_error(exc: BaseException) -> Tuple[bool, Optional[float], bool]:
+    """
+    Returns (retryable, retry_after, throttled) for an exception raised by a provider call.
+    """
+    if isinstance(exc, RetryableError):
+        return True, exc.retry_after, exc.throttled
+
+    status, headers, code = _status_and_headers(exc)
+    if status == 429 or code in _THROTTLE_CODES:
+        return True, parse_retry_after(headers), True
+    if status in _RETRYABLE_STATUS or code in _TRANSIENT_CODES:
+        return True, parse_retry_after(headers), status == 503
+
+    if isinstance(exc, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True, None, False
+    if any(cls.__name__ in _CONNECTION_ERROR_NAMES for cls in type(exc).__mro__):
+        return True, None, False
+
+    # Wrappers such as boto3's S3UploadFailedError keep the real error as the chained context
+    inner = exc.__cause__ or exc.__context__
+    if inner is not None and inner is not exc:
+        return classify_error(inner)
+    return False, None, False
+
+
+class ProviderLimiter:
+    """
+    Token bucket + concurrency budget + retry loop for one provider.
+
+    The bucket's refill rate adapts: it halves on throttling responses, recovers additively
+    on success, and follows x-ratelimit-remaining / reset headers when the provider sends them.
+    """
+    def __init__(self, name: str, policy: ProviderPolicy):
+        self.name = name
+        self.policy = policy
+        self.rate = policy.rate
+        self._tokens = float(policy.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._sync_slots = threading.BoundedSemaphore(policy.max_concurrency)
+        self._async_slots: Dict[int, asyncio.Semaphore] = {}
+
+    # --- Token bucket ---
+
+    def _reserve(self) -> float:
+        """
+        Takes one token and returns how long the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.policy.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def _block_for(self, seconds: float):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.policy.rate, self.rate + self.policy.rate * 0.05)
+
+    def on_throttled(self, retry_after: Optional[float]):
+        with self._lock:
+            self.rate = max(self.policy.min_rate, self.rate * 0.5)
+            self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._block_for(retry_after)
+        logger.warning(f"[{self.name}] Throttled; pacing at {self.rate:.2f} req/s")
+
+    def observe(self, headers: Optional[Mapping[str, str]]):
+        """
+        Adapts the bucket to rate-limit headers on a successful response.
+        """
+        if not headers:
+            return
+        remaining = headers.get("x-ratelimit-remaining-requests") or headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset-requests") or headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_count = int(float(remaining))
+        except ValueError:
+            return
+        reset_sec = parse_duration(reset)
+        if not reset_sec:
+            return
+
+        if remaining_count <= 0:
+            self._block_for(reset_sec)
+            return
+        # Spread what is left of the window evenly across the time until it resets
+        with self._lock:
+            self.rate = max(self.policy.min_rate, min(self.policy.rate, remaining_count / reset_sec))
+
+    # --- Concurrency ---
+
+    def _async_slot(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they are first awaited on, so keep one per loop
+        loop_id = id(asyncio.get_running_loop())
+        slot = self._async_slots.get(loop_id)
+        if slot is None:
+            slot = asyncio.Semaphore(self.policy.max_concurrency)
+            self._async_slots = {loop_id: slot}
+        return slot
+
+    # --- Retry loop ---
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        ceiling = min(self.policy.max_backoff, self.policy.base_backoff * (2 ** attempt))
+        delay = random.uniform(0, ceiling)
+        if retry_after:
+            delay = max(delay, retry_after + random.uniform(0, self.policy.base_backoff))
+        return delay
+
+    def _should_retry(self, exc: Exception, attempt: int) -> Optional[float]:
+        retryable, retry_after, throttled = classify_error(exc)
+        if throttled:
+            self.on_throttled(retry_after)
+        if not retryable or attempt >= self.policy.max_retries:
+            return None
+        delay = self._backoff(attempt, retry_after)
+        logger.warning(
+            f"[{self.name}] Attempt {attempt + 1}/{self.policy.max_retries + 1} failed ({exc}); "
+            f"retrying in {delay:.2f}s"
+        )
+        return delay
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """
+        Awaits fn(*args, **kwargs) under this provider's pacing, concurrency and retry policy.
+        If the result carries `.headers`, they are fed back into the bucket.
+        """
+        attempt = 0
+        while True:
+            async with self._async_slot():
+                wait = self._reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    result = await fn(*args, **kwargs)
+                except Exception as e:
+                    delay = self._should_retry(e, attempt)
+                    if delay is None:
+                        raise e
+                else:
+                    self.on_success()
+                    self.observe(getattr(result, "headers", None))
+                    return result
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def call_sync(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Blocking counterpart of `call` for synchronous SDKs such as boto3.
+        """
+        attempt = 0
+        while True:
+            with self._sync_slots:
+                wait = self._reserve()
+                if wait > 0:
+                    time.sleep(wait)
+                try:
+                    result = fn(*args, **kwargs)
+                except Exception as e:
+                    delay = self._should_retry(e, attempt)
+                    if delay is None:
+                        raise e
+                else:
+                    self.on_success()
+                    return result
+            time.sleep(delay)
+            attempt += 1
+
+
+_limiters: Dict[str, ProviderLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(provider: str) -> ProviderLimiter:
+    """
+    Returns the process-wide limiter for a provider, so every client of it shares one budget.
+    """
+    with _registry_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = ProviderLimiter(provider, DEFAULT_POLICIES[provider])
+            _limiters[provider] = limiter
+        return limiter
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CommandHandler = Callable[[dict], Awaitable[dict]]
+
+
+class ControlServer:
+    """
+    Newline-delimited JSON over a local Unix socket, e.g. {"command": "run", "mode": "afternoon"}.
+    Each request line gets exactly one JSON response line.
+    """
+    def __init__(self, path: str, handler: CommandHandler):
+        self.path = path
+        self.handler = handler
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        if os.path.exists(self.path):
+            if await self._is_live():
+                raise RuntimeError(f"Another daemon is already listening on {self.path}")
+            # A stale socket from a previous daemon would make bind() fail
+            os.remove(self.path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.path)
+        os.chmod(self.path, 0o600)
+        logger.info(f"Control socket listening on {self.path}")
+
+    async def _is_live(self) -> bool:
+        """
+        Whether something still accepts connections on the socket file.
+        """
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_unix_connection(self.path), 2.0)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handler(json.loads(line))
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "Invalid JSON"}
+                except Exception as e:
+                    logger.error(f"Control command failed: {e}", exc_info=True)
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+async def send_command(path: str, payload: dict, timeout: float = 10.0) -> dict:
+    """
+    Sends one command to a running daemon and returns its response.
+    """
+    reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(path), timeout)
+    try:
+        writer.write(json.dumps(payload).encode("utf-8") + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), timeout)
+        return json.loads(line)
+    finally:
+        writer.close()
@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from datetime import datetime, time, timedelta
+from typing import Awaitable, Callable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single sleep, so suspend/resume or clock changes are noticed promptly
+_MAX_SLEEP_SEC = 60.0
+
+
+def parse_clock(value: str) -> time:
+    hours, minutes = value.strip().split(":")
+    return time(int(hours), int(minutes))
+
+
+class EditionScheduler:
+    """
+    Fires editions at fixed wall-clock times in the exchange's timezone.
+    Australia/Sydney follows AEST/AEDT, which is what ASX trading hours track.
+    """
+    def __init__(
+        self,
+        editions: List[Tuple[str, time]],
+        timezone: str = "Australia/Sydney",
+        trading_days_only: bool = True
+    ):
+        if not editions:
+            raise ValueError("At least one edition must be scheduled.")
+        self.editions = sorted(editions, key=lambda e: e[1])
+        self.tz = ZoneInfo(timezone)
+        self.trading_days_only = trading_days_only
+        self.next_fire: Optional[Tuple[datetime, str]] = None
+
+    def next_run(self, now: Optional[datetime] = None) -> Tuple[datetime, str]:
+        """
+        Returns (fire_time, mode) for the first edition strictly after `now`.
+        """
+        now = (now or datetime.now(self.tz)).astimezone(self.tz)
+        day = now.date()
+        for _ in range(8):
+            if not self.trading_days_only or day.weekday() < 5:
+                for mode, at in self.editions:
+                    fire = datetime.combine(day, at, tzinfo=self.tz)
+                    if fire > now:
+                        return fire, mode
+            day += timedelta(days=1)
+        raise RuntimeError("No edition could be scheduled in the next week.")
+
+    async def run(self, trigger: Callable[[str], Awaitable[None]]):
+        """
+        Sleeps until each scheduled edition and awaits trigger(mode). Runs until cancelled.
+        """
+        while True:
+            fire, mode = self.next_run()
+            self.next_fire = (fire, mode)
+            logger.info(f"Next scheduled edition: {mode} at {fire.isoformat()}")
+
+            while True:
+                remaining = (fire - datetime.now(self.tz)).total_seconds()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(remaining, _MAX_SLEEP_SEC))
+
+            try:
+                await trigger(mode)
+            except Exception as e:
+                logger.error(f"Scheduled {mode} edition could not be triggered: {e}", exc_info=True)
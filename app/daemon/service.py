@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable, Deque, Optional, Set
+
+from app.core.clients import ClientPool
+from app.daemon.control import ControlServer
+from app.daemon.scheduler import EditionScheduler
+
+if TYPE_CHECKING:
+    from app.ingest.worker import IngestWorker
+
+logger = logging.getLogger(__name__)
+
+EditionRunner = Callable[[str, ClientPool], Awaitable[Optional[str]]]
+
+VALID_MODES = ("morning", "afternoon")
+
+
+class EditionService:
+    """
+    Resident process that keeps provider clients warm, fires scheduled editions and
+    accepts on-demand runs over the control socket. Editions never overlap.
+    """
+    def __init__(self, run_edition: EditionRunner, scheduler: EditionScheduler, socket_path: str):
+        self.run_edition = run_edition
+        self.scheduler = scheduler
+        self.clients = ClientPool()
+        self.control = ControlServer(socket_path, self.handle_command)
+        # Set before serve() to run ingestion in-process; it shares (and must stop before) the pool
+        self.ingest_worker: Optional["IngestWorker"] = None
+        self.current: Optional[dict] = None
+        self.history: Deque[dict] = deque(maxlen=20)
+        self._run_lock = asyncio.Lock()
+        self._runs: Set[asyncio.Task] = set()
+        self._stop = asyncio.Event()
+
+    async def trigger(self, mode: str, reason: str) -> dict:
+        if mode not in VALID_MODES:
+            return {"ok": False, "error": f"Unknown mode '{mode}'"}
+        queued = self._run_lock.locked()
+        task = asyncio.create_task(self._run(mode, reason))
+        self._runs.add(task)
+        task.add_done_callback(self._runs.discard)
+        return {"ok": True, "status": "queued" if queued else "started", "mode": mode}
+
+    async def _run(self, mode: str, reason: str):
+        async with self._run_lock:
+            record = {
+                "mode": mode,
+                "trigger": reason,
+                "started_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self.current = record
+            logger.info(f"Starting {mode} edition ({reason}).")
+            try:
+                record["feed_url"] = await self.run_edition(mode, self.clients)
+            except Exception as e:
+                logger.error(f"{mode} edition crashed: {e}", exc_info=True)
+                record["error"] = str(e)
+            finally:
+                record["finished_at"] = datetime.now(timezone.utc).isoformat()
+                self.current = None
+                self.history.append(record)
+
+    async def handle_command(self, command: dict) -> dict:
+        name = command.get("command")
+        if name == "ping":
+            return {"ok": True}
+        if name == "run":
+            return await self.trigger(command.get("mode", "morning"), reason="on-demand")
+        if name == "status":
+            next_fire = self.scheduler.next_fire
+            return {
+                "ok": True,
+                "running": self.current,
+                "queued": max(0, len(self._runs) - (1 if self.current else 0)),
+                "next_scheduled": {"mode": next_fire[1], "at": next_fire[0].isoformat()} if next_fire else None,
+                "history": list(self.history),
+            }
+        if name == "shutdown":
+            self.request_stop()
+            return {"ok": True, "status": "stopping"}
+        return {"ok": False, "error": f"Unknown command '{name}'"}
+
+    def request_stop(self):
+        self._stop.set()
+
+    async def serve(self):
+        # Imports, chroma and connection setup happen once here instead of inside each edition
+        try:
+            await asyncio.to_thread(self.clients.warm)
+            await self.control.start()
+        except Exception:
+            # e.g. another daemon owns the socket: don't leave the warmed HTTP clients open
+            await self.clients.aclose()
+            raise
+        schedule_task = asyncio.create_task(self.scheduler.run(
+            lambda mode: self.trigger(mode, reason="schedule")
+        ))
+        worker_task = asyncio.create_task(self.ingest_worker.run_forever()) if self.ingest_worker else None
+
+        try:
+            await self._stop.wait()
+        finally:
+            logger.info("Shutting down; letting any in-flight edition finish.")
+            schedule_task.cancel()
+            await self.control.stop()
+            # The worker polls through the pool's inbox, watermarks and parser processes,
+            # so it has to be fully stopped before aclose() releases them
+            if worker_task is not None:
+                self.ingest_worker.stop()
+                await worker_task
+            if self._runs:
+                await asyncio.gather(*self._runs, return_exceptions=True)
+            await self.clients.aclose()
@@ -1,28 +1,55 @@
 import os
 import logging
-import boto3
+import tempfile
+import threading
 from datetime import datetime, timezone
-from feedgen.feed import FeedGenerator
-from botocore.exceptions import ClientError
 from app.core.config import settings
+from app.core.ratelimit import get_limiter
 
 logger = logging.getLogger(__name__)
 
+_feed_locks = {}
+_feed_locks_lock = threading.Lock()
+
+def feed_lock(feed_file: str) -> threading.Lock:
+    """
+    One lock per feed key for the whole process; publishing runs in worker threads.
+    """
+    with _feed_locks_lock:
+        return _feed_locks.setdefault(feed_file, threading.Lock())
+
 class PodcastPublisher:
     def __init__(self):
+        import boto3
+        from botocore.config import Config
+
         self.s3_client = boto3.client(
             's3',
             endpoint_url=settings.R2_ENDPOINT_URL,
             aws_access_key_id=settings.R2_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY
+            aws_secret_access_key=settings.R2_SECRET_ACCESS_KEY,
+            # Retries and pacing are handled by the shared limiter
+            config=Config(retries={"total_max_attempts": 1, "mode": "standard"})
         )
+        self.limiter = get_limiter("r2")
         self.bucket_name = settings.R2_BUCKET_NAME
         self.public_domain = settings.R2_PUBLIC_DOMAIN.rstrip('/')
 
-    def update_feed(self, episode_title: str, episode_summary: str, mp3_path: str, duration_sec: int) -> str:
+    def update_feed(
+        self,
+        episode_title: str,
+        episode_summary: str,
+        mp3_path: str,
+        duration_sec: int,
+        feed_file: str = "feed.xml",
+        feed_title: str = "Voice AI Financial Update"
+    ) -> str:
         """
         Uploads MP3 to R2, updates (or creates) the RSS feed, and returns the feed URL.
+        Each show publishes to its own feed_file key.
         """
+        from botocore.exceptions import ClientError
+        from feedgen.feed import FeedGenerator
         
         # 1. Upload MP3
         filename = os.path.basename(mp3_path)
@@ -30,8 +57,9 @@ class PodcastPublisher:
         
         try:
             logger.info(f"Uploading {filename} to R2...")
-            self.s3_client.upload_file(
-                mp3_path, 
+            self.limiter.call_sync(
+                self.s3_client.upload_file,
+                mp3_path,
                 self.bucket_name, 
                 s3_key,
                 ExtraArgs={'ContentType': 'audio/mpeg'}
@@ -42,15 +70,38 @@ class PodcastPublisher:
 
         mp3_url = f"{self.public_domain}/{s3_key}"
 
+        # The working copy is private to this call, so concurrent publishes never share a file
+        fd, local_feed_path = tempfile.mkstemp(prefix="feed_", suffix=".xml")
+        os.close(fd)
+        try:
+            # Shows that share a feed key publish one at a time, or one could drop the other's entry
+            with feed_lock(feed_file):
+                return self._rewrite_feed(
+                    feed_file, feed_title, local_feed_path, mp3_url, episode_title, episode_summary
+                )
+        finally:
+            if os.path.exists(local_feed_path):
+                os.remove(local_feed_path)
+
+    def _rewrite_feed(
+        self,
+        feed_file: str,
+        feed_title: str,
+        local_feed_path: str,
+        mp3_url: str,
+        episode_title: str,
+        episode_summary: str
+    ) -> str:
+        from botocore.exceptions import ClientError
+        from feedgen.feed import FeedGenerator
+
         # 2. Fetch or Create Feed
-        feed_file = "feed.xml"
-        local_feed_path = "./feed.xml"
         
         fg = FeedGenerator()
         
         # Try to download existing feed
         try:
-            self.s3_client.download_file(self.bucket_name, feed_file, local_feed_path)
+            self.limiter.call_sync(self.s3_client.download_file, self.bucket_name, feed_file, local_feed_path)
             # Load existing feed into FeedGenerator
             # Note: feedgen loading from file isn't perfect for re-editing, 
             # often it's better to regenerate or parse. 
@@ -69,7 +120,7 @@ class PodcastPublisher:
             logger.info("No existing feed found. Creating new one.")
 
         # Re-establishing channel metadata (idempotent)
-        fg.title('Voice AI Financial Update')
+        fg.title(feed_title)
         fg.link(href=self.public_domain, rel='alternate')
         fg.description('Daily financial news and analysis generated by AI.')
         fg.language('en-au')
@@ -93,7 +144,8 @@ class PodcastPublisher:
         
         try:
             logger.info("Uploading updated feed.xml to R2...")
-            self.s3_client.upload_file(
+            self.limiter.call_sync(
+                self.s3_client.upload_file,
                 local_feed_path,
                 self.bucket_name,
                 feed_file,
@@ -105,9 +157,5 @@ class PodcastPublisher:
             
         feed_url = f"{self.public_domain}/{feed_file}"
         logger.info(f"Feed updated: {feed_url}")
-        
-        # Cleanup
-        if os.path.exists(local_feed_path):
-            os.remove(local_feed_path)
 
         return feed_url
@@ -0,0 +1,213 @@
+import csv
+import logging
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from app.models.base import NewsItem
+
+logger = logging.getLogger(__name__)
+
+LISTINGS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "asx_listings.csv")
+
+# Weight of a story that names no listed company, so it still ranks below any that does
+UNMATCHED_WEIGHT = 0.01
+
+# "ASX: ALL", "(ASX:WOW)" - the only form in which ambiguous codes count
+_CODE_PREFIX = re.compile(r"ASX:\s?$")
+
+
+class Listing(BaseModel):
+    code: str
+    name: str
+    aliases: List[str] = Field(default_factory=list)
+    sector: str = ""
+    index_weight: float = Field(default=0.0, description="Approximate S&P/ASX 200 weight, in percent")
+    code_match: Literal["bare", "prefixed", "none"] = Field(
+        default="bare",
+        description="'prefixed' for codes that are also English words (only 'ASX: CODE' counts), "
+                    "'none' for codes that never identify the company on their own"
+    )
+
+
+def load_listings(path: str = LISTINGS_PATH) -> List[Listing]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            Listing(
+                code=row["code"],
+                name=row["name"],
+                aliases=[a for a in row["aliases"].split("|") if a],
+                sector=row["sector"],
+                index_weight=float(row["index_weight"] or 0),
+                code_match=row["code_match"] or "bare"
+            )
+            for row in csv.DictReader(f)
+        ]
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher: finds every occurrence of every pattern in one pass over the
+    text, however many patterns there are. Matching is case-sensitive.
+    """
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            if pattern:
+                self._insert(pattern, len(self.patterns))
+                self.patterns.append(pattern)
+        self._build_links()
+
+    def _insert(self, pattern: str, pattern_id: int):
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pattern_id)
+
+    def _build_links(self):
+        # Breadth-first, so a node's failure target is always finished before the node
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        All matches as (start, end, pattern_id), overlapping ones included.
+        """
+        matches = []
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for end, char in enumerate(text, 1):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern_id in out[node]:
+                matches.append((end - len(self.patterns[pattern_id]), end, pattern_id))
+        return matches
+
+
+class TickerMatcher:
+    """
+    Finds ASX companies in text by code, name or alias, using one automaton built from
+    the bundled listings file.
+    """
+    def __init__(self, listings: Optional[List[Listing]] = None):
+        listings = listings if listings is not None else load_listings()
+        self.listings: Dict[str, Listing] = {listing.code: listing for listing in listings}
+
+        # pattern -> (code, needs "ASX:" prefix)
+        self._targets: List[Tuple[str, bool]] = []
+        patterns: List[str] = []
+        for listing in listings:
+            if listing.code_match != "none":
+                patterns.append(listing.code)
+                self._targets.append((listing.code, listing.code_match == "prefixed"))
+            for name in [listing.name, *listing.aliases]:
+                patterns.append(name)
+                self._targets.append((listing.code, False))
+        self._automaton = AhoCorasick(patterns)
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Codes mentioned in the text, most mentioned first. Overlapping matches resolve to the
+        longest ("BHP Group" counts once, not as "BHP" plus "BHP Group").
+        """
+        candidates = sorted(self._automaton.find(text), key=lambda m: (m[0], -(m[1] - m[0])))
+        counts: Counter = Counter()
+        covered_to = 0
+        for start, end, pattern_id in candidates:
+            if start < covered_to:
+                continue
+            # Whole words only: "RIO" must not match inside "PRIOR"
+            if (start > 0 and text[start - 1].isalnum()) or (end < len(text) and text[end].isalnum()):
+                continue
+            code, needs_prefix = self._targets[pattern_id]
+            if needs_prefix and not _CODE_PREFIX.search(text[max(0, start - 5):start]):
+                continue
+            counts[code] += 1
+            covered_to = end
+        return [code for code, _ in counts.most_common()]
+
+
+_matcher: Optional[TickerMatcher] = None
+
+
+def get_ticker_matcher() -> TickerMatcher:
+    """
+    The automaton is built once per process; the daemon reuses it for every edition.
+    """
+    global _matcher
+    if _matcher is None:
+        _matcher = TickerMatcher()
+        logger.info(f"Built ticker automaton for {len(_matcher.listings)} ASX listings.")
+    return _matcher
+
+
+class TickerIndex:
+    """
+    Inverted ticker -> stories index over one run's stories. Tags each story with the
+    codes it mentions (NewsItem.tickers) and ranks stories by the index weight of the
+    companies they cover.
+    """
+    def __init__(self, matcher: Optional[TickerMatcher] = None):
+        self.matcher = matcher or get_ticker_matcher()
+        self._stories: Dict[str, List[NewsItem]] = defaultdict(list)
+
+    def add(self, items: Iterable[NewsItem]):
+        for item in items:
+            item.tickers = self.matcher.extract(f"{item.title}\n{item.content_summary}")
+            for code in item.tickers:
+                self._stories[code].append(item)
+
+    def stories_for(self, code: str) -> List[NewsItem]:
+        return self._stories.get(code, [])
+
+    def tickers(self) -> List[str]:
+        return list(self._stories)
+
+    def code_weight(self, code: str) -> float:
+        listing = self.matcher.listings.get(code)
+        return listing.index_weight if listing else UNMATCHED_WEIGHT
+
+    def weight(self, item: NewsItem) -> float:
+        """
+        Index weight of the story's primary (most mentioned) company.
+        """
+        return self.code_weight(item.tickers[0]) if item.tickers else UNMATCHED_WEIGHT
+
+    def rank(self, items: List[NewsItem]) -> List[NewsItem]:
+        """
+        Heaviest companies first, with every story about the same primary ticker kept
+        together so the script covers one stock in one place.
+        """
+        groups: Dict[str, List[NewsItem]] = defaultdict(list)
+        for item in items:
+            groups[item.tickers[0] if item.tickers else ""].append(item)
+
+        ranked: List[NewsItem] = []
+        for key in sorted(groups, key=lambda k: self.code_weight(k) if k else UNMATCHED_WEIGHT, reverse=True):
+            ranked.extend(groups[key])
+        return ranked
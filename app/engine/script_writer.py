@@ -1,27 +1,40 @@
 import json
 import logging
-from typing import List, Literal
-from openai import AsyncOpenAI
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 from app.core.config import settings
+from app.core.ratelimit import get_limiter
+from app.engine.shows import SHOWS, ShowConfig
 from app.models.base import NewsItem, ScriptSegment, SegmentType
 
 logger = logging.getLogger(__name__)
 
+# Stories read out by the headline-only fallback script
+HEADLINE_STORIES = 8
+
 class ScriptOutput(BaseModel):
     segments: List[ScriptSegment]
 
 class ScriptWriter:
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        from openai import AsyncOpenAI
+
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            max_retries=0  # Retries and pacing are handled by the shared limiter
+        )
+        self.limiter = get_limiter("openai")
 
     async def generate_script(
         self,
         news_items: List[NewsItem],
-        mode: Literal["morning", "afternoon"] = "morning"
+        mode: Literal["morning", "afternoon"] = "morning",
+        show: Optional[ShowConfig] = None
     ) -> List[ScriptSegment]:
         """
         Generates a podcast script based on the provided news items and mode.
+        A ShowConfig overrides the mode's default focus (sector shows, flash briefings).
         """
         if not news_items:
             logger.warning("No news items provided to ScriptWriter.")
@@ -29,20 +42,25 @@ class ScriptWriter:
 
         # 1. Prepare Context
         context_str = "\n\n".join(
-            [f"ID: {i+1}\nSource: {item.source_id}\nTitle: {item.title}\nSummary: {item.content_summary}" 
+            [f"ID: {i+1}\nSource: {item.source_id}\nTitle: {item.title}\n"
+             + (f"Tickers: {', '.join(item.tickers)}\n" if item.tickers else "")
+             + f"Summary: {item.content_summary}"
              for i, item in enumerate(news_items)]
         )
 
-        # 2. Define Mode-Specific Instructions
-        if mode == "morning":
-            focus_instruction = (
-                "Focus on Global/US market closes (S&P500, NASDAQ) from overnight "
-                "and their specific implication for the ASX opening. Mention key commodities."
+        # 2. Define Show-Specific Instructions
+        show = show or SHOWS[mode]
+        focus_instruction = show.focus
+        if show.target_seconds:
+            # Roughly 150 spoken words per minute
+            max_words = int(show.target_seconds * 2.5)
+            focus_instruction += (
+                f" The whole script must stay under {max_words} words "
+                f"(about {show.target_seconds} seconds read aloud)."
             )
-        else:
-            focus_instruction = (
-                "Focus on ASX market close, top winners/losers of the day, "
-                "and local earnings results."
+        if show.deep_dive_sentences:
+            focus_instruction += (
+                f" Keep each stock_deepdive segment to at most {show.deep_dive_sentences} sentences."
             )
 
         # 3. Construct System Prompt
@@ -56,10 +74,10 @@ You are a Senior Australian Financial Analyst. Your task is to write a podcast s
 - TTS Optimization: Write ticker symbols phonetically if ambiguous, or spaced out for clarity (e.g., "B-H-P" instead of "BHP", "C-S-L" instead of "CSL").
 
 **Structure Instructions:**
-- **{mode.upper()} EDITION**: {focus_instruction}
+- **{show.title.upper()}**: {focus_instruction}
 - segment_type "intro": Brief high-level summary of the mood.
 - segment_type "market_wrap": Quantitative data, indices, currency.
-- segment_type "stock_deepdive": Specific analysis of the most important stories provided.
+- segment_type "stock_deepdive": Specific analysis of the most important stories provided. Stories are ordered by index weight; stories sharing a ticker belong in the same deep dive.
 - segment_type "outro": Very short sign-off.
 
 **Input Context:**
@@ -79,7 +97,8 @@ Return a valid JSON object strictly matching this structure:
 
         # 4. Call LLM
         try:
-            response = await self.client.chat.completions.create(
+            raw_response = await self.limiter.call(
+                self.client.chat.completions.with_raw_response.create,
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -88,6 +107,7 @@ Return a valid JSON object strictly matching this structure:
                 response_format={"type": "json_object"},
                 temperature=0.7
             )
+            response = raw_response.parse()
 
             # 5. Parse and Validate
             content = response.choices[0].message.content
@@ -104,3 +124,18 @@ Return a valid JSON object strictly matching this structure:
         except Exception as e:
             logger.error(f"Script generation failed: {e}")
             raise e
+
+
+def headline_script(news_items: List[NewsItem], show: ShowConfig) -> List[ScriptSegment]:
+    """
+    A script read straight from the story titles, without an LLM call. Used when the
+    writer can't finish before the edition's deadline.
+    """
+    limit = min(show.max_stories or HEADLINE_STORIES, HEADLINE_STORIES)
+    segments = [ScriptSegment(segment_type=SegmentType.INTRO, text=f"{show.title}. Here are the headlines.")]
+    segments.extend(
+        ScriptSegment(segment_type=SegmentType.STOCK_DEEPDIVE, text=item.title.rstrip(".") + ".")
+        for item in news_items[:limit]
+    )
+    segments.append(ScriptSegment(segment_type=SegmentType.OUTRO, text="That's the update. Full coverage next edition."))
+    return segments
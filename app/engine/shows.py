@@ -0,0 +1,107 @@
+import re
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from app.models.base import NewsItem
+
+# Spoken length assumed for shows without a target_seconds, when one has to be condensed
+DEFAULT_EPISODE_SECONDS = 600
+
+class ShowConfig(BaseModel):
+    key: str = Field(..., description="Short identifier, also used for file names")
+    title: str = Field(..., description="Episode title prefix in the feed")
+    focus: str = Field(..., description="Editorial instruction passed to the script writer")
+    keywords: List[str] = Field(default_factory=list, description="Story filter; empty means every story")
+    max_stories: Optional[int] = None
+    target_seconds: Optional[int] = Field(default=None, description="Spoken length cap, e.g. 90 for a flash briefing")
+    deep_dive_sentences: Optional[int] = Field(default=None, description="Length cap for each stock_deepdive segment")
+    feed_file: str = "feed.xml"
+    feed_title: str = "Voice AI Financial Update"
+    memory_namespace: Optional[str] = Field(
+        default=None,
+        description="Per-show dedup memory; None shares the main story memory"
+    )
+
+    def select(self, items: List[NewsItem]) -> List[NewsItem]:
+        """
+        Picks the stories relevant to this show.
+        """
+        if self.keywords:
+            pattern = re.compile(r"\b(" + "|".join(re.escape(k) for k in self.keywords) + r")\b", re.IGNORECASE)
+            items = [item for item in items if pattern.search(f"{item.title} {item.content_summary}")]
+        if self.max_stories:
+            items = items[:self.max_stories]
+        return items
+
+    def condensed(self, factor: float, story_count: int, min_stories: int = 3) -> "ShowConfig":
+        """
+        A shorter cut of this show for a run that is short on time: `factor` (0-1) of the
+        stories and of the spoken length, with deep dives kept to a couple of sentences.
+        """
+        stories = min(self.max_stories or story_count, story_count)
+        return self.model_copy(update={
+            "max_stories": max(min_stories, int(stories * factor)),
+            "target_seconds": max(60, int((self.target_seconds or DEFAULT_EPISODE_SECONDS) * factor)),
+            "deep_dive_sentences": 2,
+        })
+
+SHOWS: Dict[str, ShowConfig] = {
+    "morning": ShowConfig(
+        key="morning",
+        title="Market Update - Morning Edition",
+        focus=(
+            "Focus on Global/US market closes (S&P500, NASDAQ) from overnight "
+            "and their specific implication for the ASX opening. Mention key commodities."
+        )
+    ),
+    "afternoon": ShowConfig(
+        key="afternoon",
+        title="Market Update - Afternoon Edition",
+        focus=(
+            "Focus on ASX market close, top winners/losers of the day, "
+            "and local earnings results."
+        )
+    ),
+    "resources": ShowConfig(
+        key="resources",
+        title="Resources Desk",
+        focus="Cover ASX miners and energy producers: iron ore, lithium, gold, copper, oil and gas.",
+        keywords=["mining", "miner", "miners", "iron ore", "lithium", "gold", "copper", "coal", "oil", "gas",
+                  "uranium", "BHP", "B-H-P", "Rio Tinto", "Fortescue", "Woodside", "Pilbara", "resources"],
+        feed_file="feeds/resources.xml",
+        feed_title="ASX Resources Desk",
+        memory_namespace="resources"
+    ),
+    "banks": ShowConfig(
+        key="banks",
+        title="Banks & Financials",
+        focus="Cover the big four banks, insurers and the RBA: margins, arrears, capital and rate expectations.",
+        keywords=["bank", "banks", "banking", "CBA", "Commonwealth Bank", "Westpac", "NAB", "ANZ", "Macquarie",
+                  "RBA", "interest rate", "interest rates", "mortgage", "insurer", "financials"],
+        feed_file="feeds/banks.xml",
+        feed_title="ASX Banks & Financials",
+        memory_namespace="banks"
+    ),
+    "tech": ShowConfig(
+        key="tech",
+        title="Tech Tape",
+        focus="Cover ASX technology names and the read-through from US tech (NASDAQ).",
+        keywords=["tech", "technology", "software", "NASDAQ", "WiseTech", "Xero", "Block", "Afterpay",
+                  "data centre", "data centres", "NextDC", "AI", "semiconductor", "fintech"],
+        feed_file="feeds/tech.xml",
+        feed_title="ASX Tech Tape",
+        memory_namespace="tech"
+    ),
+    "flash": ShowConfig(
+        key="flash",
+        title="90-Second Flash",
+        focus=(
+            "Headlines only: the index move, the currency and the three biggest stories. "
+            "Use only intro, market_wrap and outro segments."
+        ),
+        max_stories=5,
+        target_seconds=90,
+        feed_file="feeds/flash.xml",
+        feed_title="ASX 90-Second Flash",
+        memory_namespace="flash"
+    ),
+}
@@ -9,4 +9,11 @@ class BaseSource(ABC):
         Fetches news items from the source.
         Must return a list of NewsItem objects.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def commit(self):
+        """
+        Called once the items from the last fetch are safely stored. Sources that keep
+        watermarks advance them here, so a failed run re-fetches the same entries.
+        """
+        pass
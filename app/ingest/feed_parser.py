@@ -0,0 +1,175 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, NamedTuple, Optional
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from app.ingest.normalize import normalize_text, strip_html
+
+logger = logging.getLogger(__name__)
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+RSS1 = "{http://purl.org/rss/1.0/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+
+# Tags that close one entry, for RSS 2.0, RSS 1.0 (RDF) and Atom
+_ENTRY_TAGS = {"item", f"{RSS1}item", f"{ATOM}entry"}
+_FEED_ROOTS = {"rss", "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF", f"{ATOM}feed"}
+
+_READ_CHUNK = 64 * 1024
+
+
+class FeedParseError(Exception):
+    """
+    The document is not a well-formed RSS/Atom feed; callers fall back to feedparser.
+    """
+
+
+class FeedEntry(NamedTuple):
+    # RSS <guid> / Atom <id>, or the link when the feed has neither
+    guid: str
+    title: str
+    link: str
+    summary: str
+    # Naive UTC, matching what feedparser's *_parsed fields produce
+    published_at: Optional[datetime]
+
+
+def _text(element: Optional[Element]) -> str:
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _parse_date(value: str) -> Optional[datetime]:
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)  # RFC 822, used by RSS 2.0
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))  # RFC 3339, used by Atom and dc:date
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _atom_link(entry: Element) -> str:
+    fallback = ""
+    for link in entry.iter(f"{ATOM}link"):
+        rel = link.get("rel", "alternate")
+        if rel == "alternate":
+            return link.get("href", "")
+        fallback = fallback or link.get("href", "")
+    return fallback
+
+
+def _entry(element: Element) -> FeedEntry:
+    if element.tag == f"{ATOM}entry":
+        title = _text(element.find(f"{ATOM}title"))
+        link = _atom_link(element)
+        summary = _text(element.find(f"{ATOM}summary")) or _text(element.find(f"{ATOM}content"))
+        published = _text(element.find(f"{ATOM}published")) or _text(element.find(f"{ATOM}updated"))
+        guid = _text(element.find(f"{ATOM}id"))
+    else:
+        ns = RSS1 if element.tag == f"{RSS1}item" else ""
+        title = _text(element.find(f"{ns}title"))
+        link = _text(element.find(f"{ns}link")) or _text(element.find("guid"))
+        summary = _text(element.find(f"{ns}description")) or _text(element.find(f"{CONTENT}encoded"))
+        published = _text(element.find("pubDate")) or _text(element.find(f"{DC}date"))
+        guid = _text(element.find("guid")) or element.get("{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about", "")
+
+    title = strip_html(title).strip()
+    return FeedEntry(
+        guid=guid or link,
+        title=title,
+        link=link,
+        summary=normalize_text(summary) or title,
+        published_at=_parse_date(published)
+    )
+
+
+def parse_feed(data: bytes) -> List[FeedEntry]:
+    """
+    Streams an RSS 2.0 / RSS 1.0 / Atom document through an incremental XML parser.
+    Each entry is converted and discarded as soon as its closing tag arrives, so memory
+    stays flat no matter how long the feed is. Raises FeedParseError for anything else.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    entries: List[FeedEntry] = []
+    root: Optional[Element] = None
+    try:
+        for offset in range(0, len(data), _READ_CHUNK):
+            parser.feed(data[offset:offset + _READ_CHUNK])
+            for event, element in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = element
+                        if root.tag not in _FEED_ROOTS:
+                            raise FeedParseError(f"Unsupported document root <{root.tag}>")
+                    continue
+                if element.tag in _ENTRY_TAGS:
+                    entries.append(_entry(element))
+                    # Drop the entry's subtree; the root only keeps an empty shell per entry
+                    element.clear()
+        parser.close()
+    except ParseError as e:
+        raise FeedParseError(str(e)) from e
+
+    if root is None:
+        raise FeedParseError("Empty document")
+    return entries
+
+
+def parse_feed_with_feedparser(data: bytes) -> List[FeedEntry]:
+    """
+    Slow path for malformed feeds; feedparser recovers from most of what real servers send.
+    """
+    import feedparser
+
+    feed = feedparser.parse(data)
+    if feed.bozo and not feed.entries:
+        raise FeedParseError(f"feedparser could not parse the feed: {feed.bozo_exception}")
+
+    entries = []
+    for entry in feed.entries:
+        published_at = None
+        if getattr(entry, "published_parsed", None):
+            published_at = datetime(*entry.published_parsed[:6])
+        title = strip_html(entry.get("title", "")).strip()
+        entries.append(FeedEntry(
+            guid=entry.get("id") or entry.get("link", ""),
+            title=title,
+            link=entry.get("link", ""),
+            summary=normalize_text(entry.get("summary", "")) or title,
+            published_at=published_at
+        ))
+    return entries
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_parser_pool(max_workers: int = 2) -> ProcessPoolExecutor:
+    """
+    Shared worker processes for feed parsing, so large feeds don't hold the GIL in the
+    process that also runs the event loop, TTS and uploads. 'spawn' keeps the children
+    free of the parent's threads and sockets.
+    """
+    global _pool
+    if _pool is None:
+        import multiprocessing
+        _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def shutdown_parser_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
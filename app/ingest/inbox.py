@@ -0,0 +1,114 @@
+import hashlib
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+from app.models.base import NewsItem
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id TEXT PRIMARY KEY,
+    source_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    content_summary TEXT NOT NULL,
+    embedding BLOB,
+    ingested_at REAL NOT NULL,
+    consumed_by TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_stories_pending ON stories (consumed_by, ingested_at);
+"""
+
+
+class StoryInbox:
+    """
+    Local store of stories that were already fetched, embedded and deduplicated by the
+    ingestion worker, waiting to be picked up by an edition. SQLite so the worker and
+    edition runs can live in separate processes.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def story_id(item: NewsItem) -> str:
+        return hashlib.md5(item.url.encode("utf-8")).hexdigest()
+
+    def add(self, items: Iterable[NewsItem]) -> int:
+        """
+        Stores new stories; URLs already in the inbox are ignored. Returns the number added.
+        """
+        now = time.time()
+        rows = [
+            (
+                self.story_id(item),
+                item.source_id,
+                item.title,
+                item.url,
+                item.published_at.isoformat(),
+                item.content_summary,
+                item.embedding_bytes(),
+                now,
+            )
+            for item in items
+        ]
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO stories (id, source_id, title, url, published_at, "
+                "content_summary, embedding, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return cursor.rowcount
+
+    def select_window(self, since: datetime, limit: Optional[int] = None) -> List[NewsItem]:
+        """
+        Returns unconsumed stories ingested at or after `since`, newest first.
+        Filtering on ingest time sidesteps the mix of naive UTC and local publish dates across sources.
+        """
+        query = (
+            "SELECT source_id, title, url, published_at, content_summary, embedding FROM stories "
+            "WHERE consumed_by IS NULL AND ingested_at >= ? ORDER BY published_at DESC"
+        )
+        params: list = [since.timestamp()]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        items = []
+        for source_id, title, url, published_at, content_summary, embedding in self.conn.execute(query, params):
+            item = NewsItem(
+                source_id=source_id,
+                title=title,
+                url=url,
+                published_at=datetime.fromisoformat(published_at),
+                content_summary=content_summary
+            )
+            if embedding:
+                item.set_embedding_bytes(embedding)
+            items.append(item)
+        return items
+
+    def mark_consumed(self, items: Iterable[NewsItem], edition: str):
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE stories SET consumed_by = ? WHERE id = ?",
+                [(edition, self.story_id(item)) for item in items]
+            )
+
+    def prune(self, older_than: datetime) -> int:
+        """
+        Drops stories ingested before `older_than`. Returns the number removed.
+        """
+        with self.conn:
+            cursor = self.conn.execute("DELETE FROM stories WHERE ingested_at < ?", (older_than.timestamp(),))
+        return cursor.rowcount
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,77 @@
+import html
+import re
+from html.parser import HTMLParser
+from typing import List
+
+# Trailers that feed platforms and publishers append to every entry. They carry no news,
+# and because they repeat across stories they inflate similarity between unrelated items.
+BOILERPLATE_PATTERNS = [
+    r"The post .{1,300}? appeared first on .{1,200}?\.",
+    r"This article was originally published (?:on|at|by) .{1,200}?\.",
+    r"(?:Continue|Keep) reading(?: on [^.]{1,100})?\.{0,3}",
+    r"\bRead (?:more|the full (?:story|article))\b[^.]{0,100}\.{0,3}",
+    r"Click here to (?:subscribe|read more|sign up)[^.]{0,100}\.?",
+    r"Sign up (?:to|for) our (?:free )?newsletter[^.]{0,100}\.?",
+    r"All rights reserved\.?",
+    r"Copyright ©?\s*\d{4}[^.]{0,100}\.?",
+    r"\[(?:…|\.\.\.|&hellip;)\]",
+]
+_BOILERPLATE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# Elements whose text is never article content
+_SKIP_TAGS = {"script", "style", "noscript", "iframe", "svg", "figure", "figcaption", "button", "form"}
+# Elements that end a line of text
+_BLOCK_TAGS = {"p", "div", "br", "li", "ul", "ol", "h1", "h2", "h3", "h4", "h5", "h6",
+               "blockquote", "tr", "table", "section", "article", "header", "footer"}
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def strip_html(text: str) -> str:
+    """
+    Plain text of an HTML fragment, with entities decoded and block elements on their own lines.
+    """
+    if "<" not in text:
+        return html.unescape(text)
+    parser = _TextExtractor()
+    parser.feed(text)
+    parser.close()
+    return "".join(parser.parts)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Cleans feed and transcript text before it is embedded or scripted: strips HTML,
+    removes syndication boilerplate and collapses whitespace.
+    """
+    if not text:
+        return ""
+    text = strip_html(text)
+    text = _BOILERPLATE.sub(" ", text)
+    lines = (re.sub(r"[ \t ]+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
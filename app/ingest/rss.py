@@ -1,54 +1,114 @@
-import feedparser
 import asyncio
+from concurrent.futures import BrokenExecutor
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
+from app.core.config import settings
 from app.ingest.base import BaseSource
+from app.ingest.feed_parser import (
+    FeedEntry, FeedParseError, get_parser_pool, parse_feed, parse_feed_with_feedparser, shutdown_parser_pool
+)
+from app.ingest.watermarks import Watermark, WatermarkStore, recency_cutoff
 from app.models.base import NewsItem
 import logging
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "asx-automation-bot/1.0 (+podcast feed reader)"
+
 class RSSSource(BaseSource):
-    def __init__(self, feed_urls: List[str]):
+    def __init__(
+        self,
+        feed_urls: List[str],
+        backend: str = "fast",
+        watermarks: Optional[WatermarkStore] = None,
+        max_age_hours: Optional[float] = None
+    ):
+        """
+        backend="fast" parses with the streaming parser in a worker process and only uses
+        feedparser for feeds it rejects; backend="feedparser" always uses feedparser.
+        With `watermarks`, entries already taken in by an earlier run are skipped.
+        `max_age_hours` defaults to INGEST_MAX_AGE_HOURS.
+        """
         self.feed_urls = feed_urls
+        self.backend = backend
+        self.watermarks = watermarks
+        self.max_age_hours = max_age_hours
+        self._pending: Dict[str, Watermark] = {}
 
     async def fetch(self) -> List[NewsItem]:
+        import httpx
+
+        # One connection pool for every feed in this pass, fetched concurrently
+        async with httpx.AsyncClient(
+            timeout=20.0,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT}
+        ) as client:
+            results = await asyncio.gather(*(self._fetch_feed(client, url) for url in self.feed_urls))
+
+        return [item for items in results for item in items]
+
+    async def _fetch_feed(self, client: "httpx.AsyncClient", url: str) -> List[NewsItem]:
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            entries = await self._parse(url, response.content)
+        except Exception as e:
+            logger.error(f"Failed to fetch RSS feed {url}: {e}")
+            return []
+
+        key = f"rss:{url}"
+        mark = self.watermarks.get(key) if self.watermarks is not None else Watermark()
+        max_age = self.max_age_hours if self.max_age_hours is not None else settings.INGEST_MAX_AGE_HOURS
+        cutoff = recency_cutoff(max_age)
+
+        fresh = [
+            entry for entry in entries
+            if entry.title and entry.link
+            and not (cutoff and entry.published_at and entry.published_at < cutoff)
+            and mark.admits(entry.guid, entry.published_at)
+        ]
+        if self.watermarks is not None and fresh:
+            self._pending[key] = mark.advance((entry.guid, entry.published_at) for entry in fresh)
+        if len(fresh) < len(entries):
+            logger.info(f"{url}: {len(fresh)} new of {len(entries)} entries (watermark / {max_age:g}h window).")
+
         items: List[NewsItem] = []
-        
-        # feedparser is synchronous, so we run it in a thread if strictly async needed,
-        # but for simple fetching, straightforward iteration is often acceptable in scripts.
-        # Ideally, use asyncio.to_thread for blocking IO.
-        for url in self.feed_urls:
+        for entry in fresh:
+            items.append(NewsItem(
+                source_id=f"rss_{url}",
+                title=entry.title,
+                url=entry.link,
+                # Extract date or default to now
+                published_at=entry.published_at or datetime.now(),
+                content_summary=entry.summary
+            ))
+        return items
+
+    def commit(self):
+        if self.watermarks is not None:
+            self.watermarks.set_many(self._pending)
+        self._pending = {}
+
+    async def _parse(self, url: str, data: bytes) -> List[FeedEntry]:
+        if self.backend == "fast":
             try:
-                # Run the blocking feedparser in a thread
-                feed = await asyncio.to_thread(feedparser.parse, url)
-                
-                if feed.bozo:
-                    logger.warning(f"Error parsing feed {url}: {feed.bozo_exception}")
-                    continue
-
-                for entry in feed.entries:
-                    # Extract date or default to now
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published_at = datetime(*entry.published_parsed[:6])
-                    else:
-                        published_at = datetime.now()
-
-                    # Extract summary or fall back to title
-                    summary = getattr(entry, 'summary', '')
-                    if not summary:
-                        summary = entry.title
-
-                    item = NewsItem(
-                        source_id=f"rss_{url}",
-                        title=entry.title,
-                        url=entry.link,
-                        published_at=published_at,
-                        content_summary=summary
-                    )
-                    items.append(item)
-                    
-            except Exception as e:
-                logger.error(f"Failed to fetch RSS feed {url}: {e}")
+                return await self._parse_fast(url, data)
+            except FeedParseError as e:
+                logger.warning(f"Fast parser rejected feed {url} ({e}); falling back to feedparser.")
 
-        return items
+        # feedparser is synchronous and slow, so keep it off the event loop
+        return await asyncio.to_thread(parse_feed_with_feedparser, data)
+
+    async def _parse_fast(self, url: str, data: bytes) -> List[FeedEntry]:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(get_parser_pool(), parse_feed, data)
+        except BrokenExecutor as e:
+            # A worker died; start a fresh pool next time and parse this feed here
+            logger.warning(f"Feed parser pool failed ({e}); parsing {url} in-process.")
+            shutdown_parser_pool()
+            return await asyncio.to_thread(parse_feed, data)
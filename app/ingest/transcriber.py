@@ -1,13 +1,21 @@
 import os
+import asyncio
 import logging
-from deepgram import DeepgramClient
 from app.core.config import settings
+from app.core.ratelimit import get_limiter
 
 logger = logging.getLogger(__name__)
 
 class DeepgramTranscriber:
     def __init__(self):
-        self.client = DeepgramClient(settings.DEEPGRAM_API_KEY)
+        from deepgram import DeepgramClient, DeepgramClientOptions
+
+        if settings.DEEPGRAM_BASE_URL:
+            options = DeepgramClientOptions(url=settings.DEEPGRAM_BASE_URL)
+            self.client = DeepgramClient(settings.DEEPGRAM_API_KEY, options)
+        else:
+            self.client = DeepgramClient(settings.DEEPGRAM_API_KEY)
+        self.limiter = get_limiter("deepgram")
 
     async def transcribe(self, audio_path: str) -> str:
         """
@@ -33,8 +41,13 @@ class DeepgramTranscriber:
                 "punctuate": True
             }
 
-            # Deepgram SDK v3+ usage
-            response = self.client.listen.rest.v("1").transcribe_file(payload, options)
+            # Deepgram SDK v3+ usage. The SDK call is blocking, so keep it off the event loop.
+            response = await self.limiter.call(
+                asyncio.to_thread,
+                self.client.listen.rest.v("1").transcribe_file,
+                payload,
+                options
+            )
             
             # Extract transcript
             transcript = response.results.channels[0].alternatives[0].transcript
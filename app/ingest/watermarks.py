@@ -0,0 +1,137 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+# GUIDs remembered per source; comfortably more than any feed returns in one response
+MAX_SEEN_GUIDS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS source_watermarks (
+    source_key TEXT PRIMARY KEY,
+    last_guid TEXT,
+    last_published_at TEXT,
+    seen_guids TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def utcnow() -> datetime:
+    """
+    Naive UTC, the convention for published_at across sources.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def recency_cutoff(max_age_hours: float) -> Optional[datetime]:
+    """
+    Oldest publish time still worth ingesting; None when the window is disabled (0).
+    """
+    return utcnow() - timedelta(hours=max_age_hours) if max_age_hours > 0 else None
+
+
+class Watermark(BaseModel):
+    """
+    High-water mark for one source: the newest entry already taken in, plus the recent
+    GUIDs so entries sharing the newest timestamp, or without any date, aren't repeated.
+    """
+    last_guid: Optional[str] = None
+    last_published_at: Optional[datetime] = None
+    seen_guids: List[str] = Field(default_factory=list)
+
+    def admits(self, guid: str, published_at: Optional[datetime]) -> bool:
+        if guid in self.seen_guids:
+            return False
+        if published_at is None or self.last_published_at is None:
+            return True
+        return published_at >= self.last_published_at
+
+    def advance(self, entries: Iterable[Tuple[str, Optional[datetime]]]) -> "Watermark":
+        """
+        The watermark after taking in `entries` (guid, published_at pairs).
+        """
+        entries = list(entries)
+        if not entries:
+            return self
+        last_guid, last_published_at = self.last_guid, self.last_published_at
+        for guid, published_at in entries:
+            if published_at is not None and (last_published_at is None or published_at >= last_published_at):
+                last_guid, last_published_at = guid, published_at
+            elif last_published_at is None:
+                last_guid = guid
+        new_guids = [guid for guid, _ in entries if guid not in self.seen_guids]
+        return Watermark(
+            last_guid=last_guid,
+            last_published_at=last_published_at,
+            seen_guids=(new_guids + self.seen_guids)[:MAX_SEEN_GUIDS]
+        )
+
+
+class WatermarkStore:
+    """
+    Per-source watermarks persisted next to the story inbox. The database is opened on
+    first use, so sources can hold a store without loading settings at construction.
+    """
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                from app.core.config import settings
+                self.path = settings.INBOX_DB_PATH
+            self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, source_key: str) -> Watermark:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT last_guid, last_published_at, seen_guids FROM source_watermarks WHERE source_key = ?",
+                (source_key,)
+            ).fetchone()
+        if row is None:
+            return Watermark()
+        last_guid, last_published_at, seen_guids = row
+        return Watermark(
+            last_guid=last_guid,
+            last_published_at=datetime.fromisoformat(last_published_at) if last_published_at else None,
+            seen_guids=json.loads(seen_guids)
+        )
+
+    def set_many(self, watermarks: Dict[str, Watermark]):
+        if not watermarks:
+            return
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO source_watermarks "
+                "(source_key, last_guid, last_published_at, seen_guids, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        key,
+                        mark.last_guid,
+                        mark.last_published_at.isoformat() if mark.last_published_at else None,
+                        json.dumps(mark.seen_guids),
+                        now,
+                    )
+                    for key, mark in watermarks.items()
+                ]
+            )
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
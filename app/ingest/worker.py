@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List, Tuple
+
+from app.ingest.base import BaseSource
+from app.ingest.inbox import StoryInbox
+from app.models.base import NewsItem
+
+if TYPE_CHECKING:
+    from app.memory.deduplicator import StoryMemory
+
+logger = logging.getLogger(__name__)
+
+
+class IngestWorker:
+    """
+    Polls each source on its own interval, embeds and deduplicates new items as they
+    arrive, and parks the survivors in the StoryInbox for the next edition.
+    """
+    def __init__(
+        self,
+        sources: List[Tuple[BaseSource, float]],
+        memory: "StoryMemory",
+        inbox: StoryInbox,
+        retention_hours: float = 48.0
+    ):
+        self.sources = sources
+        self.memory = memory
+        self.inbox = inbox
+        self.retention = timedelta(hours=retention_hours)
+        # Concurrent admit() batches must not interleave, or two sources could both admit a story
+        self._dedup_lock = asyncio.Lock()
+        self._stop = asyncio.Event()
+
+    async def poll(self, source: BaseSource) -> int:
+        """
+        Fetches one source once. Returns the number of new stories added to the inbox.
+        """
+        name = type(source).__name__
+        try:
+            items = await source.fetch()
+        except Exception as e:
+            logger.error(f"{name} fetch failed: {e}")
+            return 0
+
+        async with self._dedup_lock:
+            try:
+                unique = await self.memory.admit(items)
+            except Exception as e:
+                logger.error(f"{name} deduplication failed: {e}")
+                return 0
+
+            try:
+                added = self.inbox.add(unique)
+            except Exception as e:
+                # admit() already stored them as seen; forget them so the next poll retries
+                # instead of dropping them for good (the watermark hasn't moved either)
+                logger.error(f"{name} inbox write failed: {e}")
+                self.memory.delete_many(unique)
+                return 0
+        source.commit()
+        logger.info(f"📥 {name}: {len(items)} fetched, {len(unique)} unique, {added} new in inbox.")
+        return added
+
+    async def run_once(self) -> int:
+        """
+        Polls every source once, concurrently.
+        """
+        results = await asyncio.gather(*(self.poll(source) for source, _ in self.sources))
+        self.inbox.prune(datetime.now() - self.retention)
+        return sum(results)
+
+    async def _poll_forever(self, source: BaseSource, interval_sec: float):
+        while not self._stop.is_set():
+            await self.poll(source)
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=interval_sec)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run_forever(self):
+        logger.info(f"Ingestion worker started with {len(self.sources)} sources.")
+        tasks = [asyncio.create_task(self._poll_forever(source, interval)) for source, interval in self.sources]
+        try:
+            while not self._stop.is_set():
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=3600)
+                except asyncio.TimeoutError:
+                    removed = self.inbox.prune(datetime.now() - self.retention)
+                    if removed:
+                        logger.info(f"Pruned {removed} stale stories from the inbox.")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        self._stop.set()
@@ -2,19 +2,34 @@ import os
 import glob
 import logging
 import asyncio
-from datetime import datetime
-from typing import List
-import yt_dlp
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+from app.core.config import settings
 from app.ingest.base import BaseSource
+from app.ingest.normalize import normalize_text
 from app.ingest.transcriber import DeepgramTranscriber
+from app.ingest.watermarks import Watermark, WatermarkStore, recency_cutoff
 from app.models.base import NewsItem
 
 logger = logging.getLogger(__name__)
 
 class YouTubeSource(BaseSource):
-    def __init__(self, channel_urls: List[str], transcriber: DeepgramTranscriber):
+    def __init__(
+        self,
+        channel_urls: List[str],
+        transcriber: DeepgramTranscriber,
+        watermarks: Optional[WatermarkStore] = None,
+        max_age_hours: Optional[float] = None
+    ):
+        """
+        With `watermarks`, a channel's latest video is only downloaded and transcribed once.
+        `max_age_hours` defaults to INGEST_MAX_AGE_HOURS.
+        """
         self.channel_urls = channel_urls
         self.transcriber = transcriber
+        self.watermarks = watermarks
+        self.max_age_hours = max_age_hours
+        self._pending: Dict[str, Watermark] = {}
         self.download_path = "./downloads"
         
         if not os.path.exists(self.download_path):
@@ -23,10 +38,25 @@ class YouTubeSource(BaseSource):
     async def fetch(self) -> List[NewsItem]:
         items: List[NewsItem] = []
 
+        max_age = self.max_age_hours if self.max_age_hours is not None else settings.INGEST_MAX_AGE_HOURS
+        cutoff = recency_cutoff(max_age)
+
         for url in self.channel_urls:
             try:
-                # 1. Download Audio
-                audio_file, info = await self._download_latest_audio(url)
+                key = f"youtube:{url}"
+                mark = self.watermarks.get(key) if self.watermarks is not None else Watermark()
+
+                def should_download(video_id: str, published_at: Optional[datetime]) -> bool:
+                    if not mark.admits(video_id, published_at):
+                        logger.info(f"{url}: latest video {video_id} was already ingested.")
+                        return False
+                    if cutoff and published_at and published_at < cutoff:
+                        logger.info(f"{url}: latest video {video_id} is older than {max_age:g}h, skipping.")
+                        return False
+                    return True
+
+                # 1. Download Audio (only if the latest video is new)
+                audio_file, info = await self._download_latest_audio(url, should_download)
                 if not audio_file:
                     continue
 
@@ -39,10 +69,12 @@ class YouTubeSource(BaseSource):
                     source_id=f"youtube_{info['channel_id']}",
                     title=info.get('title', 'Unknown Title'),
                     url=info.get('webpage_url', url),
-                    published_at=datetime.now(), # yt-dlp upload_date is string, using now for simplicity
-                    content_summary=transcript
+                    published_at=self._published_at(info) or datetime.now(),
+                    content_summary=normalize_text(transcript)
                 )
                 items.append(item)
+                if self.watermarks is not None:
+                    self._pending[key] = mark.advance([(info['id'], self._published_at(info))])
 
                 # 4. Cleanup
                 self._cleanup(audio_file)
@@ -52,10 +84,30 @@ class YouTubeSource(BaseSource):
                 
         return items
 
-    async def _download_latest_audio(self, channel_url: str):
+    def commit(self):
+        if self.watermarks is not None:
+            self.watermarks.set_many(self._pending)
+        self._pending = {}
+
+    @staticmethod
+    def _published_at(info: dict) -> Optional[datetime]:
         """
-        Downloads the latest video audio from the channel.
-        Returns tuple (filepath, info_dict).
+        Upload time as naive UTC, like RSS dates.
+        """
+        if info.get('timestamp'):
+            return datetime.fromtimestamp(info['timestamp'], timezone.utc).replace(tzinfo=None)
+        if info.get('upload_date'):
+            return datetime.strptime(info['upload_date'], "%Y%m%d")
+        return None
+
+    async def _download_latest_audio(
+        self,
+        channel_url: str,
+        should_download: Callable[[str, Optional[datetime]], bool] = lambda video_id, published_at: True
+    ):
+        """
+        Downloads the latest video audio from the channel, unless `should_download`
+        rejects it after a metadata-only lookup. Returns tuple (filepath, info_dict).
         """
         ydl_opts = {
             'format': 'bestaudio/best',
@@ -74,15 +126,25 @@ class YouTubeSource(BaseSource):
         try:
             # yt_dlp is synchronous
             def run_yt_dlp():
+                import yt_dlp
+
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    # Extract info first
-                    info = ydl.extract_info(channel_url, download=True)
+                    # Resolve the latest video without downloading anything
+                    info = ydl.extract_info(channel_url, download=False)
                     # Use 'entries' if it's a channel/playlist, otherwise info itself
                     if 'entries' in info:
-                        video_info = info['entries'][0]
+                        entries = list(info['entries'])
+                        if not entries:
+                            return None, None
+                        video_info = entries[0]
                     else:
                         video_info = info
-                    
+
+                    if not should_download(video_info['id'], self._published_at(video_info)):
+                        return None, None
+
+                    # Download using the metadata already resolved
+                    video_info = ydl.process_ie_result(video_info, download=True)
                     filename = ydl.prepare_filename(video_info)
                     # filename ext might differ after postprocessing (mp3)
                     final_filename = os.path.splitext(filename)[0] + ".mp3"
@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+from pydantic import BaseModel
+
+from app.loadtest.mock_servers import FaultProfile, MockProviderSuite, silent_mp3
+
+logger = logging.getLogger(__name__)
+
+SCENARIOS = ["embeddings", "script", "tts", "transcribe", "publish"]
+
+SAMPLE_TEXT = (
+    "The ASX 200 rose 0.6 percent as iron ore miners rallied on stronger Chinese steel demand, "
+    "while the big four banks traded mixed ahead of the RBA minutes."
+)
+
+
+class ScenarioResult(BaseModel):
+    name: str
+    concurrency: int
+    requests: int
+    errors: int
+    elapsed_sec: float
+    latencies_ms: List[float] = []
+    server_requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.elapsed_sec if self.elapsed_sec else 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies_ms:
+            return 0.0
+        ordered = sorted(self.latencies_ms)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class MockServerThread:
+    """
+    Runs a MockProviderSuite on its own event loop so that blocking client calls
+    (boto3, the Deepgram SDK) in the load generator cannot stall the servers.
+    """
+    def __init__(self, suite: MockProviderSuite):
+        self.suite = suite
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="mock-providers", daemon=True)
+        self._ready = threading.Event()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self.suite.start())
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+
+    def stop(self):
+        future = asyncio.run_coroutine_threadsafe(self.suite.stop(), self._loop)
+        future.result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+def _build_scenario(name: str, workdir: str, upload_mb: float) -> Callable[[], Awaitable[None]]:
+    """
+    Builds a zero-argument coroutine factory that drives one real client class.
+    Imports are deferred so the settings pick up the mock base URL overrides.
+    """
+    if name == "embeddings":
+        from app.memory.deduplicator import StoryMemory
+        memory = StoryMemory()
+
+        async def call():
+            await memory.embed_many([SAMPLE_TEXT])
+        return call
+
+    if name == "script":
+        from app.engine.script_writer import ScriptWriter
+        from app.models.base import NewsItem
+        writer = ScriptWriter()
+        items = [NewsItem(
+            source_id="loadtest",
+            title="Miners lift ASX",
+            url="https://example.com/miners",
+            published_at=datetime.now(),
+            content_summary=SAMPLE_TEXT
+        )]
+
+        async def call():
+            await writer.generate_script(items, mode="morning")
+        return call
+
+    if name == "tts":
+        from app.audio.elevenlabs_client import ElevenLabsClient
+        tts_client = ElevenLabsClient()
+
+        async def call():
+            await tts_client.generate_audio(SAMPLE_TEXT, "loadtest-voice")
+        return call
+
+    if name == "transcribe":
+        from app.ingest.transcriber import DeepgramTranscriber
+        transcriber = DeepgramTranscriber()
+        audio_path = os.path.join(workdir, "transcribe_input.mp3")
+        with open(audio_path, "wb") as f:
+            f.write(silent_mp3(30))
+
+        async def call():
+            await transcriber.transcribe(audio_path)
+        return call
+
+    if name == "publish":
+        from app.distribution.publisher import PodcastPublisher
+        publisher = PodcastPublisher()
+        # Large enough to cross boto3's 8 MB multipart threshold by default
+        mp3_path = os.path.join(workdir, "episode_loadtest.mp3")
+        with open(mp3_path, "wb") as f:
+            f.write(silent_mp3(upload_mb * 1024 * 1024 / 16000))
+
+        async def call():
+            await asyncio.to_thread(publisher.update_feed, "Load Test Episode", "Load test.", mp3_path, 0)
+        return call
+
+    raise ValueError(f"Unknown scenario: {name}")
+
+
+async def _drive(call: Callable[[], Awaitable[None]], concurrency: int, duration_sec: float,
+                 result: ScenarioResult):
+    deadline = time.perf_counter() + duration_sec
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                await call()
+                result.requests += 1
+                result.latencies_ms.append((time.perf_counter() - started) * 1000)
+            except Exception as e:
+                result.errors += 1
+                logger.debug(f"{result.name} call failed: {e}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed_sec = time.perf_counter() - started
+
+
+async def run_load(
+    scenarios: List[str],
+    concurrency: int = 8,
+    duration_sec: float = 10.0,
+    faults: Optional[FaultProfile] = None,
+    upload_mb: float = 10.0,
+) -> List[ScenarioResult]:
+    """
+    Starts the mock providers, points the real clients at them and drives each scenario in turn.
+    """
+    suite = MockProviderSuite(faults=faults)
+    server_thread = MockServerThread(suite)
+    server_thread.start()
+
+    results: List[ScenarioResult] = []
+    with tempfile.TemporaryDirectory(prefix="asx-loadtest-") as workdir:
+        os.environ.update(suite.env_overrides())
+        os.environ["CHROMA_DB_PATH"] = os.path.join(workdir, "chroma")
+
+        try:
+            for name in scenarios:
+                call = _build_scenario(name, workdir, upload_mb)
+                before = suite.stats()
+                result = ScenarioResult(
+                    name=name, concurrency=concurrency, requests=0, errors=0, elapsed_sec=0.0
+                )
+                logger.info(f"Running scenario '{name}' (concurrency={concurrency}, {duration_sec}s)")
+                await _drive(call, concurrency, duration_sec, result)
+
+                after = suite.stats()
+                server = _server_for(name)
+                result.server_requests = after[server]["requests"] - before[server]["requests"]
+                result.connections_opened = (
+                    after[server]["connections_opened"] - before[server]["connections_opened"]
+                )
+                results.append(result)
+        finally:
+            server_thread.stop()
+
+    return results
+
+
+def _server_for(scenario: str) -> str:
+    return {
+        "embeddings": "openai",
+        "script": "openai",
+        "tts": "elevenlabs",
+        "transcribe": "deepgram",
+        "publish": "s3",
+    }[scenario]
+
+
+def format_report(results: List[ScenarioResult]) -> str:
+    header = (f"{'scenario':<12}{'conc':>6}{'ok':>8}{'err':>6}{'req/s':>10}"
+              f"{'p50 ms':>10}{'p95 ms':>10}{'http req':>10}{'conns':>8}")
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.name:<12}{r.concurrency:>6}{r.requests:>8}{r.errors:>6}{r.rps:>10.1f}"
+            f"{r.percentile(50):>10.1f}{r.percentile(95):>10.1f}{r.server_requests:>10}{r.connections_opened:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,575 @@
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import random
+import struct
+import time
+import uuid
+from collections import Counter, deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from pydantic import BaseModel
+
+from app.audio.silence import silent_mp3
+
+logger = logging.getLogger(__name__)
+
+_REASONS = {
+    100: "Continue",
+    200: "OK",
+    204: "No Content",
+    206: "Partial Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    429: "Too Many Requests",
+    503: "Service Unavailable",
+}
+
+
+def fake_embedding(text: str, dimensions: int = 1536) -> List[float]:
+    """
+    Deterministic unit vector seeded from the text, so identical inputs embed identically.
+    """
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vector = [rng.gauss(0.0, 1.0) for _ in range(dimensions)]
+    norm = sum(v * v for v in vector) ** 0.5 or 1.0
+    return [v / norm for v in vector]
+
+
+class FaultProfile(BaseModel):
+    """
+    Failure and slowness injected by a mock server before it answers a request.
+    """
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_429_rate: float = 0.0
+    max_rps: Optional[float] = None
+    bandwidth_kbps: Optional[float] = None
+
+
+class MockRequest:
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        parts = urlsplit(target)
+        self.method = method.upper()
+        self.path = unquote(parts.path)
+        self.query = {k: v[0] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> dict:
+        return json.loads(self.body or b"{}")
+
+
+class MockResponse:
+    def __init__(self, status: int = 200, body: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    @classmethod
+    def json(cls, payload, status: int = 200, headers: Optional[Dict[str, str]] = None) -> "MockResponse":
+        merged = {"Content-Type": "application/json"}
+        merged.update(headers or {})
+        return cls(status, json.dumps(payload).encode("utf-8"), merged)
+
+
+class MockServerStats:
+    def __init__(self):
+        self.connections_opened = 0
+        self.connections_active = 0
+        self.requests = 0
+        self.status_counts: Counter = Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "connections_opened": self.connections_opened,
+            "connections_active": self.connections_active,
+            "requests": self.requests,
+            "status_counts": dict(self.status_counts),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class MockProviderServer:
+    """
+    Minimal HTTP/1.1 keep-alive server. Subclasses implement `handle` for one provider API.
+    HTTP/2 is not spoken; clients negotiating h2 over cleartext fall back to HTTP/1.1.
+    """
+    name = "mock"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, faults: Optional[FaultProfile] = None):
+        self.host = host
+        self.port = port
+        self.faults = faults or FaultProfile()
+        self.stats = MockServerStats()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._recent: Deque[float] = deque()
+        self._connections: Set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"{self.name} mock listening on {self.base_url}")
+
+    async def stop(self):
+        if self._server:
+            self._server.close()
+            for task in list(self._connections):
+                task.cancel()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def handle(self, request: MockRequest) -> MockResponse:
+        raise NotImplementedError
+
+    def rate_limited_response(self, retry_after: float) -> MockResponse:
+        return MockResponse.json(
+            {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+            status=429,
+            headers={"Retry-After": f"{retry_after:.3f}"}
+        )
+
+    def rate_limit_headers(self) -> Dict[str, str]:
+        return {}
+
+    # --- Fault injection ---
+
+    def _throttled(self) -> Optional[float]:
+        """
+        Returns a retry-after in seconds if this request exceeds the configured rate.
+        """
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 1.0:
+            self._recent.popleft()
+        if self.faults.max_rps and len(self._recent) >= self.faults.max_rps:
+            return max(0.0, 1.0 - (now - self._recent[0]))
+        self._recent.append(now)
+        if self.faults.error_429_rate and random.random() < self.faults.error_429_rate:
+            return 1.0
+        return None
+
+    async def _inject_latency(self):
+        delay = self.faults.latency_ms
+        if self.faults.jitter_ms:
+            delay += random.uniform(0, self.faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+    # --- HTTP plumbing ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections.add(task)
+        self.stats.connections_opened += 1
+        self.stats.connections_active += 1
+        try:
+            while True:
+                request = await self._read_request(reader, writer)
+                if request is None:
+                    break
+                self.stats.requests += 1
+                self.stats.bytes_in += len(request.body)
+
+                await self._inject_latency()
+                retry_after = self._throttled()
+                if retry_after is not None:
+                    response = self.rate_limited_response(retry_after)
+                else:
+                    try:
+                        response = self.handle(request)
+                    except Exception as e:
+                        logger.error(f"{self.name} mock handler failed: {e}", exc_info=True)
+                        response = MockResponse.json({"error": str(e)}, status=400)
+                    response.headers = {**self.rate_limit_headers(), **response.headers}
+
+                self.stats.status_counts[response.status] += 1
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, request, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(task)
+            self.stats.connections_active -= 1
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[MockRequest]:
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+
+        if headers.get("expect", "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            await writer.drain()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked(reader)
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0) or 0))
+
+        return MockRequest(method, target, headers, body)
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Consume trailers up to the terminating blank line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+
+    async def _write_response(self, writer: asyncio.StreamWriter, request: MockRequest,
+                              response: MockResponse, keep_alive: bool):
+        body = b"" if request.method == "HEAD" else response.body
+        headers = dict(response.headers)
+        headers.setdefault("Content-Length", str(len(response.body)))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+        head = f"HTTP/1.1 {response.status} {_REASONS.get(response.status, 'Unknown')}\r\n"
+        head += "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+        writer.write(head.encode("latin-1"))
+
+        if self.faults.bandwidth_kbps and body:
+            chunk_size = 16 * 1024
+            seconds_per_chunk = chunk_size / (self.faults.bandwidth_kbps * 1024)
+            for offset in range(0, len(body), chunk_size):
+                writer.write(body[offset:offset + chunk_size])
+                await writer.drain()
+                await asyncio.sleep(seconds_per_chunk)
+        else:
+            writer.write(body)
+            await writer.drain()
+        self.stats.bytes_out += len(body)
+
+
+class OpenAIMockServer(MockProviderServer):
+    """
+    Speaks /v1/embeddings and /v1/chat/completions.
+    """
+    name = "openai"
+
+    def rate_limit_headers(self) -> Dict[str, str]:
+        limit = int(self.faults.max_rps or 5000)
+        remaining = max(0, limit - len(self._recent))
+        return {
+            "x-ratelimit-limit-requests": str(limit),
+            "x-ratelimit-remaining-requests": str(remaining),
+            "x-ratelimit-reset-requests": "1s",
+            "x-request-id": uuid.uuid4().hex,
+        }
+
+    def handle(self, request: MockRequest) -> MockResponse:
+        if request.method == "POST" and request.path.endswith("/embeddings"):
+            return self._embeddings(request.json())
+        if request.method == "POST" and request.path.endswith("/chat/completions"):
+            return self._chat(request.json())
+        return MockResponse.json({"error": {"message": f"Unknown route {request.path}"}}, status=404)
+
+    def _embeddings(self, payload: dict) -> MockResponse:
+        inputs = payload.get("input", [])
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        dimensions = payload.get("dimensions", 1536)
+        as_base64 = payload.get("encoding_format") == "base64"
+
+        data = []
+        for index, text in enumerate(inputs):
+            vector = fake_embedding(str(text), dimensions)
+            if as_base64:
+                packed = struct.pack(f"<{len(vector)}f", *vector)
+                embedding = base64.b64encode(packed).decode("ascii")
+            else:
+                embedding = vector
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+
+        tokens = sum(len(str(text).split()) for text in inputs)
+        return MockResponse.json({
+            "object": "list",
+            "data": data,
+            "model": payload.get("model", "text-embedding-3-small"),
+            "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+        })
+
+    def _chat(self, payload: dict) -> MockResponse:
+        script = {
+            "segments": [
+                {"segment_type": "intro", "text": "Markets are steady this morning."},
+                {"segment_type": "market_wrap", "text": "The ASX 200 futures are up 0.3 percent. The Aussie dollar is buying 66 US cents."},
+                {"segment_type": "stock_deepdive", "text": "B-H-P is higher after iron ore rallied overnight in Singapore trade."},
+                {"segment_type": "outro", "text": "That's the briefing."},
+            ]
+        }
+        return MockResponse.json({
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "gpt-4o"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(script)},
+                "logprobs": None,
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 500, "completion_tokens": 120, "total_tokens": 620},
+        })
+
+
+class ElevenLabsMockServer(MockProviderServer):
+    """
+    Speaks POST /v1/text-to-speech/{voice_id}, returning silent MP3 sized to the text,
+    and POST /v1/text-to-speech/{voice_id}/with-timestamps with evenly spaced character timings.
+    """
+    name = "elevenlabs"
+    chars_per_second = 15.0
+
+    def rate_limited_response(self, retry_after: float) -> MockResponse:
+        return MockResponse.json(
+            {"detail": {"status": "too_many_concurrent_requests",
+                        "message": "Too many concurrent requests for your subscription."}},
+            status=429
+        )
+
+    def handle(self, request: MockRequest) -> MockResponse:
+        if request.method != "POST" or not request.path.startswith("/v1/text-to-speech/"):
+            return MockResponse.json({"detail": {"message": "Not found"}}, status=404)
+
+        text = request.json().get("text", "")
+        audio = silent_mp3(len(text) / self.chars_per_second)
+        if request.path.rstrip("/").endswith("/with-timestamps"):
+            step = 1 / self.chars_per_second
+            alignment = {
+                "characters": list(text),
+                "character_start_times_seconds": [round(i * step, 3) for i in range(len(text))],
+                "character_end_times_seconds": [round((i + 1) * step, 3) for i in range(len(text))],
+            }
+            return MockResponse.json({
+                "audio_base64": base64.b64encode(audio).decode("ascii"),
+                "alignment": alignment,
+                "normalized_alignment": alignment,
+            }, headers={"character-cost": str(len(text)), "request-id": uuid.uuid4().hex})
+        return MockResponse(200, audio, {
+            "Content-Type": "audio/mpeg",
+            "character-cost": str(len(text)),
+            "request-id": uuid.uuid4().hex,
+        })
+
+
+class DeepgramMockServer(MockProviderServer):
+    """
+    Speaks POST /v1/listen for pre-recorded audio.
+    """
+    name = "deepgram"
+
+    def handle(self, request: MockRequest) -> MockResponse:
+        if request.method != "POST" or not request.path.startswith("/v1/listen"):
+            return MockResponse.json({"err_code": "NOT_FOUND", "err_msg": "Not found"}, status=404)
+
+        duration = round(len(request.body) / 16000, 3)
+        transcript = "The ASX 200 closed higher today led by the miners. B-H-P gained two percent."
+        request_id = str(uuid.uuid4())
+        return MockResponse.json({
+            "metadata": {
+                "transaction_key": "deprecated",
+                "request_id": request_id,
+                "sha256": hashlib.sha256(request.body).hexdigest(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()),
+                "duration": duration,
+                "channels": 1,
+                "models": [str(uuid.uuid4())],
+                "model_info": {},
+            },
+            "results": {
+                "channels": [{
+                    "alternatives": [{
+                        "transcript": transcript,
+                        "confidence": 0.99,
+                        "words": [],
+                    }]
+                }]
+            },
+        }, headers={"dg-request-id": request_id})
+
+
+class S3MockServer(MockProviderServer):
+    """
+    Path-style S3 subset: object PUT/GET/HEAD/DELETE and multipart uploads.
+    Object bodies are kept in memory.
+    """
+    name = "s3"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+
+    def rate_limited_response(self, retry_after: float) -> MockResponse:
+        return self._error(503, "SlowDown", "Please reduce your request rate.")
+
+    def _error(self, status: int, code: str, message: str) -> MockResponse:
+        body = (f'<?xml version="1.0" encoding="UTF-8"?>\n<Error><Code>{code}</Code>'
+                f'<Message>{message}</Message></Error>').encode("utf-8")
+        return MockResponse(status, body, {"Content-Type": "application/xml"})
+
+    def _xml(self, body: str) -> MockResponse:
+        payload = f'<?xml version="1.0" encoding="UTF-8"?>\n{body}'.encode("utf-8")
+        return MockResponse(200, payload, {"Content-Type": "application/xml"})
+
+    @staticmethod
+    def _etag(data: bytes) -> str:
+        return f'"{hashlib.md5(data).hexdigest()}"'
+
+    @staticmethod
+    def _decode_aws_chunked(body: bytes) -> bytes:
+        """
+        Strips SigV4 streaming / aws-chunked framing: `<hex>[;ext]\\r\\n<data>\\r\\n ... 0\\r\\n<trailers>`.
+        """
+        out = []
+        pos = 0
+        while pos < len(body):
+            line_end = body.index(b"\r\n", pos)
+            size = int(body[pos:line_end].split(b";")[0], 16)
+            if size == 0:
+                break
+            start = line_end + 2
+            out.append(body[start:start + size])
+            pos = start + size + 2
+        return b"".join(out)
+
+    def handle(self, request: MockRequest) -> MockResponse:
+        bucket, _, key = request.path.lstrip("/").partition("/")
+        if not bucket:
+            return self._error(400, "InvalidRequest", "Bucket name missing (use path-style addressing).")
+
+        body = request.body
+        if ("aws-chunked" in request.headers.get("content-encoding", "")
+                or request.headers.get("x-amz-content-sha256", "").startswith("STREAMING-")):
+            body = self._decode_aws_chunked(body)
+
+        if request.method == "POST" and "uploads" in request.query:
+            upload_id = uuid.uuid4().hex
+            self.uploads[upload_id] = {}
+            return self._xml(
+                f"<InitiateMultipartUploadResult><Bucket>{bucket}</Bucket><Key>{key}</Key>"
+                f"<UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+            )
+
+        upload_id = request.query.get("uploadId")
+        if upload_id is not None:
+            if upload_id not in self.uploads:
+                return self._error(404, "NoSuchUpload", "The specified upload does not exist.")
+            if request.method == "PUT":
+                part_number = int(request.query.get("partNumber", "1"))
+                self.uploads[upload_id][part_number] = body
+                return MockResponse(200, b"", {"ETag": self._etag(body)})
+            if request.method == "POST":
+                parts = self.uploads.pop(upload_id)
+                data = b"".join(parts[n] for n in sorted(parts))
+                self.objects[(bucket, key)] = data
+                etag = f'"{hashlib.md5(data).hexdigest()}-{len(parts)}"'
+                return self._xml(
+                    f"<CompleteMultipartUploadResult><Bucket>{bucket}</Bucket><Key>{key}</Key>"
+                    f"<ETag>{etag}</ETag></CompleteMultipartUploadResult>"
+                )
+            if request.method == "DELETE":
+                self.uploads.pop(upload_id, None)
+                return MockResponse(204)
+
+        if request.method == "PUT":
+            self.objects[(bucket, key)] = body
+            return MockResponse(200, b"", {"ETag": self._etag(body)})
+
+        data = self.objects.get((bucket, key))
+        if request.method in ("GET", "HEAD"):
+            if data is None:
+                return self._error(404, "NoSuchKey", "The specified key does not exist.")
+            headers = {
+                "ETag": self._etag(data),
+                "Content-Type": "application/octet-stream",
+                "Accept-Ranges": "bytes",
+                "Last-Modified": time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime()),
+            }
+            byte_range = request.headers.get("range", "")
+            if byte_range.startswith("bytes="):
+                start_str, _, end_str = byte_range[6:].partition("-")
+                start = int(start_str or 0)
+                end = min(int(end_str) if end_str else len(data) - 1, len(data) - 1)
+                if start >= len(data):
+                    return self._error(416, "InvalidRange", "The requested range is not satisfiable.")
+                headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+                return MockResponse(206, data[start:end + 1], headers)
+            return MockResponse(200, data, headers)
+
+        if request.method == "DELETE":
+            self.objects.pop((bucket, key), None)
+            return MockResponse(204)
+
+        return self._error(405, "MethodNotAllowed", f"{request.method} is not supported.")
+
+
+class MockProviderSuite:
+    """
+    Starts all four provider mocks and exposes the env overrides that point the real clients at them.
+    """
+    def __init__(self, host: str = "127.0.0.1", base_port: int = 0, faults: Optional[FaultProfile] = None):
+        def port(offset: int) -> int:
+            return base_port + offset if base_port else 0
+
+        self.openai = OpenAIMockServer(host, port(0), faults)
+        self.elevenlabs = ElevenLabsMockServer(host, port(1), faults)
+        self.deepgram = DeepgramMockServer(host, port(2), faults)
+        self.s3 = S3MockServer(host, port(3), faults)
+        self.servers: List[MockProviderServer] = [self.openai, self.elevenlabs, self.deepgram, self.s3]
+
+    async def start(self):
+        for server in self.servers:
+            await server.start()
+
+    async def stop(self):
+        for server in self.servers:
+            await server.stop()
+
+    def env_overrides(self, bucket: str = "loadtest") -> Dict[str, str]:
+        return {
+            "OPENAI_API_KEY": "sk-mock",
+            "OPENAI_BASE_URL": f"{self.openai.base_url}/v1",
+            "ELEVENLABS_API_KEY": "mock",
+            "ELEVENLABS_BASE_URL": f"{self.elevenlabs.base_url}/v1",
+            "DEEPGRAM_API_KEY": "mock",
+            "DEEPGRAM_BASE_URL": self.deepgram.base_url,
+            "R2_ENDPOINT_URL": self.s3.base_url,
+            "R2_ACCESS_KEY_ID": "mock",
+            "R2_SECRET_ACCESS_KEY": "mock",
+            "R2_BUCKET_NAME": bucket,
+            "R2_PUBLIC_DOMAIN": f"{self.s3.base_url}/{bucket}",
+        }
+
+    def stats(self) -> Dict[str, dict]:
+        return {server.name: server.stats.snapshot() for server in self.servers}
@@ -1 +1,2 @@
-from app.memory.vector_store import VectorStore
\ No newline at end of file
+from app.memory.story_store import StoryStore
+from app.memory.vector_store import VectorStore
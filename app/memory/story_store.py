@@ -0,0 +1,288 @@
+import base64
+import hashlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.ratelimit import get_limiter
+from app.memory.tokens import get_tokenizer
+from app.models.base import EmbeddingBatch, NewsItem
+
+if TYPE_CHECKING:
+    import numpy as np
+    from chromadb.api import ClientAPI
+
+logger = logging.getLogger(__name__)
+
+STORY_COLLECTION = "news_stories"
+# Collections written by the old VectorStore, folded into STORY_COLLECTION by migrate_legacy()
+LEGACY_COLLECTIONS = ["financial_news"]
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Inputs per embeddings request; the API accepts up to 2048
+EMBEDDING_BATCH_SIZE = 256
+# Total tokens per embeddings request; the API rejects requests over 300k
+EMBEDDING_BATCH_TOKENS = 250_000
+# Longer inputs are split into chunks of at most this many tokens (model limit is 8191)
+EMBEDDING_CHUNK_TOKENS = 8000
+# Chunks embedded per text; a transcript beyond this is truncated to its first N tokens
+EMBEDDING_MAX_CHUNKS = 4
+
+_clients: Dict[str, "ClientAPI"] = {}
+_clients_lock = threading.Lock()
+
+
+def get_chroma_client(path: str) -> "ClientAPI":
+    """
+    One PersistentClient per database path for the whole process.
+    """
+    with _clients_lock:
+        if path not in _clients:
+            import chromadb
+            _clients[path] = chromadb.PersistentClient(path=path)
+        return _clients[path]
+
+
+class StoryMatch:
+    def __init__(self, story_id: str, similarity: float, metadata: dict, document: Optional[str]):
+        self.story_id = story_id
+        self.similarity = similarity
+        self.metadata = metadata
+        self.document = document
+
+    @property
+    def title(self) -> str:
+        return self.metadata.get("title", "Unknown")
+
+
+class StoryStore:
+    """
+    The single Chroma-backed store for stories: one client handle, one collection schema
+    (URL-hash IDs, cosine space, source/title/url/published_at metadata) and one batched
+    embedding path. A namespace gives a show its own collection with the same schema.
+    """
+    def __init__(self, namespace: Optional[str] = None):
+        from openai import AsyncOpenAI
+
+        self.chroma_client = get_chroma_client(settings.CHROMA_DB_PATH)
+        self.collection = self.chroma_client.get_or_create_collection(
+            name=f"{STORY_COLLECTION}__{namespace}" if namespace else STORY_COLLECTION,
+            metadata={"hnsw:space": "cosine"}  # Use cosine similarity space
+        )
+        self.openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=settings.OPENAI_BASE_URL,
+            max_retries=0  # Retries and pacing are handled by the shared limiter
+        )
+        self.limiter = get_limiter("openai")
+
+    @staticmethod
+    def story_id(url: str) -> str:
+        return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def story_metadata(item: NewsItem) -> Dict[str, Any]:
+        return {
+            "source_id": item.source_id,
+            "title": item.title,
+            "url": item.url,
+            "published_at": item.published_at.isoformat()
+        }
+
+    # --- Embeddings ---
+
+    async def embed_many(self, texts: List[str]) -> "np.ndarray":
+        """
+        Embeds texts with text-embedding-3-small and returns a (len(texts), dims) float32 matrix.
+        Texts over the model's input limit are split into chunks, all chunks are embedded in
+        as few requests as possible, and each text gets the token-weighted mean of its chunks.
+        """
+        import numpy as np
+
+        tokenizer = get_tokenizer()
+        owners: List[int] = []
+        chunks: List[str] = []
+        weights: List[int] = []
+        for index, text in enumerate(texts):
+            pieces = [text]
+            if tokenizer.count(text) > EMBEDDING_CHUNK_TOKENS:
+                pieces = tokenizer.chunks(text, EMBEDDING_CHUNK_TOKENS, EMBEDDING_MAX_CHUNKS)
+            for piece in pieces:
+                owners.append(index)
+                chunks.append(piece)
+                weights.append(max(1, tokenizer.count(piece)))
+
+        vectors = await self._embed_chunks(chunks, weights)
+        if len(chunks) == len(texts):
+            return vectors
+
+        pooled = np.zeros((len(texts), vectors.shape[1]), dtype=np.float32)
+        np.add.at(pooled, owners, vectors * np.asarray(weights, dtype=np.float32)[:, None])
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        pooled /= np.where(norms == 0, 1, norms)
+        logger.info(f"Embedded {len(texts)} texts as {len(chunks)} chunks.")
+        return pooled
+
+    async def _embed_chunks(self, chunks: List[str], token_counts: List[int]) -> "np.ndarray":
+        """
+        One request per EMBEDDING_BATCH_SIZE inputs or EMBEDDING_BATCH_TOKENS tokens,
+        decoded straight from the base64 payload.
+        """
+        import numpy as np
+
+        batches: List[List[str]] = []
+        batch_tokens = 0
+        for chunk, tokens in zip(chunks, token_counts):
+            if not batches or len(batches[-1]) >= EMBEDDING_BATCH_SIZE or batch_tokens + tokens > EMBEDDING_BATCH_TOKENS:
+                batches.append([])
+                batch_tokens = 0
+            batches[-1].append(chunk)
+            batch_tokens += tokens
+
+        rows: List["np.ndarray"] = []
+        for batch in batches:
+            try:
+                raw_response = await self.limiter.call(
+                    self.openai_client.embeddings.with_raw_response.create,
+                    input=batch,
+                    model=EMBEDDING_MODEL,
+                    encoding_format="base64"  # Packed float32, no JSON float parsing
+                )
+                response = raw_response.parse()
+            except Exception as e:
+                logger.error(f"Failed to generate embeddings: {e}")
+                raise e
+            for d in sorted(response.data, key=lambda d: d.index):
+                rows.append(np.frombuffer(base64.b64decode(d.embedding), dtype=np.float32))
+        return np.stack(rows) if rows else np.empty((0, 0), dtype=np.float32)
+
+    async def ensure_embeddings(self, items: Iterable[NewsItem]):
+        """
+        Fills in missing embeddings for all items with as few requests as possible.
+        """
+        missing = [item for item in items if item.embedding is None]
+        if not missing:
+            return
+        EmbeddingBatch(missing, await self.embed_many([self.embedding_text(item) for item in missing]))
+
+    @staticmethod
+    def embedding_text(item: NewsItem) -> str:
+        """
+        What a story is embedded from: its summary, else its title. Entries with neither
+        fall back to the URL, since one empty input makes the API reject the whole batch.
+        """
+        for text in (item.content_summary, item.title, item.url, item.source_id):
+            if text and text.strip():
+                return text
+        return "untitled"
+
+    # --- Bulk read/write ---
+
+    async def upsert_many(self, items: List[NewsItem]):
+        """
+        Idempotently writes stories keyed by URL; re-sent URLs overwrite instead of failing.
+        """
+        if not items:
+            return
+        await self.ensure_embeddings(items)
+
+        # Chroma rejects duplicate IDs within one call, so the last copy of a URL wins
+        by_id = {self.story_id(item.url): item for item in items}
+        self.collection.upsert(
+            ids=list(by_id),
+            embeddings=EmbeddingBatch.from_items(list(by_id.values())).matrix,
+            documents=[item.content_summary for item in by_id.values()],
+            metadatas=[self.story_metadata(item) for item in by_id.values()]
+        )
+        logger.info(f"Upserted {len(by_id)} stories into '{self.collection.name}'.")
+
+    def delete_many(self, items: List[NewsItem]):
+        """
+        Removes stories by URL, e.g. to undo an upsert whose batch could not be delivered.
+        """
+        if items:
+            self.collection.delete(ids=list({self.story_id(item.url) for item in items}))
+
+    async def query_many(self, items: List[NewsItem], n_results: int = 1) -> List[List[StoryMatch]]:
+        """
+        Nearest stored stories for every item, in a single query.
+        """
+        if not items:
+            return []
+        await self.ensure_embeddings(items)
+        return self.query_vectors(EmbeddingBatch.from_items(items).matrix, n_results=n_results)
+
+    def query_vectors(self, vectors: "np.ndarray", n_results: int = 1) -> List[List[StoryMatch]]:
+        results = self.collection.query(
+            query_embeddings=vectors,
+            n_results=n_results,
+            include=["distances", "metadatas", "documents"]
+        )
+
+        matches: List[List[StoryMatch]] = []
+        for i in range(len(vectors)):
+            row = []
+            for j, story_id in enumerate(results["ids"][i]):
+                # ChromaDB returns 'distances'. For cosine space, distance = 1 - similarity.
+                row.append(StoryMatch(
+                    story_id=story_id,
+                    similarity=1 - results["distances"][i][j],
+                    metadata=results["metadatas"][i][j] or {},
+                    document=results["documents"][i][j]
+                ))
+            matches.append(row)
+        return matches
+
+    async def search(self, query: str, n_results: int = 3) -> List[StoryMatch]:
+        """
+        Free-text semantic search over stored stories.
+        """
+        vectors = await self.embed_many([query])
+        return self.query_vectors(vectors, n_results=n_results)[0]
+
+    # --- Migration ---
+
+    def migrate_legacy(self, page_size: int = 500) -> int:
+        """
+        Copies stories from the old VectorStore collections into this collection's schema
+        (re-keyed by URL hash, cosine space) and drops the old collections.
+        Embeddings are copied as-is, so nothing is re-embedded. Returns the number migrated.
+        """
+        existing = {c if isinstance(c, str) else c.name for c in self.chroma_client.list_collections()}
+        migrated = 0
+        for name in LEGACY_COLLECTIONS:
+            if name not in existing:
+                continue
+            legacy = self.chroma_client.get_collection(name)
+            offset = 0
+            while True:
+                page = legacy.get(include=["embeddings", "documents", "metadatas"], limit=page_size, offset=offset)
+                if not page["ids"]:
+                    break
+                by_id: Dict[str, Tuple[Any, str, dict]] = {}
+                for embedding, document, metadata in zip(page["embeddings"], page["documents"], page["metadatas"]):
+                    metadata = metadata or {}
+                    url = metadata.get("url")
+                    if not url:
+                        continue
+                    by_id[self.story_id(url)] = (embedding, document, {
+                        "source_id": metadata.get("source_id", "unknown"),
+                        "title": metadata.get("title", ""),
+                        "url": url,
+                        "published_at": metadata.get("published_at", "")
+                    })
+                if by_id:
+                    self.collection.upsert(
+                        ids=list(by_id),
+                        embeddings=[v[0] for v in by_id.values()],
+                        documents=[v[1] for v in by_id.values()],
+                        metadatas=[v[2] for v in by_id.values()]
+                    )
+                    migrated += len(by_id)
+                offset += len(page["ids"])
+
+            self.chroma_client.delete_collection(name)
+            logger.info(f"Migrated legacy collection '{name}' into '{self.collection.name}'.")
+        return migrated
+
@@ -0,0 +1,83 @@
+import logging
+import math
+import re
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# text-embedding-3-small uses cl100k_base and accepts at most 8191 tokens per input
+EMBEDDING_ENCODING = "cl100k_base"
+
+# Without tiktoken, assume a token for every 3 characters. Real English text averages
+# closer to 4, so chunks sized on this estimate stay under the model limit.
+_CHARS_PER_TOKEN = 3
+
+
+class Tokenizer:
+    """
+    Counts and splits text in model tokens. Uses tiktoken when it is installed and falls
+    back to a conservative character estimate otherwise.
+    """
+    def __init__(self, encoding: str = EMBEDDING_ENCODING):
+        self._encoding = None
+        try:
+            import tiktoken
+            self._encoding = tiktoken.get_encoding(encoding)
+        except Exception as e:
+            # ImportError, or the BPE file could not be downloaded
+            logger.info(f"tiktoken unavailable ({e}); estimating token counts from text length.")
+
+    @property
+    def exact(self) -> bool:
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+    def chunks(self, text: str, max_tokens: int, max_chunks: Optional[int] = None) -> List[str]:
+        """
+        Splits text into consecutive pieces of at most max_tokens tokens. With max_chunks,
+        anything past the first max_chunks pieces is dropped (first-N-tokens truncation).
+        """
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            limit = len(tokens) if max_chunks is None else max_chunks * max_tokens
+            return [
+                self._encoding.decode(tokens[start:start + max_tokens])
+                for start in range(0, min(len(tokens), limit), max_tokens)
+            ] or [text]
+
+        # Estimated path: split on whitespace so words stay intact
+        max_chars = max_tokens * _CHARS_PER_TOKEN
+        pieces: List[str] = []
+        current: List[str] = []
+        size = 0
+        for word in re.findall(r"\S+\s*", text):
+            if size + len(word) > max_chars and current:
+                pieces.append("".join(current).strip())
+                if max_chunks is not None and len(pieces) >= max_chunks:
+                    return pieces
+                current, size = [], 0
+            # A single word longer than a chunk (e.g. a data URI) is hard-split
+            while len(word) > max_chars:
+                pieces.append(word[:max_chars])
+                if max_chunks is not None and len(pieces) >= max_chunks:
+                    return pieces
+                word = word[max_chars:]
+            current.append(word)
+            size += len(word)
+        if current or not pieces:
+            pieces.append("".join(current).strip())
+        return pieces
+
+
+_tokenizer: Optional[Tokenizer] = None
+
+
+def get_tokenizer() -> Tokenizer:
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = Tokenizer()
+    return _tokenizer
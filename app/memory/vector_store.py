@@ -1,42 +1,34 @@
-import chromadb
-from chromadb.utils import embedding_functions
-from app.core.config import settings
+import asyncio
+from typing import List, Optional
+from app.memory.story_store import StoryStore
 from app.models.base import NewsItem
-from typing import List
 
 class VectorStore:
+    """
+    Kept for existing callers, with the old synchronous signatures and Chroma's raw query
+    results; stories now live in the shared StoryStore collection. It wraps a StoryStore
+    rather than subclassing it, so its blocking methods never stand in for the async ones.
+    Async code should use StoryStore directly.
+    Run `python run_ingest.py --migrate` once to move data out of the old 'financial_news' collection.
+    """
     def __init__(self):
-        self.client = chromadb.PersistentClient(path=settings.CHROMA_DB_PATH)
-        self.openai_ef = embedding_functions.OpenAIEmbeddingFunction(
-            api_key=settings.OPENAI_API_KEY,
-            model_name="text-embedding-3-small"
-        )
-        self.collection = self.client.get_or_create_collection(
-            name="financial_news",
-            embedding_function=self.openai_ef
-        )
+        self.store = StoryStore()
+        self.client = self.store.chroma_client
+        self.collection = self.store.collection
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _run(self, coro):
+        # One loop for the store's lifetime: the OpenAI client's connections are bound to it
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
 
     def add_news_items(self, items: List[NewsItem]):
-        ids = [f"{item.source_id}_{item.published_at.timestamp()}" for item in items]
-        documents = [item.content_summary for item in items]
-        metadatas = [
-            {
-                "source_id": item.source_id,
-                "title": item.title,
-                "url": item.url,
-                "published_at": item.published_at.isoformat()
-            }
-            for item in items
-        ]
-        
-        self.collection.add(
-            ids=ids,
-            documents=documents,
-            metadatas=metadatas
-        )
+        self._run(self.store.upsert_many(items))
 
-    def search(self, query: str, n_results: int = 3):
-        return self.collection.query(
-            query_texts=[query],
-            n_results=n_results
-        )
+    def search(self, query: str, n_results: int = 3) -> dict:
+        """
+        Chroma's query result dict ('ids', 'documents', 'metadatas', 'distances'), as before.
+        """
+        vectors = self._run(self.store.embed_many([query]))
+        return self.collection.query(query_embeddings=vectors, n_results=n_results)
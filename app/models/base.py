@@ -1,7 +1,10 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+from pydantic import BaseModel, Field, PrivateAttr
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class NewsItem(BaseModel):
     source_id: str = Field(..., description="Unique identifier for the source, e.g., 'youtube_rask'")
@@ -9,7 +12,61 @@ class NewsItem(BaseModel):
     url: str
     published_at: datetime
     content_summary: str = Field(..., description="The raw text or transcript")
-    embedding: Optional[List[float]] = Field(default=None, description="Vector embedding for the content")
+    tickers: List[str] = Field(default_factory=list, description="ASX codes mentioned, most mentioned first")
+    # Vector embedding for the content: a float32 array kept outside validation and model dumps
+    _embedding: Optional["np.ndarray"] = PrivateAttr(default=None)
+
+    @property
+    def embedding(self) -> Optional["np.ndarray"]:
+        return self._embedding
+
+    @embedding.setter
+    def embedding(self, value: Any):
+        if value is None:
+            self._embedding = None
+            return
+        import numpy as np
+        # No copy when handed a float32 array or a row of an EmbeddingBatch
+        self._embedding = np.asarray(value, dtype=np.float32)
+
+    def embedding_bytes(self) -> Optional[bytes]:
+        return None if self._embedding is None else self._embedding.tobytes()
+
+    def set_embedding_bytes(self, data: bytes):
+        import numpy as np
+        self._embedding = np.frombuffer(data, dtype=np.float32)
+
+class EmbeddingBatch:
+    """
+    Embeddings for many NewsItems in one contiguous float32 matrix. Each item's
+    embedding is a view of its row, so there is one allocation per batch, not per item.
+    """
+    def __init__(self, items: Sequence[NewsItem], matrix: "np.ndarray"):
+        if len(items) != len(matrix):
+            raise ValueError(f"{len(items)} items but {len(matrix)} embeddings")
+        self.items = list(items)
+        self.matrix = matrix
+        for item, row in zip(self.items, matrix):
+            item.embedding = row
+
+    @classmethod
+    def from_items(cls, items: Sequence[NewsItem]) -> "EmbeddingBatch":
+        """
+        Packs already-embedded items into one matrix (copies once, then rebinds the items).
+        """
+        import numpy as np
+        return cls(items, np.stack([item.embedding for item in items]) if items else np.empty((0, 0), np.float32))
+
+    def normalized(self) -> "np.ndarray":
+        """
+        Unit-length rows, so a matrix product gives cosine similarities.
+        """
+        import numpy as np
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        return self.matrix / np.where(norms == 0, 1, norms)
+
+    def __len__(self) -> int:
+        return len(self.items)
 
 class SegmentType(str, Enum):
     INTRO = "intro"
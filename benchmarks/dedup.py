@@ -0,0 +1,259 @@
+"""
+Deduplication benchmark: threshold quality on labelled story pairs, and Chroma latency as
+the story collection grows.
+
+Quality: benchmarks/fixtures/dedup_pairs.jsonl holds pairs of stories labelled duplicate
+(same event, different outlet or wording) or not (same company or topic, different event).
+Each pair is scored by cosine similarity, as StoryMemory does, and a threshold sweep reports
+precision, recall and F1, marking the current DUPLICATE_THRESHOLD and the best-F1 threshold.
+Embeddings come from benchmarks/fixtures/dedup_embeddings.npz, written once by --build with
+the production embedding path (StoryStore.embed_many), so later runs need no network. Without
+that file (or with texts it doesn't cover) the quality run stops with an error: a threshold
+is only meaningful for the model that will use it.
+
+Latency: fills a throwaway collection with the production schema (cosine space, 1536 dims)
+with synthetic unit vectors and, at each --sizes checkpoint, times one ingest poll's upsert,
+a single-story query (is_duplicate) and a batched query (admit). Filling 100k stories
+takes several minutes; pass smaller --sizes for a quick run.
+
+    python benchmarks/dedup.py
+    python benchmarks/dedup.py --build              # needs OPENAI_API_KEY
+    python benchmarks/dedup.py --sizes 1000,10000,100000 --queries 200
+    python benchmarks/dedup.py --skip-latency
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from app.ingest.normalize import normalize_text  # noqa: E402
+from app.memory.deduplicator import DUPLICATE_THRESHOLD, StoryMemory  # noqa: E402
+from app.memory.story_store import EMBEDDING_MODEL, STORY_COLLECTION, get_chroma_client  # noqa: E402
+
+FIXTURES_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures")
+PAIRS_PATH = os.path.join(FIXTURES_DIR, "dedup_pairs.jsonl")
+EMBEDDINGS_PATH = os.path.join(FIXTURES_DIR, "dedup_embeddings.npz")
+
+DIMS = 1536
+# Stories per ingest poll, and per admit() query
+POLL_BATCH = 100
+
+
+def load_pairs(path: str = PAIRS_PATH) -> List[dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def story_text(story: dict) -> str:
+    """
+    What StoryMemory embeds: the normalised summary, falling back to the title.
+    """
+    return normalize_text(story.get("text", "")) or story["title"]
+
+
+def text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# --- Embeddings ---
+
+def build_embeddings(pairs: List[dict], path: str = EMBEDDINGS_PATH):
+    """
+    Embeds every distinct text in the corpus through StoryStore.embed_many and saves the
+    vectors keyed by text hash, so edits to the corpus only invalidate the changed rows.
+    """
+    texts = sorted({story_text(pair[side]) for pair in pairs for side in ("a", "b")})
+    vectors = asyncio.run(StoryMemory().embed_many(texts))
+    np.savez(
+        path,
+        keys=np.array([text_key(text) for text in texts]),
+        vectors=vectors.astype(np.float32),
+        model=np.array(EMBEDDING_MODEL)
+    )
+    print(f"Saved {len(texts)} embeddings ({EMBEDDING_MODEL}) to {os.path.relpath(path, REPO_ROOT)}")
+
+
+def load_embeddings(path: str = EMBEDDINGS_PATH) -> Tuple[Dict[str, np.ndarray], str]:
+    data = np.load(path)
+    return dict(zip(data["keys"].tolist(), data["vectors"])), str(data["model"])
+
+
+def pair_similarities(pairs: List[dict], embeddings: Dict[str, np.ndarray]) -> np.ndarray:
+    def unit(story: dict) -> np.ndarray:
+        vector = embeddings[text_key(story_text(story))]
+        return vector / np.linalg.norm(vector)
+
+    return np.array([float(unit(pair["a"]) @ unit(pair["b"])) for pair in pairs])
+
+
+# --- Quality ---
+
+def sweep(similarities: np.ndarray, labels: np.ndarray, thresholds: np.ndarray) -> List[Tuple[float, float, float, float]]:
+    """
+    (threshold, precision, recall, f1) with "duplicate" meaning similarity > threshold,
+    the comparison StoryMemory uses.
+    """
+    rows = []
+    for threshold in thresholds:
+        predicted = similarities > threshold
+        tp = int(np.sum(predicted & labels))
+        fp = int(np.sum(predicted & ~labels))
+        fn = int(np.sum(~predicted & labels))
+        precision = tp / (tp + fp) if tp + fp else 1.0
+        recall = tp / (tp + fn) if tp + fn else 1.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        rows.append((float(threshold), precision, recall, f1))
+    return rows
+
+
+def report_quality(pairs: List[dict], embeddings: Dict[str, np.ndarray], step: float):
+    labels = np.array([bool(pair["duplicate"]) for pair in pairs])
+    similarities = pair_similarities(pairs, embeddings)
+    current = DUPLICATE_THRESHOLD
+
+    # From just below the least similar pair, so the sweep covers every cut that changes a label
+    low = max(0.0, np.floor(similarities.min() / step) * step)
+    thresholds = np.round(np.arange(low, 0.99 + 1e-9, step), 4)
+    if not np.any(np.isclose(thresholds, current)):
+        thresholds = np.sort(np.append(thresholds, current))
+    rows = sweep(similarities, labels, thresholds)
+    best = max(rows, key=lambda row: (row[3], row[0]))
+
+    print(f"{len(pairs)} pairs ({int(labels.sum())} duplicate, {int((~labels).sum())} distinct)")
+    print(f"similarity  duplicates: min {similarities[labels].min():.3f}  median {np.median(similarities[labels]):.3f}")
+    print(f"            distinct:   max {similarities[~labels].max():.3f}  median {np.median(similarities[~labels]):.3f}")
+    print()
+    print(f"{'threshold':>9} {'precision':>10} {'recall':>8} {'f1':>7}")
+    for threshold, precision, recall, f1 in rows:
+        marks = []
+        if np.isclose(threshold, current):
+            marks.append("current")
+        if threshold == best[0]:
+            marks.append("best f1")
+        print(f"{threshold:>9.2f} {precision:>10.3f} {recall:>8.3f} {f1:>7.3f}  {', '.join(marks)}")
+
+    misses = [
+        (pair["id"], "missed duplicate" if pair["duplicate"] else "false duplicate", sim, pair["a"]["title"])
+        for pair, sim in zip(pairs, similarities)
+        if (sim > current) != bool(pair["duplicate"])
+    ]
+    if misses:
+        print(f"\nMisclassified at {current:.2f}:")
+        for pair_id, kind, sim, title in misses:
+            print(f"  {pair_id} {kind:<16} {sim:.3f}  {title}")
+
+
+# --- Latency ---
+
+def unit_vectors(rng: np.random.Generator, n: int, dims: int) -> np.ndarray:
+    vectors = rng.standard_normal((n, dims), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def percentile_ms(timings: List[float], q: float) -> float:
+    return float(np.percentile(timings, q)) * 1000
+
+
+def report_latency(sizes: List[int], queries: int, dims: int):
+    rng = np.random.default_rng(0)
+    path = tempfile.mkdtemp(prefix="dedup_bench_")
+    try:
+        collection = get_chroma_client(path).get_or_create_collection(
+            name=STORY_COLLECTION, metadata={"hnsw:space": "cosine"}
+        )
+
+        def insert(start: int, count: int):
+            collection.upsert(
+                ids=[f"s{i}" for i in range(start, start + count)],
+                embeddings=unit_vectors(rng, count, dims),
+                metadatas=[{"source_id": "bench", "title": f"story {i}"} for i in range(start, start + count)]
+            )
+
+        print(f"{'stories':>8} {'fill s':>7} {'upsert/poll ms':>15} {'query p50':>10} {'query p95':>10} "
+              f"{'admit p50':>10} {'admit p95':>10}")
+        stored = 0
+        for size in sorted(sizes):
+            fill_start = time.perf_counter()
+            while stored < size:
+                count = min(1000, size - stored)
+                insert(stored, count)
+                stored += count
+            fill = time.perf_counter() - fill_start
+
+            # One ingest poll's worth of new stories
+            upsert_timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                insert(stored, POLL_BATCH)
+                upsert_timings.append(time.perf_counter() - start)
+                stored += POLL_BATCH
+
+            single, batched = [], []
+            for _ in range(queries):
+                vector = unit_vectors(rng, 1, dims)
+                start = time.perf_counter()
+                collection.query(query_embeddings=vector, n_results=1, include=["distances", "metadatas", "documents"])
+                single.append(time.perf_counter() - start)
+            for _ in range(max(1, queries // 10)):
+                vectors = unit_vectors(rng, POLL_BATCH, dims)
+                start = time.perf_counter()
+                collection.query(query_embeddings=vectors, n_results=1, include=["distances", "metadatas", "documents"])
+                batched.append(time.perf_counter() - start)
+
+            print(f"{size:>8,} {fill:>7.1f} {statistics.median(upsert_timings) * 1000:>15.1f} "
+                  f"{percentile_ms(single, 50):>10.2f} {percentile_ms(single, 95):>10.2f} "
+                  f"{percentile_ms(batched, 50):>10.2f} {percentile_ms(batched, 95):>10.2f}")
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dedup threshold quality and Chroma latency by collection size")
+    parser.add_argument("--pairs", default=PAIRS_PATH, help="Labelled pairs (JSONL)")
+    parser.add_argument("--embeddings", default=EMBEDDINGS_PATH, help="Precomputed embeddings (.npz)")
+    parser.add_argument("--build", action="store_true", help="Embed the corpus with the OpenAI API and save it")
+    parser.add_argument("--step", type=float, default=0.02, help="Threshold sweep step")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Collection sizes to time, comma-separated")
+    parser.add_argument("--queries", type=int, default=100, help="Single-story queries per size")
+    parser.add_argument("--dims", type=int, default=DIMS, help="Vector dimensions for the latency run")
+    parser.add_argument("--skip-quality", action="store_true")
+    parser.add_argument("--skip-latency", action="store_true")
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.pairs)
+    if args.build:
+        build_embeddings(pairs, args.embeddings)
+
+    if not args.skip_quality:
+        if not os.path.exists(args.embeddings):
+            sys.exit(
+                f"No precomputed embeddings at {os.path.relpath(args.embeddings, REPO_ROOT)}; "
+                "run with --build (needs OPENAI_API_KEY) or pass --skip-quality"
+            )
+        embeddings, model = load_embeddings(args.embeddings)
+        texts = {story_text(pair[side]) for pair in pairs for side in ("a", "b")}
+        missing = [text for text in texts if text_key(text) not in embeddings]
+        if missing:
+            sys.exit(f"{len(missing)} corpus texts have no saved embedding; rerun with --build")
+        print(f"Quality ({model}, precomputed)")
+        report_quality(pairs, embeddings, args.step)
+
+    if not args.skip_latency:
+        print(f"\nLatency ({args.dims} dims, cosine, {POLL_BATCH} stories per poll/admit)")
+        report_latency([int(size) for size in args.sizes.split(",") if size], args.queries, args.dims)
+
+
+if __name__ == "__main__":
+    main()
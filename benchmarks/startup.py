@@ -0,0 +1,103 @@
+"""
+Cold-start benchmark for the CLI entry points.
+
+Runs `python -X importtime` for each entry point in a clean subprocess (no API keys in the
+environment) and reports the cumulative import time, the heaviest top-level imports, and any
+provider SDK that was loaded eagerly. Exits non-zero when an entry point breaks its budget.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget-ms 250 --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTRY_POINTS = ["main", "serve", "dry_run", "run_ingest", "load_test"]
+
+# Provider SDKs that must only be imported when a provider is first used
+HEAVY_MODULES = ["chromadb", "boto3", "botocore", "openai", "deepgram", "yt_dlp",
+                 "feedgen", "feedparser", "httpx", "numpy"]
+
+
+def _clean_env() -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items()
+           if not k.endswith(("_API_KEY", "_ACCESS_KEY_ID", "_SECRET_ACCESS_KEY")) and not k.startswith("R2_")}
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def measure_imports(module: str) -> Tuple[int, List[Tuple[int, str]], List[str]]:
+    """
+    Returns (total_us, direct imports sorted by cumulative us, eagerly loaded heavy modules).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, env=_clean_env(), capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    total = 0
+    direct: List[Tuple[int, str]] = []
+    loaded = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        package = name.strip()
+        loaded.add(package.split(".")[0])
+        # importtime indents each nesting level by two spaces after the separator
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 0 and package == module:
+            total = int(cumulative)
+        elif depth == 1:
+            direct.append((int(cumulative), package))
+
+    heavy = [m for m in HEAVY_MODULES if m in loaded]
+    return total, sorted(direct, reverse=True), heavy
+
+
+def measure_wall(args: List[str], runs: int) -> float:
+    """
+    Median wall-clock milliseconds for a full interpreter start running `args`.
+    """
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=REPO_ROOT, env=_clean_env(), capture_output=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import-time budget for the CLI entry points")
+    parser.add_argument("--budget-ms", type=float, default=300.0, help="Max cumulative import time per entry point")
+    parser.add_argument("--runs", type=int, default=3, help="Wall-clock runs of `main.py --help`")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest imports to list per entry point")
+    args = parser.parse_args()
+
+    failed = False
+    for entry in ENTRY_POINTS:
+        total_us, top_level, heavy = measure_imports(entry)
+        total_ms = total_us / 1000
+        status = "OK" if total_ms <= args.budget_ms and not heavy else "OVER BUDGET"
+        failed = failed or status != "OK"
+
+        print(f"{entry:<12} {total_ms:8.1f} ms  [{status}]")
+        for us, name in top_level[:args.top]:
+            print(f"    {us / 1000:8.1f} ms  {name}")
+        if heavy:
+            print(f"    eagerly imported: {', '.join(heavy)}")
+
+    print(f"\n`main.py --help` wall time (median of {args.runs}): {measure_wall(['main.py', '--help'], args.runs):.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import asyncio
+import argparse
+import logging
+import sys
+
+from app.loadtest.mock_servers import FaultProfile, MockProviderSuite
+from app.loadtest.load_generator import SCENARIOS, format_report, run_load
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("LoadTest")
+
+async def serve(base_port: int, faults: FaultProfile):
+    suite = MockProviderSuite(base_port=base_port, faults=faults)
+    await suite.start()
+
+    print("Mock providers running. Point the pipeline at them with:")
+    for key, value in suite.env_overrides().items():
+        print(f"  export {key}={value}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await suite.stop()
+
+def parse_faults(args) -> FaultProfile:
+    return FaultProfile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_429_rate=args.error_rate,
+        max_rps=args.max_rps,
+        bandwidth_kbps=args.bandwidth_kbps
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local provider mocks and load generator")
+    parser.add_argument("command", choices=["serve", "run"], help="'serve' runs the mocks, 'run' drives the real clients against them")
+    parser.add_argument("--base-port", type=int, default=8100, help="First port for 'serve' (openai, elevenlabs, deepgram, s3)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios for 'run'")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--upload-mb", type=float, default=10.0, help="Episode size for the publish scenario")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--max-rps", type=float, default=None, help="Per-provider request rate before throttling")
+    parser.add_argument("--bandwidth-kbps", type=float, default=None, help="Response bandwidth cap")
+    args = parser.parse_args()
+
+    faults = parse_faults(args)
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.base_port, faults))
+        except KeyboardInterrupt:
+            pass
+    else:
+        scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+        results = asyncio.run(run_load(
+            scenarios,
+            concurrency=args.concurrency,
+            duration_sec=args.duration,
+            faults=faults,
+            upload_mb=args.upload_mb
+        ))
+        print(format_report(results))
@@ -1,20 +1,25 @@
 import asyncio
 import argparse
+import json
 import logging
 import os
 import sys
 import shutil
-from datetime import datetime
-from typing import List
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
+from app.core.clients import ClientPool
+from app.core.config import settings
+from app.core.deadline import Deadline, StageTimeout, run_stage
+from app.engine.entities import TickerIndex
+from app.engine.script_writer import headline_script
+from app.engine.shows import SHOWS, ShowConfig
+from app.ingest.base import BaseSource
 from app.ingest.rss import RSSSource
+from app.ingest.worker import IngestWorker
 from app.ingest.youtube import YouTubeSource
-from app.ingest.transcriber import DeepgramTranscriber
-from app.memory.deduplicator import StoryMemory
-from app.engine.script_writer import ScriptWriter
-from app.audio.elevenlabs_client import ElevenLabsClient
-from app.audio.mixer import AudioMixer
-from app.distribution.publisher import PodcastPublisher
 from app.models.base import NewsItem
 
 # Configure Logging
@@ -25,135 +30,490 @@ logging.basicConfig(
 )
 logger = logging.getLogger("Orchestrator")
 
-async def run_pipeline(mode: str):
+# --- Sources ---
+# In a real app, these would come from config/env
+RSS_FEEDS = [
+    "https://www.raskmedia.com.au/feed/",
+    "https://www.fool.com.au/feed/"
+]
+YOUTUBE_CHANNELS = [
+    "https://www.youtube.com/@RaskAustralia"
+]
+
+# Hardcoded Voice ID (Replace with your preferred voice ID)
+# Example: "JBFqnCBsd6RMkjVDRZzb" (George)
+VOICE_ID = "JBFqnCBsd6RMkjVDRZzb"
+
+# Pre-rendered bulletin aired when a deadline run can't synthesize a single segment in time
+STANDBY_PATH = "assets/standby.mp3"
+# Under a deadline, synthesis is spread over at least this many requests, so running out
+# of time loses the batch in flight rather than the whole script
+DEADLINE_TTS_BATCHES = 4
+# How long past the mix budget an abandoned ffmpeg mix may run before it is killed
+MIX_KILL_GRACE_SEC = 5.0
+
+# Rendered by --preview when no script file is given
+SAMPLE_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "data", "sample_script.json")
+
+def build_sources(clients: ClientPool) -> Tuple[RSSSource, YouTubeSource]:
+    """
+    The configured sources. Both keep per-feed watermarks, so each fetch only returns
+    entries newer than what was already taken in.
+    """
+    return (
+        RSSSource(RSS_FEEDS, watermarks=clients.watermarks),
+        YouTubeSource(YOUTUBE_CHANNELS, clients.transcriber, watermarks=clients.watermarks),
+    )
+
+async def ingest_news(
+    sources: List[BaseSource],
+    timeout: Optional[float] = None
+) -> Tuple[List[NewsItem], List[BaseSource]]:
+    """
+    Fetches every source concurrently. Sources still running after `timeout` seconds are
+    cancelled and left out. Returns the items and the sources that finished.
+    """
+    # Run fetchers concurrently
+    tasks = [asyncio.create_task(source.fetch()) for source in sources]
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        # Let the cancellations land, so no task is left to be destroyed while pending
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    # Flatten results
+    finished = [(source, task.result()) for source, task in zip(sources, tasks) if task in done]
+    return [item for _, items in finished for item in items], [source for source, _ in finished]
+
+def edition_deadline(mode: str) -> Optional[Deadline]:
+    """
+    The configured publish-by time for an edition, or None when deadline mode is off.
+    """
+    at = {"morning": settings.MORNING_DEADLINE_AT, "afternoon": settings.AFTERNOON_DEADLINE_AT}.get(mode)
+    return Deadline.at_clock(at, settings.SCHEDULE_TIMEZONE) if at else None
+
+def build_ingest_worker(clients: ClientPool, sources: Optional[List[Tuple[BaseSource, float]]] = None) -> IngestWorker:
+    """
+    Background worker polling the configured sources into the story inbox.
+    """
+    if sources is None:
+        rss_source, yt_source = build_sources(clients)
+        sources = [
+            (rss_source, settings.RSS_POLL_INTERVAL_SEC),
+            (yt_source, settings.YOUTUBE_POLL_INTERVAL_SEC),
+        ]
+    return IngestWorker(sources, clients.memory, clients.inbox)
+
+async def deduplicate(items: List[NewsItem], clients: ClientPool) -> List[NewsItem]:
+    """
+    Drops stories already covered and remembers the rest.
+    """
+    # One embeddings request, one query and one upsert for the whole batch
+    return await clients.memory.admit(items)
+
+def rank_stories(stories: List[NewsItem]) -> List[NewsItem]:
+    """
+    Tags stories with the ASX codes they mention and orders them by index weight,
+    keeping stories about the same stock together. Shows cap their story count on this order.
+    """
+    index = TickerIndex()
+    index.add(stories)
+    ranked = index.rank(stories)
+    if index.tickers():
+        top = sorted(index.tickers(), key=index.code_weight, reverse=True)[:5]
+        logger.info(f"🏷  {len(index.tickers())} tickers across {len(stories)} stories; leading: {', '.join(top)}")
+    return ranked
+
+def select_from_inbox(clients: ClientPool) -> List[NewsItem]:
+    since = datetime.now() - timedelta(hours=settings.INGEST_WINDOW_HOURS)
+    unique_news = clients.inbox.select_window(since)
+    logger.info(f"📥 Selected {len(unique_news)} pre-processed stories from the inbox.")
+    return unique_news
+
+async def gather_stories(
+    clients: ClientPool,
+    from_inbox: bool = False,
+    deadline: Optional[Deadline] = None
+) -> Tuple[List[NewsItem], List[BaseSource]]:
+    """
+    Steps 1-2: the unique stories for this run, either fetched and deduplicated now
+    or pre-processed by the background ingestion worker. With a deadline, sources that
+    are still fetching when ingestion's budget runs out are dropped.
+    Also returns the sources whose stories skipped dedup for time; pass them to
+    remember_aired() once the episode is out.
+    """
+    if from_inbox:
+        # --- Steps 1-2: Pre-processed stories from the ingestion worker ---
+        logger.info("--- Step 1-2: Story Selection (Inbox) ---")
+        return rank_stories(select_from_inbox(clients)), []
+
+    # --- Step 1: Ingest ---
+    logger.info("--- Step 1: Ingestion ---")
+    sources = build_sources(clients)
+    timeout = deadline.time_for("ingest") if deadline else None
+    all_news, fetched = await ingest_news(sources, timeout)
+    logger.info(f"📥 Ingested {len(all_news)} new items.")
+
+    late = [source for source in sources if source not in fetched]
+    for source in late:
+        # Its watermark doesn't move, so the next run picks these entries up
+        deadline.degrade("ingest", f"dropped {type(source).__name__}, still fetching after {timeout:.0f}s")
+
+    if not all_news:
+        if late:
+            deadline.degrade("ingest", "no live stories in time; falling back to the ingestion inbox")
+            return rank_stories(select_from_inbox(clients)), []
+        logger.warning("No news items found.")
+        return [], []
+
+    # --- Step 2: Deduplicate ---
+    logger.info("--- Step 2: Deduplication ---")
+    try:
+        unique_news = await run_stage(deadline, "dedup", deduplicate(all_news, clients))
+    except StageTimeout:
+        # Stored and committed by remember_aired() after publishing, off the critical path
+        deadline.degrade("dedup", f"story memory too slow; using all {len(all_news)} fetched items undeduplicated")
+        return rank_stories(all_news), fetched
+    logger.info(f"📉 Reduced to {len(unique_news)} unique stories.")
+
+    # Everything fetched is now in story memory; move the source watermarks past it
+    for source in fetched:
+        source.commit()
+    return rank_stories(unique_news), []
+
+async def remember_aired(stories: List[NewsItem], sources: List[BaseSource], clients: ClientPool):
+    """
+    Stores stories that aired without deduplication and only then moves their sources'
+    watermarks, so the next edition neither fetches nor airs them again.
+    """
+    if not sources:
+        return
+    try:
+        await clients.memory.upsert_many(stories)
+    except Exception as e:
+        # Watermarks stay put: the next run refetches these and deduplicates them properly
+        logger.error(f"Could not store {len(stories)} undeduplicated stories: {e}")
+        return
+    for source in sources:
+        source.commit()
+    logger.info(f"Stored {len(stories)} stories that aired without deduplication.")
+
+def with_stings(audio_paths: List[str]) -> List[str]:
+    """
+    The episode's files in play order: intro/outro assets (if they exist) around the segments.
+    """
+    final_segments = []
+    if os.path.exists("assets/intro.mp3"):
+        final_segments.append("assets/intro.mp3")
+
+    final_segments.extend(audio_paths)
+
+    if os.path.exists("assets/outro.mp3"):
+        final_segments.append("assets/outro.mp3")
+    return final_segments
+
+async def produce_episode(
+    show: ShowConfig,
+    stories: List[NewsItem],
+    clients: ClientPool,
+    temp_audio_dir: str,
+    output_filename: str,
+    deadline: Optional[Deadline] = None
+) -> Optional[str]:
+    """
+    Steps 3-6 for one show: script, synthesis, mixing and publishing.
+    Returns the feed URL, or None if the show had nothing new to cover.
+    With a deadline, the show is condensed to the time left and slow stages fall back
+    to cheaper output instead of failing the edition.
+    """
+    tag = f"[{show.key}]"
+
+    # Per-show selection and dedup against what this show has already aired.
+    # Embeddings from the shared dedup pass are reused, so this costs no extra API calls.
+    stories = show.select(stories)
+
+    if deadline is not None:
+        pressure = deadline.pressure("script", "tts")
+        if pressure < 1.0:
+            # Sized from this show's own stories, not everything gathered
+            show = show.condensed(pressure, len(stories))
+            stories = stories[:show.max_stories]
+            deadline.degrade(
+                "script",
+                f"{tag} {pressure:.0%} of the usual time left; capping at {show.max_stories} stories, "
+                f"~{show.target_seconds}s with short deep dives"
+            )
+
+    if show.memory_namespace:
+        stories = await clients.show_memory(show.memory_namespace).admit(stories)
+
+    if not stories:
+        logger.warning(f"{tag} No unique stories to report. Skipping.")
+        return None
+
+    if not os.path.exists(temp_audio_dir):
+        os.makedirs(temp_audio_dir)
+
+    # --- Step 3: Script ---
+    logger.info(f"--- {tag} Step 3: Script Generation ({len(stories)} stories) ---")
+    writer = clients.writer
+    try:
+        segments = await run_stage(deadline, "script", writer.generate_script(stories, show=show))
+    except StageTimeout:
+        deadline.degrade("script", f"{tag} script writer ran out of time; reading the headlines instead")
+        segments = headline_script(stories, show)
+    
+    logger.info(f"📝 {tag} Generated {len(segments)} script segments.")
+    for i, seg in enumerate(segments):
+        logger.info(f"  [{i+1}] {seg.segment_type}: {seg.text[:50]}...")
+
+    # --- Step 4: Audio Synthesis ---
+    logger.info(f"--- {tag} Step 4: Audio Synthesis ---")
+    tts_client = clients.tts
+
+    # Consecutive segments share requests; each segment still gets its own file (segment.audio_path)
+    min_batches = DEADLINE_TTS_BATCHES if deadline is not None else 1
+    try:
+        audio_paths = await run_stage(
+            deadline, "tts", tts_client.synthesize_segments(segments, VOICE_ID, temp_audio_dir, min_batches=min_batches)
+        )
+    except StageTimeout:
+        # Batches finish in script order, so what exists is the start of the episode
+        audio_paths = [seg.audio_path for seg in segments if seg.audio_path and os.path.exists(seg.audio_path)]
+        if audio_paths:
+            deadline.degrade("tts", f"{tag} synthesis ran out of time; keeping {len(audio_paths)}/{len(segments)} segments")
+        elif os.path.exists(STANDBY_PATH):
+            deadline.degrade("tts", f"{tag} no segment synthesized in time; airing the standby bulletin")
+            audio_paths = [STANDBY_PATH]
+        else:
+            raise
+
+    # --- Step 5: Mixing ---
+    logger.info(f"--- {tag} Step 5: Audio Mixing ---")
+    mixer = clients.mixer
+    
+    final_segments = with_stings(audio_paths)
+
+    normalize = True
+    if deadline is not None and deadline.pressure("mix") < 0.5:
+        normalize = False
+        deadline.degrade("mix", f"{tag} skipping loudness normalisation")
+
+    # ffmpeg blocks, so mix off the event loop to let other shows progress. The stage can't
+    # stop the thread, so ffmpeg gets its own timeout just past the budget to kill a mix
+    # that was given up on.
+    mix_timeout = deadline.time_for("mix") + MIX_KILL_GRACE_SEC if deadline is not None else None
+    try:
+        final_mp3_path = await run_stage(deadline, "mix", asyncio.to_thread(
+            mixer.mix_episode, final_segments, output_filename, normalize=normalize, timeout=mix_timeout
+        ))
+    except StageTimeout:
+        if not normalize:
+            raise
+        deadline.degrade("mix", f"{tag} loudness normalisation ran out of time; mixing without it")
+        final_mp3_path = await asyncio.to_thread(mixer.mix_episode, final_segments, output_filename, normalize=False)
+
+    # --- Step 6: Distribution ---
+    logger.info(f"--- {tag} Step 6: Distribution ---")
+    publisher = clients.publisher
+    
+    # Calculate approximate duration (optional, or use ffmpeg to get it)
+    # For MVP we pass 0 or a dummy value if we don't probe the file
+    upload = asyncio.ensure_future(asyncio.to_thread(
+        publisher.update_feed,
+        episode_title=show.title,
+        episode_summary=f"Automated market update covering {len(stories)} stories.",
+        mp3_path=final_mp3_path,
+        duration_sec=0,
+        feed_file=show.feed_file,
+        feed_title=show.feed_title
+    ))
+    try:
+        # Shielded: a half-finished upload can't be taken back, and a late episode beats none
+        feed_url = await run_stage(deadline, "publish", asyncio.shield(upload))
+    except StageTimeout:
+        deadline.degrade("publish", f"{tag} upload overran its budget; the episode will be late")
+        feed_url = await upload
+    
+    logger.info(f"🎉 {tag} SUCCESS! Episode published at: {feed_url}")
+    return feed_url
+
+async def run_pipeline(
+    mode: str,
+    clients: Optional[ClientPool] = None,
+    from_inbox: bool = False,
+    deadline: Optional[Deadline] = None
+) -> Optional[str]:
+    """
+    Produces and publishes one edition. Returns the feed URL, or None if nothing was published.
+    Pass a long-lived ClientPool to reuse warm clients across runs. With from_inbox, stories
+    come pre-processed from the background ingestion worker instead of being fetched here.
+    With a deadline, each stage is time-boxed and degrades rather than making the edition late.
+    """
+    owns_clients = clients is None
+    if owns_clients:
+        clients = ClientPool()
+
     logger.info(f"🚀 Starting Podcast Automation Pipeline - Mode: {mode.upper()}")
     
     # --- Configuration ---
-    # In a real app, these would come from config/env
-    RSS_FEEDS = [
-        "https://www.raskmedia.com.au/feed/",
-        "https://www.fool.com.au/feed/"
-    ]
-    YOUTUBE_CHANNELS = [
-        "https://www.youtube.com/@RaskAustralia" 
-    ]
     TEMP_AUDIO_DIR = "temp_audio_segments"
     OUTPUT_FILENAME = f"episode_{datetime.now().strftime('%Y%m%d_%H%M')}.mp3"
-    
-    if not os.path.exists(TEMP_AUDIO_DIR):
-        os.makedirs(TEMP_AUDIO_DIR)
 
     try:
-        # --- Step 1: Ingest ---
-        logger.info("--- Step 1: Ingestion ---")
-        transcriber = DeepgramTranscriber()
-        rss_source = RSSSource(RSS_FEEDS)
-        yt_source = YouTubeSource(YOUTUBE_CHANNELS, transcriber)
-
-        # Run fetchers concurrently
-        results = await asyncio.gather(
-            rss_source.fetch(),
-            yt_source.fetch()
-        )
-        
-        # Flatten results
-        all_news: List[NewsItem] = [item for sublist in results for item in sublist]
-        logger.info(f"📥 Ingested {len(all_news)} total items.")
-
-        if not all_news:
-            logger.warning("No news items found. Aborting.")
-            return
-
-        # --- Step 2: Deduplicate ---
-        logger.info("--- Step 2: Deduplication ---")
-        memory = StoryMemory()
-        unique_news: List[NewsItem] = []
-        
-        for item in all_news:
-            is_dup = await memory.is_duplicate(item)
-            if not is_dup:
-                unique_news.append(item)
-                await memory.add_story(item) # Add to memory so it's not repeated tomorrow
-            else:
-                logger.info(f"Skipping duplicate: {item.title}")
-
-        logger.info(f"📉 Reduced to {len(unique_news)} unique stories.")
-        
+        unique_news, unremembered = await gather_stories(clients, from_inbox, deadline)
         if not unique_news:
             logger.warning("No unique stories to report. Aborting.")
-            return
-
-        # --- Step 3: Script ---
-        logger.info("--- Step 3: Script Generation ---")
-        writer = ScriptWriter()
-        segments = await writer.generate_script(unique_news, mode=mode)
-        
-        logger.info(f"📝 Generated {len(segments)} script segments.")
-        for i, seg in enumerate(segments):
-            logger.info(f"  [{i+1}] {seg.segment_type}: {seg.text[:50]}...")
-
-        # --- Step 4: Audio Synthesis ---
-        logger.info("--- Step 4: Audio Synthesis ---")
-        tts_client = ElevenLabsClient()
-        audio_paths = []
-        
-        # Hardcoded Voice ID (Replace with your preferred voice ID)
-        # Example: "JBFqnCBsd6RMkjVDRZzb" (George)
-        VOICE_ID = "JBFqnCBsd6RMkjVDRZzb" 
-
-        for i, segment in enumerate(segments):
-            logger.info(f"Synthesizing segment {i+1}/{len(segments)}...")
-            audio_bytes = await tts_client.generate_audio(segment.text, VOICE_ID)
-            
-            filename = f"{TEMP_AUDIO_DIR}/seg_{i}_{segment.segment_type}.mp3"
-            with open(filename, "wb") as f:
-                f.write(audio_bytes)
-            
-            audio_paths.append(filename)
-            segment.audio_path = filename # Update model
-
-        # --- Step 5: Mixing ---
-        logger.info("--- Step 5: Audio Mixing ---")
-        mixer = AudioMixer()
-        
-        # Add intro/outro assets if they exist
-        final_segments = []
-        if os.path.exists("assets/intro.mp3"):
-            final_segments.append("assets/intro.mp3")
-        
-        final_segments.extend(audio_paths)
-        
-        if os.path.exists("assets/outro.mp3"):
-            final_segments.append("assets/outro.mp3")
-
-        final_mp3_path = mixer.mix_episode(final_segments, OUTPUT_FILENAME)
-
-        # --- Step 6: Distribution ---
-        logger.info("--- Step 6: Distribution ---")
-        publisher = PodcastPublisher()
-        
-        # Calculate approximate duration (optional, or use ffmpeg to get it)
-        # For MVP we pass 0 or a dummy value if we don't probe the file
-        feed_url = publisher.update_feed(
-            episode_title=f"Market Update - {mode.title()} Edition",
-            episode_summary=f"Automated market update covering {len(unique_news)} stories.",
-            mp3_path=final_mp3_path,
-            duration_sec=0 
-        )
-        
-        logger.info(f"🎉 SUCCESS! Episode published at: {feed_url}")
+            return None
+
+        feed_url = await produce_episode(SHOWS[mode], unique_news, clients, TEMP_AUDIO_DIR, OUTPUT_FILENAME, deadline)
+
+        if feed_url:
+            await remember_aired(unique_news, unremembered, clients)
+        if feed_url and from_inbox:
+            clients.inbox.mark_consumed(unique_news, edition=f"{mode}_{datetime.now():%Y%m%d}")
+        return feed_url
 
     except Exception as e:
         logger.error(f"❌ Pipeline failed: {e}", exc_info=True)
+        return None
     finally:
+        if deadline is not None:
+            deadline.report()
+        if owns_clients:
+            await clients.aclose()
         # Cleanup temp audio
         if os.path.exists(TEMP_AUDIO_DIR):
             shutil.rmtree(TEMP_AUDIO_DIR)
             logger.info("Cleaned up temp files.")
 
+async def run_preview(mode: str, script_path: str = SAMPLE_SCRIPT_PATH, backend: Optional[str] = None) -> str:
+    """
+    Renders a script (the writer's JSON format) with the offline TTS backend and the real
+    mixer, then logs segment timings and the loudness of the result. Nothing is fetched,
+    no paid API is called and nothing is published. Returns the local MP3 path.
+    """
+    from app.audio.local_tts import LocalTTSClient
+    from app.audio.mixer import AudioMixer
+    from app.engine.script_writer import ScriptOutput
+
+    with open(script_path, encoding="utf-8") as f:
+        segments = ScriptOutput(**json.load(f)).segments
+    tts = LocalTTSClient(backend)
+    mixer = AudioMixer()
+    output_filename = f"preview_{mode}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
+    logger.info(f"🎧 Preview: {len(segments)} segments from {script_path}, voiced by {tts.backend}")
+
+    temp_audio_dir = tempfile.mkdtemp(prefix="preview_")
+    try:
+        start = time.perf_counter()
+        # The production voice; local backends ignore it and use their own
+        audio_paths = await tts.synthesize_segments(segments, VOICE_ID, temp_audio_dir)
+        rendered = time.perf_counter() - start
+
+        offset = 0.0
+        for segment, path in zip(segments, audio_paths):
+            duration = mixer.duration(path)
+            logger.info(f"  {offset:7.1f}s  {duration:6.1f}s  {segment.segment_type.value:<15} {segment.text[:40]}...")
+            offset += duration
+
+        start = time.perf_counter()
+        await asyncio.to_thread(mixer.mix_episode, with_stings(audio_paths), output_filename)
+        mixed = time.perf_counter() - start
+
+        stats = mixer.measure(output_filename)
+        logger.info(
+            f"🎧 {output_filename}: {stats.duration_sec:.1f}s, {stats.integrated_lufs:.1f} LUFS, "
+            f"true peak {stats.true_peak_db:.1f} dBTP, LRA {stats.loudness_range:.1f} LU "
+            f"(rendered in {rendered * 1000:.0f} ms, mixed in {mixed * 1000:.0f} ms)"
+        )
+        return output_filename
+    finally:
+        shutil.rmtree(temp_audio_dir, ignore_errors=True)
+
+async def run_shows(
+    show_keys: List[str],
+    clients: Optional[ClientPool] = None,
+    from_inbox: bool = False,
+    deadline: Optional[Deadline] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Ingests and deduplicates once, then produces every requested show concurrently.
+    Returns each show's feed URL (None where the show was skipped or failed).
+    All shows share one deadline.
+    """
+    owns_clients = clients is None
+    if owns_clients:
+        clients = ClientPool()
+
+    shows = [SHOWS[key] for key in show_keys]
+    logger.info(f"🚀 Starting multi-show run: {', '.join(show_keys)}")
+
+    stamp = datetime.now().strftime('%Y%m%d_%H%M')
+    temp_dirs = {show.key: f"temp_audio_segments_{show.key}" for show in shows}
+
+    try:
+        unique_news, unremembered = await gather_stories(clients, from_inbox, deadline)
+        if not unique_news:
+            logger.warning("No unique stories to report. Aborting.")
+            return {show.key: None for show in shows}
+
+        results = await asyncio.gather(
+            *(
+                produce_episode(
+                    show, unique_news, clients, temp_dirs[show.key], f"episode_{show.key}_{stamp}.mp3", deadline
+                )
+                for show in shows
+            ),
+            return_exceptions=True
+        )
+
+        feed_urls: Dict[str, Optional[str]] = {}
+        for show, result in zip(shows, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ [{show.key}] Show failed: {result}", exc_info=result)
+                feed_urls[show.key] = None
+            else:
+                feed_urls[show.key] = result
+
+        if any(feed_urls.values()):
+            await remember_aired(unique_news, unremembered, clients)
+        if from_inbox and any(feed_urls.values()):
+            clients.inbox.mark_consumed(unique_news, edition=f"multi_{stamp}")
+        return feed_urls
+    finally:
+        if deadline is not None:
+            deadline.report()
+        if owns_clients:
+            await clients.aclose()
+        for temp_dir in temp_dirs.values():
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir)
+        logger.info("Cleaned up temp files.")
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Voice AI Agent Pipeline")
     parser.add_argument("--mode", choices=["morning", "afternoon"], default="morning", help="Pipeline mode")
+    parser.add_argument("--from-inbox", action="store_true", help="Use stories pre-processed by the ingestion worker")
+    parser.add_argument("--shows", help=f"Comma-separated shows to fan out from one ingest pass ({', '.join(SHOWS)})")
+    parser.add_argument("--deadline", help="Publish by HH:MM (schedule timezone) or +MIN from now; "
+                                           "defaults to the edition's configured deadline")
+    parser.add_argument("--preview", nargs="?", const=SAMPLE_SCRIPT_PATH, metavar="SCRIPT_JSON",
+                        help="Render a script locally with offline TTS and the real mixer; nothing is published")
+    parser.add_argument("--preview-backend", choices=["piper", "espeak-ng", "espeak", "tone"],
+                        help="Offline voice for --preview (default: best available)")
     args = parser.parse_args()
 
-    asyncio.run(run_pipeline(args.mode))
+    deadline = Deadline.parse(args.deadline, settings.SCHEDULE_TIMEZONE) if args.deadline else None
+
+    if args.preview:
+        asyncio.run(run_preview(args.mode, args.preview, args.preview_backend))
+    elif args.shows:
+        show_keys = [key.strip() for key in args.shows.split(",") if key.strip()]
+        unknown = [key for key in show_keys if key not in SHOWS]
+        if unknown:
+            parser.error(f"Unknown shows: {', '.join(unknown)}")
+        asyncio.run(run_shows(show_keys, from_inbox=args.from_inbox, deadline=deadline))
+    else:
+        asyncio.run(run_pipeline(args.mode, from_inbox=args.from_inbox, deadline=deadline or edition_deadline(args.mode)))
@@ -1,25 +1,42 @@
 import asyncio
+import argparse
+import signal
+
+from app.core.clients import ClientPool
 from app.ingest.mock_source import MockFinanceSource
-from app.memory.vector_store import VectorStore
+from main import build_ingest_worker
+
+async def main(once: bool, mock: bool, migrate: bool):
+    clients = ClientPool()
+    if migrate:
+        migrated = clients.memory.migrate_legacy()
+        print(f"✅ Migrated {migrated} stories from the legacy vector store.")
+        return
 
-async def main():
-    print("🚀 Starting mock ingestion...")
-    
-    # 1. Fetch data from source
-    source = MockFinanceSource()
-    news_items = await source.fetch()
-    print(f"📥 Fetched {len(news_items)} items.")
+    print("🚀 Starting ingestion worker...")
 
-    # 2. Store in Vector DB
-    print("💾 Storing in ChromaDB...")
-    store = VectorStore()
-    store.add_news_items(news_items)
-    print("✅ Storage complete.")
+    # --mock swaps the real feeds for the canned source, polled every minute
+    sources = [(MockFinanceSource(), 60.0)] if mock else None
+    worker = build_ingest_worker(clients, sources)
 
-    # 3. Verify with a search
-    print("🔍 Testing search...")
-    results = store.search("lithium mining outlook")
-    print(f"Result: {results['documents'][0][0]}")
+    try:
+        if once:
+            added = await worker.run_once()
+            print(f"✅ Added {added} new stories to the inbox.")
+        else:
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, worker.stop)
+            await worker.run_forever()
+            print("✅ Ingestion worker stopped.")
+    finally:
+        await clients.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Continuous ingestion into the story inbox")
+    parser.add_argument("--once", action="store_true", help="Poll every source once and exit")
+    parser.add_argument("--mock", action="store_true", help="Use the mock finance source instead of live feeds")
+    parser.add_argument("--migrate", action="store_true", help="Move stories from the old 'financial_news' collection and exit")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.once, args.mock, args.migrate))
@@ -0,0 +1,70 @@
+import asyncio
+import argparse
+import json
+import logging
+import signal
+import sys
+from typing import Optional
+
+from app.core.config import ControlSettings, settings
+from app.daemon.control import send_command
+from app.daemon.scheduler import EditionScheduler, parse_clock
+from app.daemon.service import EditionService
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger("Daemon")
+
+async def run_daemon(with_ingest: bool, socket_path: Optional[str] = None):
+    from main import build_ingest_worker, edition_deadline, run_pipeline
+
+    scheduler = EditionScheduler(
+        editions=[
+            ("morning", parse_clock(settings.MORNING_EDITION_AT)),
+            ("afternoon", parse_clock(settings.AFTERNOON_EDITION_AT)),
+        ],
+        timezone=settings.SCHEDULE_TIMEZONE,
+        trading_days_only=settings.SCHEDULE_TRADING_DAYS_ONLY
+    )
+    service = EditionService(
+        run_edition=lambda mode, clients: run_pipeline(
+            mode, clients=clients, from_inbox=with_ingest, deadline=edition_deadline(mode)
+        ),
+        scheduler=scheduler,
+        socket_path=socket_path or settings.CONTROL_SOCKET_PATH
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, service.request_stop)
+
+    if with_ingest:
+        # Ingestion runs all day in-process; editions only pick stories from the inbox
+        service.ingest_worker = build_ingest_worker(service.clients)
+
+    logger.info("🛰  Podcast daemon starting.")
+    await service.serve()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident podcast daemon with an internal edition schedule")
+    parser.add_argument("command", nargs="?", default="start", choices=["start", "run", "status", "shutdown"],
+                        help="'start' runs the daemon; the others talk to a running daemon")
+    parser.add_argument("--mode", choices=["morning", "afternoon"], default="morning", help="Edition for 'run'")
+    parser.add_argument("--with-ingest", action="store_true", help="Also run the background ingestion worker")
+    parser.add_argument("--socket", help="Control socket path (default: CONTROL_SOCKET_PATH)")
+    args = parser.parse_args()
+
+    if args.command == "start":
+        asyncio.run(run_daemon(args.with_ingest, args.socket))
+    else:
+        payload = {"command": args.command}
+        if args.command == "run":
+            payload["mode"] = args.mode
+        # Only the socket path is needed here, so don't load (and validate) the full Settings
+        socket_path = args.socket or ControlSettings().CONTROL_SOCKET_PATH
+        response = asyncio.run(send_command(socket_path, payload))
+        print(json.dumps(response, indent=2))
+        sys.exit(0 if response.get("ok") else 1)
@@ -0,0 +1,7 @@
+import os
+
+# Settings requires provider credentials; the tests never reach a real provider
+for _key in ("OPENAI_API_KEY", "DEEPGRAM_API_KEY", "ELEVENLABS_API_KEY",
+             "R2_ENDPOINT_URL", "R2_ACCESS_KEY_ID", "R2_SECRET_ACCESS_KEY",
+             "R2_BUCKET_NAME", "R2_PUBLIC_DOMAIN"):
+    os.environ.setdefault(_key, "test")
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core import deadline as deadline_module
+from app.core.deadline import STAGE_BUDGETS, Deadline, StageBudget, StageTimeout, run_stage
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(deadline_module.time, "monotonic", clock)
+    return clock
+
+
+def deadline_in(seconds: float, budgets=None) -> Deadline:
+    deadline = Deadline(datetime.now().astimezone() + timedelta(seconds=seconds), budgets)
+    # Pin the remaining time exactly, free of the instant between now() and monotonic()
+    deadline._end = deadline_module.time.monotonic() + seconds
+    return deadline
+
+
+def test_on_schedule_every_stage_gets_its_nominal_budget(clock):
+    total = sum(budget.nominal_sec for budget in STAGE_BUDGETS.values())
+    deadline = deadline_in(total)
+    assert deadline.time_for("ingest") == STAGE_BUDGETS["ingest"].nominal_sec
+    assert deadline.pressure("ingest") == 1.0
+
+    # Ingest finishing early hands its slack to dedup
+    clock.now += 100
+    assert deadline.time_for("dedup") == STAGE_BUDGETS["ingest"].nominal_sec - 100 + STAGE_BUDGETS["dedup"].nominal_sec
+
+
+def test_late_run_squeezes_early_stages_first(clock):
+    deadline = deadline_in(200)
+    assert deadline.time_for("ingest") == STAGE_BUDGETS["ingest"].floor_sec
+    assert deadline.time_for("mix") == 200 - STAGE_BUDGETS["publish"].nominal_sec
+    assert deadline.time_for("publish") == 200
+
+
+def test_floor_applies_after_the_deadline(clock):
+    deadline = deadline_in(-60)
+    for stage, budget in STAGE_BUDGETS.items():
+        assert deadline.time_for(stage) == budget.floor_sec
+    assert deadline.pressure("script") == 0.0
+
+
+def test_pressure_is_fraction_of_nominal_time(clock):
+    budgets = {"script": StageBudget(100.0, 10.0), "tts": StageBudget(100.0, 10.0), "mix": StageBudget(50.0, 10.0)}
+    deadline = deadline_in(150, budgets)
+    assert deadline.pressure("script") == 0.0
+    assert deadline.pressure("tts") == 1.0
+    assert deadline.pressure("script", "tts") == 0.5
+    clock.now -= 1000
+    assert deadline.pressure("script", "tts") == 1.0
+
+
+def test_degrade_records_decisions(clock):
+    deadline = deadline_in(60)
+    deadline.degrade("mix", "skipped loudness normalisation")
+    assert deadline.decisions == ["mix: skipped loudness normalisation"]
+
+
+def test_parse_relative_deadline():
+    deadline = Deadline.parse("+20", "Australia/Sydney")
+    assert 20 * 60 - 5 < deadline.remaining() <= 20 * 60
+
+
+FAST = {"work": StageBudget(0.05, 0.05)}
+
+
+def test_run_stage_without_deadline_just_awaits():
+    async def work():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    assert asyncio.run(run_stage(None, "work", work())) == "done"
+
+
+def test_run_stage_cancels_overrunning_stage():
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(StageTimeout) as excinfo:
+        asyncio.run(run_stage(deadline_in(0, FAST), "work", slow()))
+    assert excinfo.value.stage == "work"
+    assert cancelled == [True]
+
+
+def test_run_stage_passes_inner_timeouts_through():
+    async def provider_timeout():
+        raise asyncio.TimeoutError("read timed out")
+
+    with pytest.raises(asyncio.TimeoutError) as excinfo:
+        asyncio.run(run_stage(deadline_in(60, FAST), "work", provider_timeout()))
+    assert not isinstance(excinfo.value, StageTimeout)
+
+
+def test_run_stage_returns_result_within_budget():
+    async def quick():
+        return 42
+
+    assert asyncio.run(run_stage(deadline_in(60, FAST), "work", quick())) == 42
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from app.audio.elevenlabs_client import BATCH_SEPARATOR, AlignmentError, ElevenLabsClient
+from app.models.base import ScriptSegment, SegmentType
+
+
+def segments(*lengths: int):
+    return [ScriptSegment(segment_type=SegmentType.MARKET_WRAP, text="x" * n) for n in lengths]
+
+
+def alignment_for(texts, step: float = 0.1) -> dict:
+    """
+    Evenly spaced character timings, as the mock ElevenLabs server returns them.
+    """
+    count = len(BATCH_SEPARATOR.join(texts))
+    return {
+        "character_start_times_seconds": [i * step for i in range(count)],
+        "character_end_times_seconds": [(i + 1) * step for i in range(count)],
+    }
+
+
+@pytest.fixture
+def client():
+    client = ElevenLabsClient()
+    client.batch_chars = 100
+    return client
+
+
+def test_pack_fills_batches_up_to_the_limit(client):
+    # 40 + 2 + 40 = 82 fits, adding another 2 + 40 does not
+    assert client._pack(segments(40, 40, 40)) == [2, 1]
+    assert client._pack(segments(49, 49)) == [2]
+    assert client._pack(segments(49, 50)) == [1, 1]
+
+
+def test_pack_gives_oversized_segments_their_own_batch(client):
+    assert client._pack(segments(10, 150, 10, 10)) == [1, 1, 2]
+    assert client._pack([]) == []
+
+
+def test_pack_with_smaller_limit(client):
+    assert client._pack(segments(40, 40, 40), limit=50) == [1, 1, 1]
+    assert client._pack(segments(10, 10, 10, 10), limit=22) == [2, 2]
+
+
+def test_cut_points_fall_between_segments():
+    texts = ["abc", "de", "f"]
+    cuts = ElevenLabsClient._cut_points(texts, alignment_for(texts))
+    # "c" ends at 0.3 and "d" starts at 0.5 (after the separator); "e" ends at 0.7, "f" starts at 0.9
+    assert cuts == pytest.approx([0.4, 0.8])
+    assert ElevenLabsClient._cut_points(["solo"], alignment_for(["solo"])) == []
+
+
+def test_cut_points_reject_misaligned_timestamps():
+    texts = ["abc", "de"]
+    short = alignment_for(["abc", "d"])
+    with pytest.raises(AlignmentError):
+        ElevenLabsClient._cut_points(texts, short)
+    with pytest.raises(AlignmentError):
+        ElevenLabsClient._cut_points(texts, {})
+
+
+def test_cut_points_reject_non_increasing_boundaries():
+    texts = ["ab", "cd", "ef"]
+    flat = {
+        "character_start_times_seconds": [0.0] * 10,
+        "character_end_times_seconds": [0.0] * 10,
+    }
+    with pytest.raises(AlignmentError):
+        ElevenLabsClient._cut_points(texts, flat)
+
+
+class RecordingClient(ElevenLabsClient):
+    """
+    Records requests instead of calling the API; alignment fails for batches of `bad_size`.
+    """
+    def __init__(self, bad_size: int = 0):
+        super().__init__()
+        self.batch_chars = 100
+        self.bad_size = bad_size
+        self.batches = []
+        self.singles = []
+
+    async def _synthesize_batch(self, batch, voice_id, paths):
+        if len(batch) == self.bad_size:
+            raise AlignmentError("mismatch")
+        self.batches.append(len(batch))
+
+    async def generate_audio(self, text, voice_id):
+        self.singles.append(text)
+        return b"mp3"
+
+
+def test_min_batches_spreads_the_script(tmp_path):
+    client = RecordingClient()
+    asyncio.run(client.synthesize_segments(segments(20, 20, 20, 20), "voice", str(tmp_path)))
+    assert client.batches == [4]
+
+    client = RecordingClient()
+    asyncio.run(client.synthesize_segments(segments(20, 20, 20, 20), "voice", str(tmp_path), min_batches=2))
+    assert client.batches == [2, 2]
+
+
+def test_unalignable_batch_falls_back_to_single_segments(tmp_path):
+    client = RecordingClient(bad_size=3)
+    script = segments(20, 20, 20)
+    paths = asyncio.run(client.synthesize_segments(script, "voice", str(tmp_path)))
+    assert client.batches == []
+    assert len(client.singles) == 3
+    assert [segment.audio_path for segment in script] == paths
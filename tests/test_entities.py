@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from app.engine.entities import AhoCorasick, Listing, TickerIndex, TickerMatcher, load_listings
+from app.models.base import NewsItem
+
+LISTINGS = [
+    Listing(code="BHP", name="BHP Group", aliases=["B-H-P"], index_weight=9.2),
+    Listing(code="RIO", name="Rio Tinto", index_weight=2.1),
+    Listing(code="CBA", name="Commonwealth Bank of Australia", aliases=["Commonwealth Bank"], index_weight=10.4),
+    Listing(code="WOW", name="Woolworths Group", aliases=["Woolworths"], index_weight=1.7, code_match="prefixed"),
+    Listing(code="A2M", name="a2 Milk", code_match="none"),
+]
+
+
+def matches(automaton: AhoCorasick, text: str):
+    return sorted((start, end, automaton.patterns[pid]) for start, end, pid in automaton.find(text))
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert matches(automaton, "ushers") == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_aho_corasick_follows_failure_links():
+    automaton = AhoCorasick(["abcd", "bc", "c"])
+    assert matches(automaton, "xabcx") == [(2, 4, "bc"), (3, 4, "c")]
+
+
+def test_aho_corasick_is_case_sensitive_and_skips_empty_patterns():
+    automaton = AhoCorasick(["", "BHP"])
+    assert automaton.patterns == ["BHP"]
+    assert automaton.find("bhp") == []
+    assert automaton.find("") == []
+
+
+def test_extract_counts_codes_names_and_aliases():
+    matcher = TickerMatcher(LISTINGS)
+    text = "Rio Tinto and BHP rallied. BHP Group led; B-H-P is up 2%. CBA was flat."
+    assert matcher.extract(text) == ["BHP", "RIO", "CBA"]
+
+
+def test_extract_prefers_longest_overlapping_match():
+    matcher = TickerMatcher(LISTINGS)
+    # "Commonwealth Bank of Australia" counts once, not again as "Commonwealth Bank"
+    assert matcher.extract("Commonwealth Bank of Australia reported.") == ["CBA"]
+
+
+def test_extract_requires_whole_words():
+    matcher = TickerMatcher(LISTINGS)
+    assert matcher.extract("PRIOR guidance from BHPX and RIOs") == []
+    assert matcher.extract("(RIO) fell, RIO.") == ["RIO"]
+
+
+def test_prefixed_codes_need_the_asx_prefix():
+    matcher = TickerMatcher(LISTINGS)
+    assert matcher.extract("WOW, what a day") == []
+    assert matcher.extract("Shares in (ASX: WOW) and ASX:WOW rose") == ["WOW"]
+    assert matcher.extract("Woolworths rose") == ["WOW"]
+
+
+def test_none_codes_only_match_by_name():
+    matcher = TickerMatcher(LISTINGS)
+    assert matcher.extract("A2M slipped") == []
+    assert matcher.extract("a2 Milk slipped") == ["A2M"]
+
+
+def test_bundled_listings_mark_ambiguous_codes():
+    matcher = TickerMatcher(load_listings())
+    assert matcher.extract("ALL of the miners rose, led by BHP") == ["BHP"]
+    assert matcher.extract("Aristocrat Leisure (ASX: ALL) jumped") == ["ALL"]
+
+
+def make_item(title: str) -> NewsItem:
+    return NewsItem(source_id="test", title=title, url=f"https://example.com/{title}",
+                    published_at=datetime(2025, 3, 14), content_summary="")
+
+
+def test_index_ranks_by_weight_and_groups_by_ticker():
+    index = TickerIndex(TickerMatcher(LISTINGS))
+    items = [make_item(t) for t in ("Rio Tinto up", "Market wrap", "BHP down", "RIO again", "CBA flat")]
+    index.add(items)
+
+    assert [item.title for item in index.stories_for("RIO")] == ["Rio Tinto up", "RIO again"]
+    ranked = [item.title for item in index.rank(items)]
+    assert ranked == ["CBA flat", "BHP down", "Rio Tinto up", "RIO again", "Market wrap"]
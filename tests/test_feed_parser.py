@@ -0,0 +1,107 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from app.ingest import rss
+from app.ingest.feed_parser import FeedParseError, parse_feed, parse_feed_with_feedparser
+from app.ingest.rss import RSSSource
+
+FIXTURES = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures"
+
+RSS2 = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item>
+  <title>BHP &lt;b&gt;lifts&lt;/b&gt; dividend</title>
+  <link>https://example.com/bhp</link>
+  <guid isPermaLink="false">bhp-1</guid>
+  <pubDate>Fri, 14 Mar 2025 06:00:00 +1100</pubDate>
+  <description><![CDATA[<p>Record payout.</p><p>The post BHP appeared first on Example.</p>]]></description>
+</item>
+<item><title>No guid</title><link>https://example.com/nog</link></item>
+</channel></rss>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Markets</title>
+<entry>
+  <title>CBA results</title>
+  <id>tag:example.com,2025:cba</id>
+  <link rel="self" href="https://example.com/self"/>
+  <link href="https://example.com/cba"/>
+  <updated>2025-03-14T06:00:00Z</updated>
+  <summary>Cash profit up.</summary>
+</entry>
+</feed>"""
+
+
+def test_rss2_entries():
+    first, second = parse_feed(RSS2)
+    assert first.guid == "bhp-1"
+    assert first.title == "BHP lifts dividend"
+    assert first.link == "https://example.com/bhp"
+    assert first.published_at == datetime(2025, 3, 13, 19, 0)
+    assert "appeared first" not in first.summary
+    # Without a guid the link stands in, and without a summary the title does
+    assert second.guid == "https://example.com/nog"
+    assert second.summary == "No guid"
+    assert second.published_at is None
+
+
+def test_atom_entries_prefer_alternate_link():
+    (entry,) = parse_feed(ATOM)
+    assert entry.guid == "tag:example.com,2025:cba"
+    assert entry.link == "https://example.com/cba"
+    assert entry.published_at == datetime(2025, 3, 14, 6, 0)
+    assert entry.summary == "Cash profit up."
+
+
+def test_fixtures_match_feedparser():
+    for name in ("wordpress_rss2.xml", "markets_atom.xml"):
+        data = (FIXTURES / name).read_bytes()
+        fast = parse_feed(data)
+        slow = parse_feed_with_feedparser(data)
+        assert fast
+        assert [(e.guid, e.link, e.published_at) for e in fast] == [(e.guid, e.link, e.published_at) for e in slow]
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"<html><body>Not a feed</body></html>",
+    b"<rss><channel><item><title>Unclosed</channel></rss>",
+])
+def test_non_feeds_are_rejected(data):
+    with pytest.raises(FeedParseError):
+        parse_feed(data)
+
+
+def test_malformed_feed_needs_feedparser():
+    data = (FIXTURES / "malformed_rss2.xml").read_bytes()
+    with pytest.raises(FeedParseError):
+        parse_feed(data)
+    assert len(parse_feed_with_feedparser(data)) == 40
+
+
+def test_source_falls_back_to_feedparser_when_fast_path_rejects(monkeypatch):
+    source = RSSSource([], backend="fast")
+    malformed = (FIXTURES / "malformed_rss2.xml").read_bytes()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        monkeypatch.setattr(rss, "get_parser_pool", lambda: pool)
+        assert len(asyncio.run(source._parse("ok", RSS2))) == 2
+        assert len(asyncio.run(source._parse("broken", malformed))) == 40
+
+
+def test_source_parses_in_process_when_pool_breaks(monkeypatch):
+    class BrokenPool:
+        def submit(self, *args, **kwargs):
+            raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(rss, "get_parser_pool", lambda: BrokenPool())
+    fallbacks = []
+    monkeypatch.setattr(rss, "parse_feed_with_feedparser", lambda data: fallbacks.append(data) or [])
+
+    entries = asyncio.run(RSSSource([], backend="fast")._parse("ok", ATOM))
+    assert [entry.link for entry in entries] == ["https://example.com/cba"]
+    assert fallbacks == []
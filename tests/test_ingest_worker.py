@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.ingest.base import BaseSource
+from app.ingest.inbox import StoryInbox
+from app.ingest.worker import IngestWorker
+from app.models.base import NewsItem
+
+
+def make_item(n: int) -> NewsItem:
+    return NewsItem(
+        source_id="rss_test",
+        title=f"Story {n}",
+        url=f"https://example.com/{n}",
+        published_at=datetime.now() - timedelta(minutes=n),
+        content_summary=f"Body of story {n}",
+    )
+
+
+class FakeSource(BaseSource):
+    def __init__(self, items):
+        self.items = items
+        self.commits = 0
+
+    async def fetch(self):
+        return list(self.items)
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeMemory:
+    """
+    Admits each URL once, like StoryMemory without the embeddings.
+    """
+    def __init__(self):
+        self.seen = set()
+
+    async def admit(self, items):
+        unique = [item for item in items if item.url not in self.seen]
+        self.seen.update(item.url for item in unique)
+        return unique
+
+    def delete_many(self, items):
+        self.seen.difference_update(item.url for item in items)
+
+
+class FailingInbox:
+    def add(self, items):
+        raise OSError("disk full")
+
+
+def test_poll_stores_unique_stories_and_commits(tmp_path):
+    source = FakeSource([make_item(1), make_item(2)])
+    inbox = StoryInbox(str(tmp_path / "inbox.db"))
+    worker = IngestWorker([(source, 60.0)], FakeMemory(), inbox)
+    try:
+        assert asyncio.run(worker.poll(source)) == 2
+        assert source.commits == 1
+        # Seen stories are dropped by dedup on the next poll
+        assert asyncio.run(worker.poll(source)) == 0
+        assert len(inbox.select_window(datetime.now() - timedelta(hours=1))) == 2
+    finally:
+        inbox.close()
+
+
+def test_poll_rolls_back_memory_when_inbox_write_fails(tmp_path):
+    source = FakeSource([make_item(1), make_item(2)])
+    memory = FakeMemory()
+    worker = IngestWorker([(source, 60.0)], memory, FailingInbox())
+
+    assert asyncio.run(worker.poll(source)) == 0
+    assert memory.seen == set()
+    assert source.commits == 0
+
+    # Once the inbox works again the same stories go through
+    inbox = StoryInbox(str(tmp_path / "inbox.db"))
+    worker.inbox = inbox
+    try:
+        assert asyncio.run(worker.poll(source)) == 2
+        assert source.commits == 1
+    finally:
+        inbox.close()
+
+
+def test_poll_survives_fetch_failure():
+    class BrokenSource(FakeSource):
+        async def fetch(self):
+            raise ConnectionError("feed down")
+
+    source = BrokenSource([])
+    worker = IngestWorker([(source, 60.0)], FakeMemory(), FailingInbox())
+    assert asyncio.run(worker.poll(source)) == 0
+    assert source.commits == 0
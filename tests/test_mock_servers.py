@@ -0,0 +1,60 @@
+import base64
+import json
+import struct
+
+from app.audio.silence import FRAME_SECONDS, SILENT_FRAME, silent_mp3
+from app.loadtest.mock_servers import (
+    ElevenLabsMockServer,
+    MockRequest,
+    OpenAIMockServer,
+    fake_embedding,
+)
+
+
+def test_silent_mp3_is_whole_frames_of_the_requested_length():
+    audio = silent_mp3(2.0)
+    assert len(audio) % len(SILENT_FRAME) == 0
+    assert abs(len(audio) // len(SILENT_FRAME) * FRAME_SECONDS - 2.0) <= FRAME_SECONDS
+    assert silent_mp3(0) == SILENT_FRAME
+
+
+def test_fake_embedding_is_deterministic_unit_vector():
+    vector = fake_embedding("BHP lifts dividend", 64)
+    assert vector == fake_embedding("BHP lifts dividend", 64)
+    assert vector != fake_embedding("CBA lifts dividend", 64)
+    assert len(vector) == 64
+    assert abs(sum(v * v for v in vector) - 1.0) < 1e-9
+
+
+def _post(path: str, payload: dict) -> MockRequest:
+    return MockRequest("POST", path, {}, json.dumps(payload).encode("utf-8"))
+
+
+def test_openai_embeddings_float_and_base64():
+    server = OpenAIMockServer()
+    response = server.handle(_post("/v1/embeddings", {"input": ["a", "b"], "dimensions": 8}))
+    data = json.loads(response.body)["data"]
+    assert response.status == 200
+    assert [item["index"] for item in data] == [0, 1]
+    assert data[0]["embedding"] == fake_embedding("a", 8)
+
+    response = server.handle(_post("/v1/embeddings", {
+        "input": "a", "dimensions": 8, "encoding_format": "base64",
+    }))
+    packed = base64.b64decode(json.loads(response.body)["data"][0]["embedding"])
+    decoded = struct.unpack("<8f", packed)
+    assert all(abs(x - y) < 1e-6 for x, y in zip(decoded, fake_embedding("a", 8)))
+
+
+def test_openai_unknown_route_is_404():
+    assert OpenAIMockServer().handle(_post("/v1/files", {})).status == 404
+
+
+def test_elevenlabs_timestamps_cover_every_character():
+    server = ElevenLabsMockServer()
+    response = server.handle(_post("/v1/text-to-speech/voice/with-timestamps", {"text": "Hello ASX"}))
+    payload = json.loads(response.body)
+    alignment = payload["alignment"]
+    assert alignment["characters"] == list("Hello ASX")
+    assert alignment["character_end_times_seconds"][-1] > alignment["character_start_times_seconds"][-1]
+    assert base64.b64decode(payload["audio_base64"]).startswith(SILENT_FRAME[:4])
@@ -0,0 +1,189 @@
+import asyncio
+
+import pytest
+
+from app.core import ratelimit
+from app.core.ratelimit import (
+    ProviderLimiter,
+    ProviderPolicy,
+    RetryableError,
+    classify_error,
+    parse_duration,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    return clock
+
+
+def make_limiter(**overrides) -> ProviderLimiter:
+    policy = dict(rate=10, burst=2, max_concurrency=2, min_rate=1.0, max_retries=2, base_backoff=0.0)
+    policy.update(overrides)
+    return ProviderLimiter("test", ProviderPolicy(**policy))
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class ClientError(Exception):
+    def __init__(self, code, status):
+        super().__init__(code)
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+class DeepgramApiError(Exception):
+    def __init__(self, status):
+        super().__init__("deepgram")
+        self.status = status
+
+
+class TransportError(Exception):
+    pass
+
+
+class ConnectError(TransportError):
+    pass
+
+
+def test_parse_duration():
+    assert parse_duration("1s") == 1.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+    assert parse_duration("2.5") == 2.5
+    assert parse_duration("soon") is None
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after({"retry-after-ms": "250", "retry-after": "9"}) == 0.25
+    assert parse_retry_after({"retry-after": "3"}) == 3.0
+    assert parse_retry_after({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert parse_retry_after({"retry-after": "later"}) is None
+
+
+def test_classify_http_statuses():
+    assert classify_error(StatusError(429, {"retry-after": "2"})) == (True, 2.0, True)
+    assert classify_error(StatusError(503)) == (True, None, True)
+    assert classify_error(StatusError(500)) == (True, None, False)
+    assert classify_error(StatusError(400)) == (False, None, False)
+    assert classify_error(DeepgramApiError("429")) == (True, None, True)
+
+
+def test_classify_botocore_codes():
+    assert classify_error(ClientError("SlowDown", 503)) == (True, None, True)
+    assert classify_error(ClientError("InternalError", 500)) == (True, None, False)
+    assert classify_error(ClientError("NoSuchKey", 404)) == (False, None, False)
+
+
+def test_classify_connection_errors_by_type_and_name():
+    assert classify_error(ConnectionResetError()) == (True, None, False)
+    assert classify_error(asyncio.TimeoutError()) == (True, None, False)
+    assert classify_error(ConnectError("refused")) == (True, None, False)
+    assert classify_error(ValueError("bad input")) == (False, None, False)
+
+
+def test_classify_follows_chained_cause():
+    try:
+        try:
+            raise StatusError(429)
+        except StatusError as e:
+            raise RuntimeError("upload failed") from e
+    except RuntimeError as wrapper:
+        assert classify_error(wrapper) == (True, None, True)
+
+
+def test_classify_retryable_error_keeps_its_fields():
+    assert classify_error(RetryableError("busy", 429, retry_after=1.5, throttled=True)) == (True, 1.5, True)
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    limiter = make_limiter()
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == pytest.approx(0.1)
+    assert limiter._reserve() == pytest.approx(0.2)
+
+    # Refill is capped at the burst size
+    clock.now += 60
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == 0.0
+    assert limiter._reserve() == pytest.approx(0.1)
+
+
+def test_throttling_halves_rate_and_blocks(clock):
+    limiter = make_limiter()
+    limiter.on_throttled(retry_after=5.0)
+    assert limiter.rate == 5.0
+    assert limiter._reserve() == pytest.approx(5.0)
+
+    for _ in range(10):
+        limiter.on_throttled(None)
+    assert limiter.rate == 1.0
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(1.5)
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10.0
+
+
+def test_observe_follows_rate_limit_headers(clock):
+    limiter = make_limiter()
+    limiter.observe({"x-ratelimit-remaining-requests": "4", "x-ratelimit-reset-requests": "2s"})
+    assert limiter.rate == 2.0
+
+    limiter.observe({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "3s"})
+    assert limiter._reserve() == pytest.approx(3.0)
+
+    limiter.observe({"x-ratelimit-remaining-requests": "4"})
+    assert limiter.rate == 2.0
+
+
+def test_call_sync_retries_transient_errors_only():
+    limiter = make_limiter(rate=1000, burst=1000)
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise StatusError(500)
+        return "ok"
+
+    assert limiter.call_sync(flaky) == "ok"
+    assert len(attempts) == 3
+
+    def broken():
+        raise StatusError(400)
+
+    with pytest.raises(StatusError):
+        limiter.call_sync(broken)
+
+
+def test_call_gives_up_after_max_retries():
+    limiter = make_limiter(rate=1000, burst=1000)
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        raise StatusError(502)
+
+    with pytest.raises(StatusError):
+        asyncio.run(limiter.call(failing))
+    assert len(attempts) == 3
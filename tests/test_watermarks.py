@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from app.ingest.watermarks import MAX_SEEN_GUIDS, Watermark, WatermarkStore, recency_cutoff, utcnow
+
+T0 = datetime(2025, 3, 14, 6, 0)
+
+
+def test_empty_watermark_admits_everything():
+    mark = Watermark()
+    assert mark.admits("a", T0)
+    assert mark.admits("a", None)
+
+
+def test_admits_newer_or_equal_unseen_entries():
+    mark = Watermark().advance([("a", T0)])
+    assert not mark.admits("a", T0)
+    assert mark.admits("b", T0)
+    assert mark.admits("c", T0 + timedelta(minutes=1))
+    assert not mark.admits("d", T0 - timedelta(minutes=1))
+    # Undated entries are only filtered by GUID
+    assert mark.admits("e", None)
+
+
+def test_advance_keeps_newest_entry():
+    mark = Watermark().advance([
+        ("old", T0 - timedelta(hours=1)),
+        ("new", T0),
+        ("undated", None),
+    ])
+    assert mark.last_guid == "new"
+    assert mark.last_published_at == T0
+    assert set(mark.seen_guids) == {"old", "new", "undated"}
+
+    # An older batch doesn't move the mark back
+    later = mark.advance([("older", T0 - timedelta(hours=2))])
+    assert later.last_published_at == T0
+    assert later.seen_guids[0] == "older"
+
+
+def test_advance_without_dates_tracks_last_guid():
+    mark = Watermark().advance([("a", None), ("b", None)])
+    assert mark.last_guid == "b"
+    assert mark.last_published_at is None
+
+
+def test_advance_with_nothing_is_unchanged():
+    mark = Watermark().advance([("a", T0)])
+    assert mark.advance([]) is mark
+
+
+def test_seen_guids_are_capped_newest_first():
+    mark = Watermark().advance((f"g{i}", T0) for i in range(MAX_SEEN_GUIDS))
+    mark = mark.advance([("fresh", T0), ("g0", T0)])
+    assert len(mark.seen_guids) == MAX_SEEN_GUIDS
+    assert mark.seen_guids[0] == "fresh"
+    assert mark.seen_guids.count("g0") == 1
+    assert f"g{MAX_SEEN_GUIDS - 1}" not in mark.seen_guids
+
+
+def test_recency_cutoff():
+    assert recency_cutoff(0) is None
+    cutoff = recency_cutoff(24)
+    assert abs((utcnow() - cutoff) - timedelta(hours=24)) < timedelta(seconds=5)
+
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / "inbox.db")
+    store = WatermarkStore(path)
+    assert store.get("rss:a") == Watermark()
+
+    mark = Watermark().advance([("a", T0), ("b", None)])
+    store.set_many({"rss:a": mark})
+    store.close()
+
+    reopened = WatermarkStore(path)
+    try:
+        assert reopened.get("rss:a") == mark
+        assert reopened.get("rss:b") == Watermark()
+    finally:
+        reopened.close()